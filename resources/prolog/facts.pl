@@ -1,1682 +1,491 @@
-prop(node922748928, lat, 16.600514).
-prop(node922748928, lon, 41.2057967).
-prop(node922748928, type, node).
-prop(node922748934, lat, 16.5995411).
-prop(node922748934, lon, 41.2063517).
-prop(node922748934, type, node).
-prop(node4124388891, lat, 16.5968235).
-prop(node4124388891, lon, 41.2041048).
-prop(node4124388891, type, node).
-prop(node4124401693, lat, 16.5994768).
-prop(node4124401693, lon, 41.2062616).
-prop(node4124401693, type, node).
-prop(node922748969, lat, 16.6005756).
-prop(node922748969, lon, 41.2056312).
-prop(node922748969, type, node).
-prop(node2481492030, lat, 16.5945097).
-prop(node2481492030, lon, 41.2023707).
-prop(node2481492030, type, node).
-prop(node304994369, lat, 16.5954616).
-prop(node304994369, lon, 41.205225).
-prop(node304994369, type, node).
-prop(node304994370, lat, 16.5972465).
-prop(node304994370, lon, 41.2051997).
-prop(node304994370, type, node).
-prop(node4124401734, lat, 16.5985766).
-prop(node4124401734, lon, 41.206303).
-prop(node4124401734, type, node).
-prop(node1363493448, lat, 16.6005237).
-prop(node1363493448, lon, 41.2051088).
-prop(node1363493448, type, node).
-prop(node4124401737, lat, 16.5986013).
-prop(node4124401737, lon, 41.2063037).
-prop(node4124401737, type, node).
-prop(node4124401739, lat, 16.5995085).
-prop(node4124401739, lon, 41.206306).
-prop(node4124401739, type, node).
-prop(node2493668430, lat, 16.59601).
-prop(node2493668430, lon, 41.2042961).
-prop(node2493668430, type, node).
-prop(node2493668432, lat, 16.5953616).
-prop(node2493668432, lon, 41.2034771).
-prop(node2493668432, type, node).
-prop(node2271230545, lat, 16.597453).
-prop(node2271230545, lon, 41.2023131).
-prop(node2271230545, type, node).
-prop(node2144056401, lat, 16.5979763).
-prop(node2144056401, lon, 41.205981).
-prop(node2144056401, type, node).
-prop(node2493668433, lat, 16.5946498).
-prop(node2493668433, lon, 41.2039062).
-prop(node2493668433, type, node).
-prop(node2493668435, lat, 16.5954157).
-prop(node2493668435, lon, 41.2038212).
-prop(node2493668435, type, node).
-prop(node2493668437, lat, 16.5969379).
-prop(node2493668437, lon, 41.2034542).
-prop(node2493668437, type, node).
-prop(node3873858645, lat, 16.5945202).
-prop(node3873858645, lon, 41.2027538).
-prop(node3873858645, type, node).
-prop(node3873858647, lat, 16.5945899).
-prop(node3873858647, lon, 41.2028876).
-prop(node3873858647, type, node).
-prop(node11324082776, lat, 16.5995019).
-prop(node11324082776, lon, 41.2046134).
-prop(node11324082776, type, node).
-prop(node3873858643, lat, 16.5946228).
-prop(node3873858643, lon, 41.2025451).
-prop(node3873858643, type, node).
-prop(node2271230554, lat, 16.5973791).
-prop(node2271230554, lon, 41.2029098).
-prop(node2271230554, type, node).
-prop(node3873858650, lat, 16.594672).
-prop(node3873858650, lon, 41.2030451).
-prop(node3873858650, type, node).
-prop(node3873858649, lat, 16.5948687).
-prop(node3873858649, lon, 41.202987).
-prop(node3873858649, type, node).
-prop(node3873858648, lat, 16.5950841).
-prop(node3873858648, lon, 41.2029407).
-prop(node3873858648, type, node).
-prop(node3873858653, lat, 16.5951983).
-prop(node3873858653, lon, 41.2031615).
-prop(node3873858653, type, node).
-prop(node3873858655, lat, 16.5947652).
-prop(node3873858655, lon, 41.2032297).
-prop(node3873858655, type, node).
-prop(node3873858656, lat, 16.5945691).
-prop(node3873858656, lon, 41.2032523).
-prop(node3873858656, type, node).
-prop(node3873858654, lat, 16.5949928).
-prop(node3873858654, lon, 41.2031902).
-prop(node3873858654, type, node).
-prop(node1338434660, lat, 16.597616).
-prop(node1338434660, lon, 41.202824).
-prop(node1338434660, type, node).
-prop(node1346836068, lat, 16.594555).
-prop(node1346836068, lon, 41.2046419).
-prop(node1346836068, type, node).
-prop(node1346836073, lat, 16.5947179).
-prop(node1346836073, lon, 41.2035351).
-prop(node1346836073, type, node).
-prop(node2496532075, lat, 16.6003952).
-prop(node2496532075, lon, 41.2047117).
-prop(node2496532075, type, node).
-prop(node2493671548, lat, 16.5980818).
-prop(node2493671548, lon, 41.2031972).
-prop(node2493671548, type, node).
-prop(node2493671549, lat, 16.5977544).
-prop(node2493671549, lon, 41.2034388).
-prop(node2493671549, type, node).
-prop(node2493671550, lat, 16.5981359).
-prop(node2493671550, lon, 41.2033436).
-prop(node2493671550, type, node).
-prop(node2493671552, lat, 16.5942113).
-prop(node2493671552, lon, 41.2031505).
-prop(node2493671552, type, node).
-prop(node2144056449, lat, 16.5979767).
-prop(node2144056449, lon, 41.2055654).
-prop(node2144056449, type, node).
-prop(node2493671554, lat, 16.5959317).
-prop(node2493671554, lon, 41.2027273).
-prop(node2493671554, type, node).
-prop(node2493671555, lat, 16.5952055).
-prop(node2493671555, lon, 41.2027442).
-prop(node2493671555, type, node).
-prop(node2493671556, lat, 16.5958597).
-prop(node2493671556, lon, 41.2025846).
-prop(node2493671556, type, node).
-prop(node2493671558, lat, 16.5948033).
-prop(node2493671558, lon, 41.2024535).
-prop(node2493671558, type, node).
-prop(node2493671559, lat, 16.5951536).
-prop(node2493671559, lon, 41.2034991).
-prop(node2493671559, type, node).
-prop(node2493671560, lat, 16.5943462).
-prop(node2493671560, lon, 41.2028253).
-prop(node2493671560, type, node).
-prop(node2493671561, lat, 16.594889).
-prop(node2493671561, lon, 41.2026074).
-prop(node2493671561, type, node).
-prop(node304993930, lat, 16.600977).
-prop(node304993930, lon, 41.2040079).
-prop(node304993930, type, node).
-prop(node2493671565, lat, 16.5943998).
-prop(node2493671565, lon, 41.2029382).
-prop(node2493671565, type, node).
-prop(node2493671566, lat, 16.5949862).
-prop(node2493671566, lon, 41.2027817).
-prop(node2493671566, type, node).
-prop(node2493671568, lat, 16.594197).
-prop(node2493671568, lon, 41.2032872).
-prop(node2493671568, type, node).
-prop(node1363512977, lat, 16.5979403).
-prop(node1363512977, lon, 41.2032397).
-prop(node1363512977, type, node).
-prop(node1363512465, lat, 16.5975731).
-prop(node1363512465, lon, 41.2031839).
-prop(node1363512465, type, node).
-prop(node304993939, lat, 16.6027248).
-prop(node304993939, lon, 41.2035537).
-prop(node304993939, type, node).
-prop(node1363512467, lat, 16.5971827).
-prop(node1363512467, lon, 41.2033488).
-prop(node1363512467, type, node).
-prop(node1449923733, lat, 16.5971579).
-prop(node1449923733, lon, 41.2019482).
-prop(node1449923733, type, node).
-prop(node304993942, lat, 16.6031549).
-prop(node304993942, lon, 41.2032822).
-prop(node304993942, type, node).
-prop(node2493671572, lat, 16.594436).
-prop(node2493671572, lon, 41.2032664).
-prop(node2493671572, type, node).
-prop(node2493671573, lat, 16.5944976).
-prop(node2493671573, lon, 41.2035589).
-prop(node2493671573, type, node).
-prop(node4124392601, lat, 16.600635).
-prop(node4124392601, lon, 41.2044658).
-prop(node4124392601, type, node).
-prop(node9658018967, lat, 16.6004289).
-prop(node9658018967, lon, 41.2042295).
-prop(node9658018967, type, node).
-prop(node9658018965, lat, 16.5998711).
-prop(node9658018965, lon, 41.2042503).
-prop(node9658018965, type, node).
-prop(node1363512478, lat, 16.5969996).
-prop(node1363512478, lon, 41.2026986).
-prop(node1363512478, type, node).
-prop(node314203299, lat, 16.5986424).
-prop(node314203299, lon, 41.2023656).
-prop(node314203299, type, node).
-prop(node1363512484, lat, 16.5982385).
-prop(node1363512484, lon, 41.2036007).
-prop(node1363512484, type, node).
-prop(node314203301, lat, 16.5987932).
-prop(node314203301, lon, 41.2029852).
-prop(node314203301, type, node).
-prop(node314203305, lat, 16.5981626).
-prop(node314203305, lon, 41.2026801).
-prop(node314203305, type, node).
-prop(node1363512492, lat, 16.5968341).
-prop(node1363512492, lon, 41.2027671).
-prop(node1363512492, type, node).
-prop(node314203309, lat, 16.5987711).
-prop(node314203309, lon, 41.2027081).
-prop(node314203309, type, node).
-prop(node1363512495, lat, 16.59701).
-prop(node1363512495, lon, 41.2030501).
-prop(node1363512495, type, node).
-prop(node1878960306, lat, 16.6005073).
-prop(node1878960306, lon, 41.2051902).
-prop(node1878960306, type, node).
-prop(node1363513016, lat, 16.595881).
-prop(node1363513016, lon, 41.2039971).
-prop(node1363513016, type, node).
-prop(node1363513018, lat, 16.5962357).
-prop(node1363513018, lon, 41.2049484).
-prop(node1363513018, type, node).
-prop(node1363512508, lat, 16.5955419).
-prop(node1363512508, lon, 41.2021165).
-prop(node1363512508, type, node).
-prop(node1878960318, lat, 16.5989255).
-prop(node1878960318, lon, 41.2057448).
-prop(node1878960318, type, node).
-prop(node314203326, lat, 16.5985591).
-prop(node314203326, lon, 41.2047653).
-prop(node314203326, type, node).
-prop(node1363512511, lat, 16.5971867).
-prop(node1363512511, lon, 41.2026212).
-prop(node1363512511, type, node).
-prop(node1878960322, lat, 16.5981213).
-prop(node1878960322, lon, 41.2059603).
-prop(node1878960322, type, node).
-prop(node1878960325, lat, 16.5979169).
-prop(node1878960325, lon, 41.2059907).
-prop(node1878960325, type, node).
-prop(node3873858644, lat, 16.5946984).
-prop(node3873858644, lon, 41.2026832).
-prop(node3873858644, type, node).
-prop(node1451662540, lat, 16.6004863).
-prop(node1451662540, lon, 41.2050645).
-prop(node1451662540, type, node).
-prop(node1878960334, lat, 16.5981605).
-prop(node1878960334, lon, 41.2061216).
-prop(node1878960334, type, node).
-prop(node1363512527, lat, 16.5958121).
-prop(node1363512527, lon, 41.2010678).
-prop(node1363512527, type, node).
-prop(node1363512529, lat, 16.5944415).
-prop(node1363512529, lon, 41.2026339).
-prop(node1363512529, type, node).
-prop(node1878960338, lat, 16.5982199).
-prop(node1878960338, lon, 41.2063353).
-prop(node1878960338, type, node).
-prop(node3873858646, lat, 16.5947799).
-prop(node3873858646, lon, 41.2028373).
-prop(node3873858646, type, node).
-prop(node1878960342, lat, 16.5982342).
-prop(node1878960342, lon, 41.2063835).
-prop(node1878960342, type, node).
-prop(node1363512540, lat, 16.5972073).
-prop(node1363512540, lon, 41.2029823).
-prop(node1363512540, type, node).
-prop(node1363512542, lat, 16.5959603).
-prop(node1363512542, lon, 41.2009314).
-prop(node1363512542, type, node).
-prop(node353122529, lat, 16.6048893).
-prop(node353122529, lon, 41.2015829).
-prop(node353122529, type, node).
-prop(node314203365, lat, 16.5930148).
-prop(node314203365, lon, 41.2045841).
-prop(node314203365, type, node).
-prop(node1338434277, lat, 16.596823).
-prop(node1338434277, lon, 41.203126).
-prop(node1338434277, type, node).
-prop(node1449923824, lat, 16.5962098).
-prop(node1449923824, lon, 41.2017848).
-prop(node1449923824, type, node).
-prop(node2484053754, lat, 16.5988749).
-prop(node2484053754, lon, 41.2061055).
-prop(node2484053754, type, node).
-prop(node2484053760, lat, 16.5987112).
-prop(node2484053760, lon, 41.2058231).
-prop(node2484053760, type, node).
-prop(node2484055808, lat, 16.5986432).
-prop(node2484055808, lon, 41.2054627).
-prop(node2484055808, type, node).
-prop(node1346867462, lat, 16.5973942).
-prop(node1346867462, lon, 41.202533).
-prop(node1346867462, type, node).
-prop(node2484055814, lat, 16.5994014).
-prop(node2484055814, lon, 41.2049823).
-prop(node2484055814, type, node).
-prop(node565476617, lat, 16.5915103).
-prop(node565476617, lon, 41.2117916).
-prop(node565476617, type, node).
-prop(node1346867465, lat, 16.5966573).
-prop(node1346867465, lon, 41.2028384).
-prop(node1346867465, type, node).
-prop(node2144056587, lat, 16.59849).
-prop(node2144056587, lon, 41.2052965).
-prop(node2144056587, type, node).
-prop(node1346867468, lat, 16.5960962).
-prop(node1346867468, lon, 41.2030507).
-prop(node1346867468, type, node).
-prop(node1346867471, lat, 16.5954189).
-prop(node1346867471, lon, 41.2031349).
-prop(node1346867471, type, node).
-prop(node1155831069, lat, 16.5925241).
-prop(node1155831069, lon, 41.2027625).
-prop(node1155831069, type, node).
-prop(node314203427, lat, 16.5941728).
-prop(node314203427, lon, 41.2035794).
-prop(node314203427, type, node).
-prop(node10869257008, lat, 16.5970146).
-prop(node10869257008, lon, 41.2023835).
-prop(node10869257008, type, node).
-prop(node2144056625, lat, 16.5979376).
-prop(node2144056625, lon, 41.2058332).
-prop(node2144056625, type, node).
-prop(node10869257009, lat, 16.5968262).
-prop(node10869257009, lon, 41.2024523).
-prop(node10869257009, type, node).
-prop(node10869257011, lat, 16.5964941).
-prop(node10869257011, lon, 41.2025513).
-prop(node10869257011, type, node).
-prop(node10869257012, lat, 16.5959248).
-prop(node10869257012, lon, 41.2027118).
-prop(node10869257012, type, node).
-prop(node10869257010, lat, 16.5966667).
-prop(node10869257010, lon, 41.2024992).
-prop(node10869257010, type, node).
-prop(node1338435895, lat, 16.5983337).
-prop(node1338435895, lon, 41.2048191).
-prop(node1338435895, type, node).
-prop(node4124369726, lat, 16.5943811).
-prop(node4124369726, lon, 41.2025424).
-prop(node4124369726, type, node).
-prop(node1422047049, lat, 16.5959967).
-prop(node1422047049, lon, 41.2028694).
-prop(node1422047049, type, node).
-prop(node1422047051, lat, 16.5953563).
-prop(node1422047051, lon, 41.2030329).
-prop(node1422047051, type, node).
-prop(node1363512978, lat, 16.5978201).
-prop(node1363512978, lon, 41.2030802).
-prop(node1363512978, type, node).
-prop(node308414801, lat, 16.5956927).
-prop(node308414801, lon, 41.2011768).
-prop(node308414801, type, node).
-prop(node308414804, lat, 16.5952212).
-prop(node308414804, lon, 41.2015173).
-prop(node308414804, type, node).
-prop(node2484030804, lat, 16.5979294).
-prop(node2484030804, lon, 41.2055922).
-prop(node2484030804, type, node).
-prop(node1422047060, lat, 16.5944572).
-prop(node1422047060, lon, 41.2030989).
-prop(node1422047060, type, node).
-prop(node11472722265, lat, 16.5994842).
-prop(node11472722265, lon, 41.2044915).
-prop(node11472722265, type, node).
-prop(node11472722267, lat, 16.5994449).
-prop(node11472722267, lon, 41.2042205).
-prop(node11472722267, type, node).
-prop(node1422047069, lat, 16.5978221).
-prop(node1422047069, lon, 41.2027491).
-prop(node1422047069, type, node).
-prop(node1346825054, lat, 16.5949281).
-prop(node1346825054, lon, 41.2035199).
-prop(node1346825054, type, node).
-prop(node1363534176, lat, 16.597666).
-prop(node1363534176, lon, 41.2033133).
-prop(node1363534176, type, node).
-prop(node1363534177, lat, 16.5978955).
-prop(node1363534177, lon, 41.2036518).
-prop(node1363534177, type, node).
-prop(node2484097889, lat, 16.5949841).
-prop(node2484097889, lon, 41.2038692).
-prop(node2484097889, type, node).
-prop(node2484097896, lat, 16.5921526).
-prop(node2484097896, lon, 41.2041783).
-prop(node2484097896, type, node).
-prop(node1422047082, lat, 16.596898).
-prop(node1422047082, lon, 41.2025489).
-prop(node1422047082, type, node).
-prop(node1422047083, lat, 16.5967438).
-prop(node1422047083, lon, 41.2026222).
-prop(node1422047083, type, node).
-prop(node1422047084, lat, 16.5970758).
-prop(node1422047084, lon, 41.202469).
-prop(node1422047084, type, node).
-prop(node1422047085, lat, 16.59657).
-prop(node1422047085, lon, 41.2026822).
-prop(node1422047085, type, node).
-prop(node1422047086, lat, 16.5972805).
-prop(node1422047086, lon, 41.2023857).
-prop(node1422047086, type, node).
-prop(node11040297840, lat, 16.5955275).
-prop(node11040297840, lon, 41.2033402).
-prop(node11040297840, type, node).
-prop(node11040297842, lat, 16.5961706).
-prop(node11040297842, lon, 41.2031913).
-prop(node11040297842, type, node).
-prop(node4124374398, lat, 16.5960735).
-prop(node4124374398, lon, 41.2030136).
-prop(node4124374398, type, node).
-prop(node305594255, lat, 16.5972516).
-prop(node305594255, lon, 41.2064003).
-prop(node305594255, type, node).
-prop(node304993174, lat, 16.6003972).
-prop(node304993174, lon, 41.2043548).
-prop(node304993174, type, node).
-prop(node1346840985, lat, 16.5942972).
-prop(node1346840985, lon, 41.2027182).
-prop(node1346840985, type, node).
-prop(node304993179, lat, 16.5973645).
-prop(node304993179, lon, 41.2050165).
-prop(node304993179, type, node).
-prop(node304993181, lat, 16.5955815).
-prop(node304993181, lon, 41.2048285).
-prop(node304993181, type, node).
-prop(node304993183, lat, 16.600511).
-prop(node304993183, lon, 41.2039463).
-prop(node304993183, type, node).
-prop(node304993184, lat, 16.6004249).
-prop(node304993184, lon, 41.2028351).
-prop(node304993184, type, node).
-prop(node304993188, lat, 16.6022869).
-prop(node304993188, lon, 41.2027497).
-prop(node304993188, type, node).
-prop(node304993190, lat, 16.6026107).
-prop(node304993190, lon, 41.2032039).
-prop(node304993190, type, node).
-prop(node2484044204, lat, 16.6002021).
-prop(node2484044204, lon, 41.2051872).
-prop(node2484044204, type, node).
-prop(node2484044206, lat, 16.6003768).
-prop(node2484044206, lon, 41.2057468).
-prop(node2484044206, type, node).
-prop(node2484044217, lat, 16.5994378).
-prop(node2484044217, lon, 41.2062225).
-prop(node2484044217, type, node).
-prop(node2484052922, lat, 16.5986313).
-prop(node2484052922, lon, 41.2054572).
-prop(node2484052922, type, node).
-prop(node1311858619, lat, 16.5960638).
-prop(node1311858619, lon, 41.2008434).
-prop(node1311858619, type, node).
-prop(node922748859, lat, 16.5992595).
-prop(node922748859, lon, 41.2060622).
-prop(node922748859, type, node).
-prop(node305594300, lat, 16.5987789).
-prop(node305594300, lon, 41.2056064).
-prop(node305594300, type, node).
-prop(node4801984446, lat, 16.5977493).
-prop(node4801984446, lon, 41.2061361).
-prop(node4801984446, type, node).
-prop(node4801984447, lat, 16.5978639).
-prop(node4801984447, lon, 41.206136).
-prop(node4801984447, type, node).
-prop(node315819969, lat, 16.596246).
-prop(node315819969, lon, 41.2033337).
-prop(node315819969, type, node).
-prop(node2484052930, lat, 16.597892).
-prop(node2484052930, lon, 41.2056746).
-prop(node2484052930, type, node).
-prop(node315819971, lat, 16.5951381).
-prop(node315819971, lon, 41.2046795).
-prop(node315819971, type, node).
-prop(node4801984449, lat, 16.597895).
-prop(node4801984449, lon, 41.2061866).
-prop(node4801984449, type, node).
-prop(node315819975, lat, 16.5933902).
-prop(node315819975, lon, 41.2045744).
-prop(node315819975, type, node).
-prop(node315819980, lat, 16.5951901).
-prop(node315819980, lon, 41.2016037).
-prop(node315819980, type, node).
-prop(node305594342, lat, 16.6000023).
-prop(node305594342, lon, 41.2050139).
-prop(node305594342, type, node).
-prop(node922748903, lat, 16.5994683).
-prop(node922748903, lon, 41.2062496).
-prop(node922748903, type, node).
-prop(node305594350, lat, 16.5981491).
-prop(node305594350, lon, 41.2048511).
-prop(node305594350, type, node).
-prop(way27776733_0, from_node, node304993174).
-prop(way27776733_0, to_node, node9658018967).
-prop(way27776733_0, type, way).
-prop(way27776733_1, from_node, node9658018967).
-prop(way27776733_1, to_node, node304993183).
-prop(way27776733_1, type, way).
-prop(way27776733_2, from_node, node304993183).
-prop(way27776733_2, to_node, node304993184).
-prop(way27776733_2, type, way).
-prop(way27776786_0, from_node, node11324082776).
-prop(way27776786_0, to_node, node314203326).
-prop(way27776786_0, type, way).
-prop(way27776786_1, from_node, node314203326).
-prop(way27776786_1, to_node, node1338435895).
-prop(way27776786_1, type, way).
-prop(way27776786_2, from_node, node1338435895).
-prop(way27776786_2, to_node, node305594350).
-prop(way27776786_2, type, way).
-prop(way27776786_3, from_node, node305594350).
-prop(way27776786_3, to_node, node304993179).
-prop(way27776786_3, type, way).
-prop(way27776787_0, from_node, node304993188).
-prop(way27776787_0, to_node, node353122529).
-prop(way27776787_0, bidirectional, true).
-prop(way27776787_0, type, way).
-prop(way27776787_1, from_node, node353122529).
-prop(way27776787_1, to_node, node304993188).
-prop(way27776787_1, bidirectional, true).
-prop(way27776787_1, type, way).
-prop(way27776789_0, from_node, node304993930).
-prop(way27776789_0, to_node, node304993183).
-prop(way27776789_0, type, way).
-prop(way27776791_0, from_node, node304993942).
-prop(way27776791_0, to_node, node304993939).
-prop(way27776791_0, type, way).
-prop(way27776830_0, from_node, node304993181).
-prop(way27776830_0, to_node, node304994369).
-prop(way27776830_0, type, way).
-prop(way27776831_0, from_node, node304994369).
-prop(way27776831_0, to_node, node304994370).
-prop(way27776831_0, type, way).
-prop(way27776832_0, from_node, node304993179).
-prop(way27776832_0, to_node, node304994370).
-prop(way27776832_0, bidirectional, true).
-prop(way27776832_0, type, way).
-prop(way27776832_1, from_node, node304994370).
-prop(way27776832_1, to_node, node304993179).
-prop(way27776832_1, bidirectional, true).
-prop(way27776832_1, type, way).
-prop(way27833773_0, from_node, node305594255).
-prop(way27833773_0, to_node, node1878960342).
-prop(way27833773_0, bidirectional, true).
-prop(way27833773_0, type, way).
-prop(way27833773_1, from_node, node1878960342).
-prop(way27833773_1, to_node, node305594255).
-prop(way27833773_1, bidirectional, true).
-prop(way27833773_1, type, way).
-prop(way27833774_0, from_node, node922748969).
-prop(way27833774_0, to_node, node922748928).
-prop(way27833774_0, bidirectional, true).
-prop(way27833774_0, type, way).
-prop(way27833774_1, from_node, node922748928).
-prop(way27833774_1, to_node, node922748969).
-prop(way27833774_1, bidirectional, true).
-prop(way27833774_1, type, way).
-prop(way28082645_0, from_node, node314203305).
-prop(way28082645_0, to_node, node314203299).
-prop(way28082645_0, type, way).
-prop(way28599416_0, from_node, node314203309).
-prop(way28599416_0, to_node, node314203301).
-prop(way28599416_0, type, way).
-prop(way28599422_0, from_node, node314203365).
-prop(way28599422_0, to_node, node304994369).
-prop(way28599422_0, bidirectional, true).
-prop(way28599422_0, type, way).
-prop(way28599422_1, from_node, node304994369).
-prop(way28599422_1, to_node, node314203365).
-prop(way28599422_1, bidirectional, true).
-prop(way28599422_1, type, way).
-prop(way28724772_0, from_node, node315819969).
-prop(way28724772_0, to_node, node11040297842).
-prop(way28724772_0, type, way).
-prop(way28724772_1, from_node, node11040297842).
-prop(way28724772_1, to_node, node1346867468).
-prop(way28724772_1, type, way).
-prop(way28724772_2, from_node, node1346867468).
-prop(way28724772_2, to_node, node4124374398).
-prop(way28724772_2, type, way).
-prop(way28724772_3, from_node, node4124374398).
-prop(way28724772_3, to_node, node1422047049).
-prop(way28724772_3, type, way).
-prop(way28724772_4, from_node, node1422047049).
-prop(way28724772_4, to_node, node2493671554).
-prop(way28724772_4, type, way).
-prop(way28724772_5, from_node, node2493671554).
-prop(way28724772_5, to_node, node10869257012).
-prop(way28724772_5, type, way).
-prop(way28724772_6, from_node, node10869257012).
-prop(way28724772_6, to_node, node2493671556).
-prop(way28724772_6, type, way).
-prop(way28724772_7, from_node, node2493671556).
-prop(way28724772_7, to_node, node1363512508).
-prop(way28724772_7, type, way).
-prop(way28724772_8, from_node, node1363512508).
-prop(way28724772_8, to_node, node315819980).
-prop(way28724772_8, type, way).
-prop(way28724772_9, from_node, node315819980).
-prop(way28724772_9, to_node, node308414804).
-prop(way28724772_9, type, way).
-prop(way28724773_0, from_node, node304993179).
-prop(way28724773_0, to_node, node1363513018).
-prop(way28724773_0, type, way).
-prop(way28724773_1, from_node, node1363513018).
-prop(way28724773_1, to_node, node304993181).
-prop(way28724773_1, type, way).
-prop(way28724773_2, from_node, node304993181).
-prop(way28724773_2, to_node, node315819971).
-prop(way28724773_2, type, way).
-prop(way28724773_3, from_node, node315819971).
-prop(way28724773_3, to_node, node1346836068).
-prop(way28724773_3, type, way).
-prop(way28724773_4, from_node, node1346836068).
-prop(way28724773_4, to_node, node315819975).
-prop(way28724773_4, type, way).
-prop(way28724775_0, from_node, node314203305).
-prop(way28724775_0, to_node, node314203309).
-prop(way28724775_0, type, way).
-prop(way28724776_0, from_node, node315819969).
-prop(way28724776_0, to_node, node1338434277).
-prop(way28724776_0, type, way).
-prop(way28724776_1, from_node, node1338434277).
-prop(way28724776_1, to_node, node1363512495).
-prop(way28724776_1, type, way).
-prop(way28724779_0, from_node, node315819980).
-prop(way28724779_0, to_node, node2481492030).
-prop(way28724779_0, type, way).
-prop(way28724779_1, from_node, node2481492030).
-prop(way28724779_1, to_node, node4124369726).
-prop(way28724779_1, type, way).
-prop(way28724779_2, from_node, node4124369726).
-prop(way28724779_2, to_node, node1346840985).
-prop(way28724779_2, type, way).
-prop(way28724779_3, from_node, node1346840985).
-prop(way28724779_3, to_node, node2493671552).
-prop(way28724779_3, type, way).
-prop(way28724779_4, from_node, node2493671552).
-prop(way28724779_4, to_node, node2493671568).
-prop(way28724779_4, type, way).
-prop(way28724779_5, from_node, node2493671568).
-prop(way28724779_5, to_node, node314203427).
-prop(way28724779_5, type, way).
-prop(way78684086_0, from_node, node922748928).
-prop(way78684086_0, to_node, node2484044206).
-prop(way78684086_0, bidirectional, true).
-prop(way78684086_0, type, way).
-prop(way78684086_1, from_node, node2484044206).
-prop(way78684086_1, to_node, node922748928).
-prop(way78684086_1, bidirectional, true).
-prop(way78684086_1, type, way).
-prop(way116105647_0, from_node, node1155831069).
-prop(way116105647_0, to_node, node314203427).
-prop(way116105647_0, type, way).
-prop(way116353076_0, from_node, node308414801).
-prop(way116353076_0, to_node, node10869257011).
-prop(way116353076_0, type, way).
-prop(way116353076_1, from_node, node10869257011).
-prop(way116353076_1, to_node, node1422047085).
-prop(way116353076_1, type, way).
-prop(way116353076_2, from_node, node1422047085).
-prop(way116353076_2, to_node, node1346867465).
-prop(way116353076_2, type, way).
-prop(way116353076_3, from_node, node1346867465).
-prop(way116353076_3, to_node, node1338434277).
-prop(way116353076_3, type, way).
-prop(way116767599_0, from_node, node314203309).
-prop(way116767599_0, to_node, node304993184).
-prop(way116767599_0, type, way).
-prop(way116768230_0, from_node, node314203427).
-prop(way116768230_0, to_node, node2493671573).
-prop(way116768230_0, type, way).
-prop(way116768230_1, from_node, node2493671573).
-prop(way116768230_1, to_node, node1346836073).
-prop(way116768230_1, type, way).
-prop(way116768230_2, from_node, node1346836073).
-prop(way116768230_2, to_node, node1346825054).
-prop(way116768230_2, type, way).
-prop(way116768230_3, from_node, node1346825054).
-prop(way116768230_3, to_node, node2493671559).
-prop(way116768230_3, type, way).
-prop(way116768230_4, from_node, node2493671559).
-prop(way116768230_4, to_node, node2493668432).
-prop(way116768230_4, type, way).
-prop(way116768230_5, from_node, node2493668432).
-prop(way116768230_5, to_node, node315819969).
-prop(way116768230_5, type, way).
-prop(way117200843_0, from_node, node922748934).
-prop(way117200843_0, to_node, node4124401739).
-prop(way117200843_0, bidirectional, true).
-prop(way117200843_0, type, way).
-prop(way117200843_1, from_node, node4124401739).
-prop(way117200843_1, to_node, node922748934).
-prop(way117200843_1, bidirectional, true).
-prop(way117200843_1, type, way).
-prop(way119051578_0, from_node, node1363512977).
-prop(way119051578_0, to_node, node1363512978).
-prop(way119051578_0, type, way).
-prop(way119051578_1, from_node, node1363512978).
-prop(way119051578_1, to_node, node1338434660).
-prop(way119051578_1, type, way).
-prop(way119051749_0, from_node, node1338435895).
-prop(way119051749_0, to_node, node315819969).
-prop(way119051749_0, type, way).
-prop(way120031087_0, from_node, node1346825054).
-prop(way120031087_0, to_node, node3873858655).
-prop(way120031087_0, type, way).
-prop(way120031087_1, from_node, node3873858655).
-prop(way120031087_1, to_node, node3873858650).
-prop(way120031087_1, type, way).
-prop(way120031087_2, from_node, node3873858650).
-prop(way120031087_2, to_node, node3873858647).
-prop(way120031087_2, type, way).
-prop(way120031087_3, from_node, node3873858647).
-prop(way120031087_3, to_node, node3873858645).
-prop(way120031087_3, type, way).
-prop(way120031087_4, from_node, node3873858645).
-prop(way120031087_4, to_node, node1363512529).
-prop(way120031087_4, type, way).
-prop(way120031087_5, from_node, node1363512529).
-prop(way120031087_5, to_node, node4124369726).
-prop(way120031087_5, type, way).
-prop(way120031380_0, from_node, node315819971).
-prop(way120031380_0, to_node, node2484097889).
-prop(way120031380_0, type, way).
-prop(way120031380_1, from_node, node2484097889).
-prop(way120031380_1, to_node, node1346825054).
-prop(way120031380_1, type, way).
-prop(way120031506_0, from_node, node1346836073).
-prop(way120031506_0, to_node, node2493668433).
-prop(way120031506_0, type, way).
-prop(way120031506_1, from_node, node2493668433).
-prop(way120031506_1, to_node, node1346836068).
-prop(way120031506_1, type, way).
-prop(way120031696_0, from_node, node1346840985).
-prop(way120031696_0, to_node, node2493671560).
-prop(way120031696_0, type, way).
-prop(way120031696_1, from_node, node2493671560).
-prop(way120031696_1, to_node, node2493671565).
-prop(way120031696_1, type, way).
-prop(way120031696_2, from_node, node2493671565).
-prop(way120031696_2, to_node, node1422047060).
-prop(way120031696_2, type, way).
-prop(way120031696_3, from_node, node1422047060).
-prop(way120031696_3, to_node, node3873858656).
-prop(way120031696_3, type, way).
-prop(way120031696_4, from_node, node3873858656).
-prop(way120031696_4, to_node, node1346836073).
-prop(way120031696_4, type, way).
-prop(way120031864_0, from_node, node305594255).
-prop(way120031864_0, to_node, node565476617).
-prop(way120031864_0, bidirectional, true).
-prop(way120031864_0, type, way).
-prop(way120031864_1, from_node, node565476617).
-prop(way120031864_1, to_node, node305594255).
-prop(way120031864_1, bidirectional, true).
-prop(way120031864_1, type, way).
-prop(way120032409_0, from_node, node1346867471).
-prop(way120032409_0, to_node, node4124374398).
-prop(way120032409_0, bidirectional, true).
-prop(way120032409_0, type, way).
-prop(way120032409_1, from_node, node4124374398).
-prop(way120032409_1, to_node, node1346867471).
-prop(way120032409_1, bidirectional, true).
-prop(way120032409_1, type, way).
-prop(way120032413_0, from_node, node1346867468).
-prop(way120032413_0, to_node, node1346867465).
-prop(way120032413_0, type, way).
-prop(way120032413_1, from_node, node1346867465).
-prop(way120032413_1, to_node, node1363512492).
-prop(way120032413_1, type, way).
-prop(way120032413_2, from_node, node1363512492).
-prop(way120032413_2, to_node, node1363512478).
-prop(way120032413_2, type, way).
-prop(way120032413_3, from_node, node1363512478).
-prop(way120032413_3, to_node, node1363512511).
-prop(way120032413_3, type, way).
-prop(way120032413_4, from_node, node1363512511).
-prop(way120032413_4, to_node, node1346867462).
-prop(way120032413_4, type, way).
-prop(way121904639_0, from_node, node1363493448).
-prop(way121904639_0, to_node, node1451662540).
-prop(way121904639_0, bidirectional, true).
-prop(way121904639_0, type, way).
-prop(way121904639_1, from_node, node1451662540).
-prop(way121904639_1, to_node, node1363493448).
-prop(way121904639_1, bidirectional, true).
-prop(way121904639_1, type, way).
-prop(way121904639_2, from_node, node1451662540).
-prop(way121904639_2, to_node, node2496532075).
-prop(way121904639_2, bidirectional, true).
-prop(way121904639_2, type, way).
-prop(way121904639_3, from_node, node2496532075).
-prop(way121904639_3, to_node, node1451662540).
-prop(way121904639_3, bidirectional, true).
-prop(way121904639_3, type, way).
-prop(way121906590_0, from_node, node1363512540).
-prop(way121906590_0, to_node, node1363512478).
-prop(way121906590_0, type, way).
-prop(way121906590_1, from_node, node1363512478).
-prop(way121906590_1, to_node, node1422047082).
-prop(way121906590_1, type, way).
-prop(way121906590_2, from_node, node1422047082).
-prop(way121906590_2, to_node, node10869257009).
-prop(way121906590_2, type, way).
-prop(way121906590_3, from_node, node10869257009).
-prop(way121906590_3, to_node, node1363512527).
-prop(way121906590_3, type, way).
-prop(way121906591_0, from_node, node1363512529).
-prop(way121906591_0, to_node, node3873858643).
-prop(way121906591_0, type, way).
-prop(way121906591_1, from_node, node3873858643).
-prop(way121906591_1, to_node, node2493671558).
-prop(way121906591_1, type, way).
-prop(way121906591_2, from_node, node2493671558).
-prop(way121906591_2, to_node, node1363512508).
-prop(way121906591_2, type, way).
-prop(way121906592_0, from_node, node1363534177).
-prop(way121906592_0, to_node, node2493671549).
-prop(way121906592_0, type, way).
-prop(way121906592_1, from_node, node2493671549).
-prop(way121906592_1, to_node, node1363534176).
-prop(way121906592_1, type, way).
-prop(way121906592_2, from_node, node1363534176).
-prop(way121906592_2, to_node, node1363512465).
-prop(way121906592_2, type, way).
-prop(way121906593_0, from_node, node1363512467).
-prop(way121906593_0, to_node, node1363512495).
-prop(way121906593_0, bidirectional, true).
-prop(way121906593_0, type, way).
-prop(way121906593_1, from_node, node1363512495).
-prop(way121906593_1, to_node, node1363512467).
-prop(way121906593_1, bidirectional, true).
-prop(way121906593_1, type, way).
-prop(way121906595_0, from_node, node2493668437).
-prop(way121906595_0, to_node, node1363512467).
-prop(way121906595_0, bidirectional, true).
-prop(way121906595_0, type, way).
-prop(way121906595_1, from_node, node1363512467).
-prop(way121906595_1, to_node, node2493668437).
-prop(way121906595_1, bidirectional, true).
-prop(way121906595_1, type, way).
-prop(way121906595_2, from_node, node1363512467).
-prop(way121906595_2, to_node, node1363512465).
-prop(way121906595_2, bidirectional, true).
-prop(way121906595_2, type, way).
-prop(way121906595_3, from_node, node1363512465).
-prop(way121906595_3, to_node, node1363512467).
-prop(way121906595_3, bidirectional, true).
-prop(way121906595_3, type, way).
-prop(way121906595_4, from_node, node1363512465).
-prop(way121906595_4, to_node, node1363512978).
-prop(way121906595_4, bidirectional, true).
-prop(way121906595_4, type, way).
-prop(way121906595_5, from_node, node1363512978).
-prop(way121906595_5, to_node, node1363512465).
-prop(way121906595_5, bidirectional, true).
-prop(way121906595_5, type, way).
-prop(way121906595_6, from_node, node1363512978).
-prop(way121906595_6, to_node, node2493671548).
-prop(way121906595_6, bidirectional, true).
-prop(way121906595_6, type, way).
-prop(way121906595_7, from_node, node2493671548).
-prop(way121906595_7, to_node, node1363512978).
-prop(way121906595_7, bidirectional, true).
-prop(way121906595_7, type, way).
-prop(way121906595_8, from_node, node2493671548).
-prop(way121906595_8, to_node, node2493671550).
-prop(way121906595_8, bidirectional, true).
-prop(way121906595_8, type, way).
-prop(way121906595_9, from_node, node2493671550).
-prop(way121906595_9, to_node, node2493671548).
-prop(way121906595_9, bidirectional, true).
-prop(way121906595_9, type, way).
-prop(way121906595_10, from_node, node2493671550).
-prop(way121906595_10, to_node, node1363512484).
-prop(way121906595_10, bidirectional, true).
-prop(way121906595_10, type, way).
-prop(way121906595_11, from_node, node1363512484).
-prop(way121906595_11, to_node, node2493671550).
-prop(way121906595_11, bidirectional, true).
-prop(way121906595_11, type, way).
-prop(way121906624_0, from_node, node1363513018).
-prop(way121906624_0, to_node, node2493668430).
-prop(way121906624_0, bidirectional, true).
-prop(way121906624_0, type, way).
-prop(way121906624_1, from_node, node2493668430).
-prop(way121906624_1, to_node, node1363513018).
-prop(way121906624_1, bidirectional, true).
-prop(way121906624_1, type, way).
-prop(way121906624_2, from_node, node2493668430).
-prop(way121906624_2, to_node, node1363513016).
-prop(way121906624_2, bidirectional, true).
-prop(way121906624_2, type, way).
-prop(way121906624_3, from_node, node1363513016).
-prop(way121906624_3, to_node, node2493668430).
-prop(way121906624_3, bidirectional, true).
-prop(way121906624_3, type, way).
-prop(way121908198_0, from_node, node1311858619).
-prop(way121908198_0, to_node, node1422047086).
-prop(way121908198_0, type, way).
-prop(way121908198_1, from_node, node1422047086).
-prop(way121908198_1, to_node, node1346867462).
-prop(way121908198_1, type, way).
-prop(way121908198_2, from_node, node1346867462).
-prop(way121908198_2, to_node, node1338434660).
-prop(way121908198_2, type, way).
-prop(way121908696_0, from_node, node1363512542).
-prop(way121908696_0, to_node, node10869257008).
-prop(way121908696_0, type, way).
-prop(way121908696_1, from_node, node10869257008).
-prop(way121908696_1, to_node, node1422047084).
-prop(way121908696_1, type, way).
-prop(way121908696_2, from_node, node1422047084).
-prop(way121908696_2, to_node, node1363512511).
-prop(way121908696_2, type, way).
-prop(way121908696_3, from_node, node1363512511).
-prop(way121908696_3, to_node, node2271230554).
-prop(way121908696_3, type, way).
-prop(way128759834_0, from_node, node1422047069).
-prop(way128759834_0, to_node, node2271230545).
-prop(way128759834_0, type, way).
-prop(way128759834_1, from_node, node2271230545).
-prop(way128759834_1, to_node, node1449923733).
-prop(way128759834_1, type, way).
-prop(way128762650_0, from_node, node1422047049).
-prop(way128762650_0, to_node, node1422047085).
-prop(way128762650_0, type, way).
-prop(way128762650_1, from_node, node1422047085).
-prop(way128762650_1, to_node, node1422047083).
-prop(way128762650_1, type, way).
-prop(way128762650_2, from_node, node1422047083).
-prop(way128762650_2, to_node, node1422047082).
-prop(way128762650_2, type, way).
-prop(way128762650_3, from_node, node1422047082).
-prop(way128762650_3, to_node, node1422047084).
-prop(way128762650_3, type, way).
-prop(way128762650_4, from_node, node1422047084).
-prop(way128762650_4, to_node, node1422047086).
-prop(way128762650_4, type, way).
-prop(way128762650_5, from_node, node1422047086).
-prop(way128762650_5, to_node, node2271230545).
-prop(way128762650_5, type, way).
-prop(way130873544_0, from_node, node922748859).
-prop(way130873544_0, to_node, node2484044204).
-prop(way130873544_0, bidirectional, true).
-prop(way130873544_0, type, way).
-prop(way130873544_1, from_node, node2484044204).
-prop(way130873544_1, to_node, node922748859).
-prop(way130873544_1, bidirectional, true).
-prop(way130873544_1, type, way).
-prop(way177434729_0, from_node, node922748859).
-prop(way177434729_0, to_node, node2484053754).
-prop(way177434729_0, bidirectional, true).
-prop(way177434729_0, type, way).
-prop(way177434729_1, from_node, node2484053754).
-prop(way177434729_1, to_node, node922748859).
-prop(way177434729_1, bidirectional, true).
-prop(way177434729_1, type, way).
-prop(way177434729_2, from_node, node2484053754).
-prop(way177434729_2, to_node, node1878960334).
-prop(way177434729_2, bidirectional, true).
-prop(way177434729_2, type, way).
-prop(way177434729_3, from_node, node1878960334).
-prop(way177434729_3, to_node, node2484053754).
-prop(way177434729_3, bidirectional, true).
-prop(way177434729_3, type, way).
-prop(way177434730_0, from_node, node1878960318).
-prop(way177434730_0, to_node, node2484053760).
-prop(way177434730_0, bidirectional, true).
-prop(way177434730_0, type, way).
-prop(way177434730_1, from_node, node2484053760).
-prop(way177434730_1, to_node, node1878960318).
-prop(way177434730_1, bidirectional, true).
-prop(way177434730_1, type, way).
-prop(way177434730_2, from_node, node2484053760).
-prop(way177434730_2, to_node, node1878960322).
-prop(way177434730_2, bidirectional, true).
-prop(way177434730_2, type, way).
-prop(way177434730_3, from_node, node1878960322).
-prop(way177434730_3, to_node, node2484053760).
-prop(way177434730_3, bidirectional, true).
-prop(way177434730_3, type, way).
-prop(way177434730_4, from_node, node1878960322).
-prop(way177434730_4, to_node, node2144056401).
-prop(way177434730_4, bidirectional, true).
-prop(way177434730_4, type, way).
-prop(way177434730_5, from_node, node2144056401).
-prop(way177434730_5, to_node, node1878960322).
-prop(way177434730_5, bidirectional, true).
-prop(way177434730_5, type, way).
-prop(way177434730_6, from_node, node2144056401).
-prop(way177434730_6, to_node, node1878960325).
-prop(way177434730_6, bidirectional, true).
-prop(way177434730_6, type, way).
-prop(way177434730_7, from_node, node1878960325).
-prop(way177434730_7, to_node, node2144056401).
-prop(way177434730_7, bidirectional, true).
-prop(way177434730_7, type, way).
-prop(way177434731_0, from_node, node922748903).
-prop(way177434731_0, to_node, node4124401737).
-prop(way177434731_0, bidirectional, true).
-prop(way177434731_0, type, way).
-prop(way177434731_1, from_node, node4124401737).
-prop(way177434731_1, to_node, node922748903).
-prop(way177434731_1, bidirectional, true).
-prop(way177434731_1, type, way).
-prop(way177434732_0, from_node, node1878960318).
-prop(way177434732_0, to_node, node2484044204).
-prop(way177434732_0, bidirectional, true).
-prop(way177434732_0, type, way).
-prop(way177434732_1, from_node, node2484044204).
-prop(way177434732_1, to_node, node1878960318).
-prop(way177434732_1, bidirectional, true).
-prop(way177434732_1, type, way).
-prop(way177434732_2, from_node, node2484044204).
-prop(way177434732_2, to_node, node1878960306).
-prop(way177434732_2, bidirectional, true).
-prop(way177434732_2, type, way).
-prop(way177434732_3, from_node, node1878960306).
-prop(way177434732_3, to_node, node2484044204).
-prop(way177434732_3, bidirectional, true).
-prop(way177434732_3, type, way).
-prop(way180435847_0, from_node, node922748903).
-prop(way180435847_0, to_node, node2484044217).
-prop(way180435847_0, bidirectional, true).
-prop(way180435847_0, type, way).
-prop(way180435847_1, from_node, node2484044217).
-prop(way180435847_1, to_node, node922748903).
-prop(way180435847_1, bidirectional, true).
-prop(way180435847_1, type, way).
-prop(way180435847_2, from_node, node2484044217).
-prop(way180435847_2, to_node, node922748859).
-prop(way180435847_2, bidirectional, true).
-prop(way180435847_2, type, way).
-prop(way180435847_3, from_node, node922748859).
-prop(way180435847_3, to_node, node2484044217).
-prop(way180435847_3, bidirectional, true).
-prop(way180435847_3, type, way).
-prop(way180435847_4, from_node, node922748859).
-prop(way180435847_4, to_node, node1878960318).
-prop(way180435847_4, bidirectional, true).
-prop(way180435847_4, type, way).
-prop(way180435847_5, from_node, node1878960318).
-prop(way180435847_5, to_node, node922748859).
-prop(way180435847_5, bidirectional, true).
-prop(way180435847_5, type, way).
-prop(way180435847_6, from_node, node1878960318).
-prop(way180435847_6, to_node, node305594300).
-prop(way180435847_6, bidirectional, true).
-prop(way180435847_6, type, way).
-prop(way180435847_7, from_node, node305594300).
-prop(way180435847_7, to_node, node1878960318).
-prop(way180435847_7, bidirectional, true).
-prop(way180435847_7, type, way).
-prop(way180435849_0, from_node, node922748928).
-prop(way180435849_0, to_node, node922748934).
-prop(way180435849_0, bidirectional, true).
-prop(way180435849_0, type, way).
-prop(way180435849_1, from_node, node922748934).
-prop(way180435849_1, to_node, node922748928).
-prop(way180435849_1, bidirectional, true).
-prop(way180435849_1, type, way).
-prop(way180435853_0, from_node, node1878960342).
-prop(way180435853_0, to_node, node1878960338).
-prop(way180435853_0, bidirectional, true).
-prop(way180435853_0, type, way).
-prop(way180435853_1, from_node, node1878960338).
-prop(way180435853_1, to_node, node1878960342).
-prop(way180435853_1, bidirectional, true).
-prop(way180435853_1, type, way).
-prop(way180435854_0, from_node, node1878960338).
-prop(way180435854_0, to_node, node1878960334).
-prop(way180435854_0, bidirectional, true).
-prop(way180435854_0, type, way).
-prop(way180435854_1, from_node, node1878960334).
-prop(way180435854_1, to_node, node1878960338).
-prop(way180435854_1, bidirectional, true).
-prop(way180435854_1, type, way).
-prop(way180435854_2, from_node, node1878960334).
-prop(way180435854_2, to_node, node1878960322).
-prop(way180435854_2, bidirectional, true).
-prop(way180435854_2, type, way).
-prop(way180435854_3, from_node, node1878960322).
-prop(way180435854_3, to_node, node1878960334).
-prop(way180435854_3, bidirectional, true).
-prop(way180435854_3, type, way).
-prop(way185504729_0, from_node, node2144056401).
-prop(way185504729_0, to_node, node2144056625).
-prop(way185504729_0, bidirectional, true).
-prop(way185504729_0, type, way).
-prop(way185504729_1, from_node, node2144056625).
-prop(way185504729_1, to_node, node2144056401).
-prop(way185504729_1, bidirectional, true).
-prop(way185504729_1, type, way).
-prop(way185504729_2, from_node, node2144056625).
-prop(way185504729_2, to_node, node2484052930).
-prop(way185504729_2, bidirectional, true).
-prop(way185504729_2, type, way).
-prop(way185504729_3, from_node, node2484052930).
-prop(way185504729_3, to_node, node2144056625).
-prop(way185504729_3, bidirectional, true).
-prop(way185504729_3, type, way).
-prop(way185504729_4, from_node, node2484052930).
-prop(way185504729_4, to_node, node2484030804).
-prop(way185504729_4, bidirectional, true).
-prop(way185504729_4, type, way).
-prop(way185504729_5, from_node, node2484030804).
-prop(way185504729_5, to_node, node2484052930).
-prop(way185504729_5, bidirectional, true).
-prop(way185504729_5, type, way).
-prop(way204398520_0, from_node, node2144056625).
-prop(way204398520_0, to_node, node305594300).
-prop(way204398520_0, bidirectional, true).
-prop(way204398520_0, type, way).
-prop(way204398520_1, from_node, node305594300).
-prop(way204398520_1, to_node, node2144056625).
-prop(way204398520_1, bidirectional, true).
-prop(way204398520_1, type, way).
-prop(way240693096_0, from_node, node2484044206).
-prop(way240693096_0, to_node, node2484044217).
-prop(way240693096_0, bidirectional, true).
-prop(way240693096_0, type, way).
-prop(way240693096_1, from_node, node2484044217).
-prop(way240693096_1, to_node, node2484044206).
-prop(way240693096_1, bidirectional, true).
-prop(way240693096_1, type, way).
-prop(way240693099_0, from_node, node2484044206).
-prop(way240693099_0, to_node, node1878960306).
-prop(way240693099_0, bidirectional, true).
-prop(way240693099_0, type, way).
-prop(way240693099_1, from_node, node1878960306).
-prop(way240693099_1, to_node, node2484044206).
-prop(way240693099_1, bidirectional, true).
-prop(way240693099_1, type, way).
-prop(way240693099_2, from_node, node1878960306).
-prop(way240693099_2, to_node, node1363493448).
-prop(way240693099_2, bidirectional, true).
-prop(way240693099_2, type, way).
-prop(way240693099_3, from_node, node1363493448).
-prop(way240693099_3, to_node, node1878960306).
-prop(way240693099_3, bidirectional, true).
-prop(way240693099_3, type, way).
-prop(way240694287_0, from_node, node2144056449).
-prop(way240694287_0, to_node, node2144056587).
-prop(way240694287_0, bidirectional, true).
-prop(way240694287_0, type, way).
-prop(way240694287_1, from_node, node2144056587).
-prop(way240694287_1, to_node, node2144056449).
-prop(way240694287_1, bidirectional, true).
-prop(way240694287_1, type, way).
-prop(way240694288_0, from_node, node2144056587).
-prop(way240694288_0, to_node, node305594350).
-prop(way240694288_0, bidirectional, true).
-prop(way240694288_0, type, way).
-prop(way240694288_1, from_node, node305594350).
-prop(way240694288_1, to_node, node2144056587).
-prop(way240694288_1, bidirectional, true).
-prop(way240694288_1, type, way).
-prop(way240694289_0, from_node, node2144056587).
-prop(way240694289_0, to_node, node2484055814).
-prop(way240694289_0, bidirectional, true).
-prop(way240694289_0, type, way).
-prop(way240694289_1, from_node, node2484055814).
-prop(way240694289_1, to_node, node2144056587).
-prop(way240694289_1, bidirectional, true).
-prop(way240694289_1, type, way).
-prop(way240694289_2, from_node, node2484055814).
-prop(way240694289_2, to_node, node305594342).
-prop(way240694289_2, bidirectional, true).
-prop(way240694289_2, type, way).
-prop(way240694289_3, from_node, node305594342).
-prop(way240694289_3, to_node, node2484055814).
-prop(way240694289_3, bidirectional, true).
-prop(way240694289_3, type, way).
-prop(way240694289_4, from_node, node305594342).
-prop(way240694289_4, to_node, node1451662540).
-prop(way240694289_4, bidirectional, true).
-prop(way240694289_4, type, way).
-prop(way240694289_5, from_node, node1451662540).
-prop(way240694289_5, to_node, node305594342).
-prop(way240694289_5, bidirectional, true).
-prop(way240694289_5, type, way).
-prop(way240694290_0, from_node, node2484052922).
-prop(way240694290_0, to_node, node2484052930).
-prop(way240694290_0, bidirectional, true).
-prop(way240694290_0, type, way).
-prop(way240694290_1, from_node, node2484052930).
-prop(way240694290_1, to_node, node2484052922).
-prop(way240694290_1, bidirectional, true).
-prop(way240694290_1, type, way).
-prop(way240694291_0, from_node, node305594300).
-prop(way240694291_0, to_node, node2484055808).
-prop(way240694291_0, bidirectional, true).
-prop(way240694291_0, type, way).
-prop(way240694291_1, from_node, node2484055808).
-prop(way240694291_1, to_node, node305594300).
-prop(way240694291_1, bidirectional, true).
-prop(way240694291_1, type, way).
-prop(way240694291_2, from_node, node2484055808).
-prop(way240694291_2, to_node, node2484052922).
-prop(way240694291_2, bidirectional, true).
-prop(way240694291_2, type, way).
-prop(way240694291_3, from_node, node2484052922).
-prop(way240694291_3, to_node, node2484055808).
-prop(way240694291_3, bidirectional, true).
-prop(way240694291_3, type, way).
-prop(way240694291_4, from_node, node2484052922).
-prop(way240694291_4, to_node, node2144056587).
-prop(way240694291_4, bidirectional, true).
-prop(way240694291_4, type, way).
-prop(way240694291_5, from_node, node2144056587).
-prop(way240694291_5, to_node, node2484052922).
-prop(way240694291_5, bidirectional, true).
-prop(way240694291_5, type, way).
-prop(way240694292_0, from_node, node305594300).
-prop(way240694292_0, to_node, node305594342).
-prop(way240694292_0, bidirectional, true).
-prop(way240694292_0, type, way).
-prop(way240694292_1, from_node, node305594342).
-prop(way240694292_1, to_node, node305594300).
-prop(way240694292_1, bidirectional, true).
-prop(way240694292_1, type, way).
-prop(way240694319_0, from_node, node2484053754).
-prop(way240694319_0, to_node, node2484053760).
-prop(way240694319_0, bidirectional, true).
-prop(way240694319_0, type, way).
-prop(way240694319_1, from_node, node2484053760).
-prop(way240694319_1, to_node, node2484053754).
-prop(way240694319_1, bidirectional, true).
-prop(way240694319_1, type, way).
-prop(way240694409_0, from_node, node2484055808).
-prop(way240694409_0, to_node, node2484055814).
-prop(way240694409_0, bidirectional, true).
-prop(way240694409_0, type, way).
-prop(way240694409_1, from_node, node2484055814).
-prop(way240694409_1, to_node, node2484055808).
-prop(way240694409_1, bidirectional, true).
-prop(way240694409_1, type, way).
-prop(way241775264_0, from_node, node2493668430).
-prop(way241775264_0, to_node, node2493668435).
-prop(way241775264_0, bidirectional, true).
-prop(way241775264_0, type, way).
-prop(way241775264_1, from_node, node2493668435).
-prop(way241775264_1, to_node, node2493668430).
-prop(way241775264_1, bidirectional, true).
-prop(way241775264_1, type, way).
-prop(way241775264_2, from_node, node2493668435).
-prop(way241775264_2, to_node, node2493668432).
-prop(way241775264_2, bidirectional, true).
-prop(way241775264_2, type, way).
-prop(way241775264_3, from_node, node2493668432).
-prop(way241775264_3, to_node, node2493668435).
-prop(way241775264_3, bidirectional, true).
-prop(way241775264_3, type, way).
-prop(way241775265_0, from_node, node2493668433).
-prop(way241775265_0, to_node, node2484097889).
-prop(way241775265_0, bidirectional, true).
-prop(way241775265_0, type, way).
-prop(way241775265_1, from_node, node2484097889).
-prop(way241775265_1, to_node, node2493668433).
-prop(way241775265_1, bidirectional, true).
-prop(way241775265_1, type, way).
-prop(way241775265_2, from_node, node2484097889).
-prop(way241775265_2, to_node, node2493668435).
-prop(way241775265_2, bidirectional, true).
-prop(way241775265_2, type, way).
-prop(way241775265_3, from_node, node2493668435).
-prop(way241775265_3, to_node, node2484097889).
-prop(way241775265_3, bidirectional, true).
-prop(way241775265_3, type, way).
-prop(way241775696_0, from_node, node1363534176).
-prop(way241775696_0, to_node, node1363512977).
-prop(way241775696_0, bidirectional, true).
-prop(way241775696_0, type, way).
-prop(way241775696_1, from_node, node1363512977).
-prop(way241775696_1, to_node, node1363534176).
-prop(way241775696_1, bidirectional, true).
-prop(way241775696_1, type, way).
-prop(way241775696_2, from_node, node1363512977).
-prop(way241775696_2, to_node, node2493671548).
-prop(way241775696_2, bidirectional, true).
-prop(way241775696_2, type, way).
-prop(way241775696_3, from_node, node2493671548).
-prop(way241775696_3, to_node, node1363512977).
-prop(way241775696_3, bidirectional, true).
-prop(way241775696_3, type, way).
-prop(way241775697_0, from_node, node2493671549).
-prop(way241775697_0, to_node, node2493671550).
-prop(way241775697_0, bidirectional, true).
-prop(way241775697_0, type, way).
-prop(way241775697_1, from_node, node2493671550).
-prop(way241775697_1, to_node, node2493671549).
-prop(way241775697_1, bidirectional, true).
-prop(way241775697_1, type, way).
-prop(way241775698_0, from_node, node1363512495).
-prop(way241775698_0, to_node, node1363512540).
-prop(way241775698_0, type, way).
-prop(way241775698_1, from_node, node1363512540).
-prop(way241775698_1, to_node, node2271230554).
-prop(way241775698_1, type, way).
-prop(way241775698_2, from_node, node2271230554).
-prop(way241775698_2, to_node, node1338434660).
-prop(way241775698_2, type, way).
-prop(way241775698_3, from_node, node1338434660).
-prop(way241775698_3, to_node, node1422047069).
-prop(way241775698_3, type, way).
-prop(way241775698_4, from_node, node1422047069).
-prop(way241775698_4, to_node, node314203305).
-prop(way241775698_4, type, way).
-prop(way241775699_0, from_node, node1363512495).
-prop(way241775699_0, to_node, node1363512492).
-prop(way241775699_0, bidirectional, true).
-prop(way241775699_0, type, way).
-prop(way241775699_1, from_node, node1363512492).
-prop(way241775699_1, to_node, node1363512495).
-prop(way241775699_1, bidirectional, true).
-prop(way241775699_1, type, way).
-prop(way241775699_2, from_node, node1363512492).
-prop(way241775699_2, to_node, node1422047083).
-prop(way241775699_2, bidirectional, true).
-prop(way241775699_2, type, way).
-prop(way241775699_3, from_node, node1422047083).
-prop(way241775699_3, to_node, node1363512492).
-prop(way241775699_3, bidirectional, true).
-prop(way241775699_3, type, way).
-prop(way241775699_4, from_node, node1422047083).
-prop(way241775699_4, to_node, node10869257010).
-prop(way241775699_4, bidirectional, true).
-prop(way241775699_4, type, way).
-prop(way241775699_5, from_node, node10869257010).
-prop(way241775699_5, to_node, node1422047083).
-prop(way241775699_5, bidirectional, true).
-prop(way241775699_5, type, way).
-prop(way241775699_6, from_node, node10869257010).
-prop(way241775699_6, to_node, node1449923824).
-prop(way241775699_6, bidirectional, true).
-prop(way241775699_6, type, way).
-prop(way241775699_7, from_node, node1449923824).
-prop(way241775699_7, to_node, node10869257010).
-prop(way241775699_7, bidirectional, true).
-prop(way241775699_7, type, way).
-prop(way241775701_0, from_node, node1422047051).
-prop(way241775701_0, to_node, node1422047049).
-prop(way241775701_0, type, way).
-prop(way241775702_0, from_node, node2493671552).
-prop(way241775702_0, to_node, node1422047060).
-prop(way241775702_0, bidirectional, true).
-prop(way241775702_0, type, way).
-prop(way241775702_1, from_node, node1422047060).
-prop(way241775702_1, to_node, node2493671552).
-prop(way241775702_1, bidirectional, true).
-prop(way241775702_1, type, way).
-prop(way241775702_2, from_node, node1422047060).
-prop(way241775702_2, to_node, node3873858650).
-prop(way241775702_2, bidirectional, true).
-prop(way241775702_2, type, way).
-prop(way241775702_3, from_node, node3873858650).
-prop(way241775702_3, to_node, node1422047060).
-prop(way241775702_3, bidirectional, true).
-prop(way241775702_3, type, way).
-prop(way241775702_4, from_node, node3873858650).
-prop(way241775702_4, to_node, node3873858649).
-prop(way241775702_4, bidirectional, true).
-prop(way241775702_4, type, way).
-prop(way241775702_5, from_node, node3873858649).
-prop(way241775702_5, to_node, node3873858650).
-prop(way241775702_5, bidirectional, true).
-prop(way241775702_5, type, way).
-prop(way241775702_6, from_node, node3873858649).
-prop(way241775702_6, to_node, node3873858648).
-prop(way241775702_6, bidirectional, true).
-prop(way241775702_6, type, way).
-prop(way241775702_7, from_node, node3873858648).
-prop(way241775702_7, to_node, node3873858649).
-prop(way241775702_7, bidirectional, true).
-prop(way241775702_7, type, way).
-prop(way241775702_8, from_node, node3873858648).
-prop(way241775702_8, to_node, node2493671554).
-prop(way241775702_8, bidirectional, true).
-prop(way241775702_8, type, way).
-prop(way241775702_9, from_node, node2493671554).
-prop(way241775702_9, to_node, node3873858648).
-prop(way241775702_9, bidirectional, true).
-prop(way241775702_9, type, way).
-prop(way241775703_0, from_node, node2493671555).
-prop(way241775703_0, to_node, node2493671556).
-prop(way241775703_0, bidirectional, true).
-prop(way241775703_0, type, way).
-prop(way241775703_1, from_node, node2493671556).
-prop(way241775703_1, to_node, node2493671555).
-prop(way241775703_1, bidirectional, true).
-prop(way241775703_1, type, way).
-prop(way241775704_0, from_node, node2493671558).
-prop(way241775704_0, to_node, node2493671561).
-prop(way241775704_0, bidirectional, true).
-prop(way241775704_0, type, way).
-prop(way241775704_1, from_node, node2493671561).
-prop(way241775704_1, to_node, node2493671558).
-prop(way241775704_1, bidirectional, true).
-prop(way241775704_1, type, way).
-prop(way241775704_2, from_node, node2493671561).
-prop(way241775704_2, to_node, node2493671566).
-prop(way241775704_2, bidirectional, true).
-prop(way241775704_2, type, way).
-prop(way241775704_3, from_node, node2493671566).
-prop(way241775704_3, to_node, node2493671561).
-prop(way241775704_3, bidirectional, true).
-prop(way241775704_3, type, way).
-prop(way241775704_4, from_node, node2493671566).
-prop(way241775704_4, to_node, node3873858648).
-prop(way241775704_4, bidirectional, true).
-prop(way241775704_4, type, way).
-prop(way241775704_5, from_node, node3873858648).
-prop(way241775704_5, to_node, node2493671566).
-prop(way241775704_5, bidirectional, true).
-prop(way241775704_5, type, way).
-prop(way241775704_6, from_node, node3873858648).
-prop(way241775704_6, to_node, node3873858653).
-prop(way241775704_6, bidirectional, true).
-prop(way241775704_6, type, way).
-prop(way241775704_7, from_node, node3873858653).
-prop(way241775704_7, to_node, node3873858648).
-prop(way241775704_7, bidirectional, true).
-prop(way241775704_7, type, way).
-prop(way241775704_8, from_node, node3873858653).
-prop(way241775704_8, to_node, node2493668432).
-prop(way241775704_8, bidirectional, true).
-prop(way241775704_8, type, way).
-prop(way241775704_9, from_node, node2493668432).
-prop(way241775704_9, to_node, node3873858653).
-prop(way241775704_9, bidirectional, true).
-prop(way241775704_9, type, way).
-prop(way241775705_0, from_node, node2481492030).
-prop(way241775705_0, to_node, node3873858643).
-prop(way241775705_0, type, way).
-prop(way241775705_1, from_node, node3873858643).
-prop(way241775705_1, to_node, node3873858644).
-prop(way241775705_1, type, way).
-prop(way241775705_2, from_node, node3873858644).
-prop(way241775705_2, to_node, node3873858646).
-prop(way241775705_2, type, way).
-prop(way241775705_3, from_node, node3873858646).
-prop(way241775705_3, to_node, node3873858649).
-prop(way241775705_3, type, way).
-prop(way241775705_4, from_node, node3873858649).
-prop(way241775705_4, to_node, node3873858654).
-prop(way241775705_4, type, way).
-prop(way241775705_5, from_node, node3873858654).
-prop(way241775705_5, to_node, node2493671559).
-prop(way241775705_5, type, way).
-prop(way241775706_0, from_node, node2493671560).
-prop(way241775706_0, to_node, node3873858645).
-prop(way241775706_0, bidirectional, true).
-prop(way241775706_0, type, way).
-prop(way241775706_1, from_node, node3873858645).
-prop(way241775706_1, to_node, node2493671560).
-prop(way241775706_1, bidirectional, true).
-prop(way241775706_1, type, way).
-prop(way241775706_2, from_node, node3873858645).
-prop(way241775706_2, to_node, node3873858644).
-prop(way241775706_2, bidirectional, true).
-prop(way241775706_2, type, way).
-prop(way241775706_3, from_node, node3873858644).
-prop(way241775706_3, to_node, node3873858645).
-prop(way241775706_3, bidirectional, true).
-prop(way241775706_3, type, way).
-prop(way241775706_4, from_node, node3873858644).
-prop(way241775706_4, to_node, node2493671561).
-prop(way241775706_4, bidirectional, true).
-prop(way241775706_4, type, way).
-prop(way241775706_5, from_node, node2493671561).
-prop(way241775706_5, to_node, node3873858644).
-prop(way241775706_5, bidirectional, true).
-prop(way241775706_5, type, way).
-prop(way241775707_0, from_node, node2493671565).
-prop(way241775707_0, to_node, node3873858647).
-prop(way241775707_0, bidirectional, true).
-prop(way241775707_0, type, way).
-prop(way241775707_1, from_node, node3873858647).
-prop(way241775707_1, to_node, node2493671565).
-prop(way241775707_1, bidirectional, true).
-prop(way241775707_1, type, way).
-prop(way241775707_2, from_node, node3873858647).
-prop(way241775707_2, to_node, node3873858646).
-prop(way241775707_2, bidirectional, true).
-prop(way241775707_2, type, way).
-prop(way241775707_3, from_node, node3873858646).
-prop(way241775707_3, to_node, node3873858647).
-prop(way241775707_3, bidirectional, true).
-prop(way241775707_3, type, way).
-prop(way241775707_4, from_node, node3873858646).
-prop(way241775707_4, to_node, node2493671566).
-prop(way241775707_4, bidirectional, true).
-prop(way241775707_4, type, way).
-prop(way241775707_5, from_node, node2493671566).
-prop(way241775707_5, to_node, node3873858646).
-prop(way241775707_5, bidirectional, true).
-prop(way241775707_5, type, way).
-prop(way241775708_0, from_node, node2493671568).
-prop(way241775708_0, to_node, node2493671572).
-prop(way241775708_0, bidirectional, true).
-prop(way241775708_0, type, way).
-prop(way241775708_1, from_node, node2493671572).
-prop(way241775708_1, to_node, node2493671568).
-prop(way241775708_1, bidirectional, true).
-prop(way241775708_1, type, way).
-prop(way241775708_2, from_node, node2493671572).
-prop(way241775708_2, to_node, node3873858656).
-prop(way241775708_2, bidirectional, true).
-prop(way241775708_2, type, way).
-prop(way241775708_3, from_node, node3873858656).
-prop(way241775708_3, to_node, node2493671572).
-prop(way241775708_3, bidirectional, true).
-prop(way241775708_3, type, way).
-prop(way241775708_4, from_node, node3873858656).
-prop(way241775708_4, to_node, node3873858655).
-prop(way241775708_4, bidirectional, true).
-prop(way241775708_4, type, way).
-prop(way241775708_5, from_node, node3873858655).
-prop(way241775708_5, to_node, node3873858656).
-prop(way241775708_5, bidirectional, true).
-prop(way241775708_5, type, way).
-prop(way241775708_6, from_node, node3873858655).
-prop(way241775708_6, to_node, node3873858654).
-prop(way241775708_6, bidirectional, true).
-prop(way241775708_6, type, way).
-prop(way241775708_7, from_node, node3873858654).
-prop(way241775708_7, to_node, node3873858655).
-prop(way241775708_7, bidirectional, true).
-prop(way241775708_7, type, way).
-prop(way241775708_8, from_node, node3873858654).
-prop(way241775708_8, to_node, node3873858653).
-prop(way241775708_8, bidirectional, true).
-prop(way241775708_8, type, way).
-prop(way241775708_9, from_node, node3873858653).
-prop(way241775708_9, to_node, node3873858654).
-prop(way241775708_9, bidirectional, true).
-prop(way241775708_9, type, way).
-prop(way241775708_10, from_node, node3873858653).
-prop(way241775708_10, to_node, node1346867471).
-prop(way241775708_10, bidirectional, true).
-prop(way241775708_10, type, way).
-prop(way241775708_11, from_node, node1346867471).
-prop(way241775708_11, to_node, node3873858653).
-prop(way241775708_11, bidirectional, true).
-prop(way241775708_11, type, way).
-prop(way241775709_0, from_node, node2493671572).
-prop(way241775709_0, to_node, node2493671573).
-prop(way241775709_0, bidirectional, true).
-prop(way241775709_0, type, way).
-prop(way241775709_1, from_node, node2493671573).
-prop(way241775709_1, to_node, node2493671572).
-prop(way241775709_1, bidirectional, true).
-prop(way241775709_1, type, way).
-prop(way404255974_0, from_node, node314203301).
-prop(way404255974_0, to_node, node314203326).
-prop(way404255974_0, type, way).
-prop(way410629799_0, from_node, node4124401739).
-prop(way410629799_0, to_node, node4124401693).
-prop(way410629799_0, bidirectional, true).
-prop(way410629799_0, type, way).
-prop(way410629799_1, from_node, node4124401693).
-prop(way410629799_1, to_node, node4124401739).
-prop(way410629799_1, bidirectional, true).
-prop(way410629799_1, type, way).
-prop(way410629800_0, from_node, node4124401693).
-prop(way410629800_0, to_node, node922748903).
-prop(way410629800_0, bidirectional, true).
-prop(way410629800_0, type, way).
-prop(way410629800_1, from_node, node922748903).
-prop(way410629800_1, to_node, node4124401693).
-prop(way410629800_1, bidirectional, true).
-prop(way410629800_1, type, way).
-prop(way410629801_0, from_node, node2484030804).
-prop(way410629801_0, to_node, node2144056449).
-prop(way410629801_0, bidirectional, true).
-prop(way410629801_0, type, way).
-prop(way410629801_1, from_node, node2144056449).
-prop(way410629801_1, to_node, node2484030804).
-prop(way410629801_1, bidirectional, true).
-prop(way410629801_1, type, way).
-prop(way410629802_0, from_node, node4124401737).
-prop(way410629802_0, to_node, node4124401734).
-prop(way410629802_0, bidirectional, true).
-prop(way410629802_0, type, way).
-prop(way410629802_1, from_node, node4124401734).
-prop(way410629802_1, to_node, node4124401737).
-prop(way410629802_1, bidirectional, true).
-prop(way410629802_1, type, way).
-prop(way410629803_0, from_node, node4124401734).
-prop(way410629803_0, to_node, node1878960338).
-prop(way410629803_0, bidirectional, true).
-prop(way410629803_0, type, way).
-prop(way410629803_1, from_node, node1878960338).
-prop(way410629803_1, to_node, node4124401734).
-prop(way410629803_1, bidirectional, true).
-prop(way410629803_1, type, way).
-prop(way487785102_0, from_node, node4801984446).
-prop(way487785102_0, to_node, node4801984447).
-prop(way487785102_0, bidirectional, true).
-prop(way487785102_0, type, way).
-prop(way487785102_1, from_node, node4801984447).
-prop(way487785102_1, to_node, node4801984446).
-prop(way487785102_1, bidirectional, true).
-prop(way487785102_1, type, way).
-prop(way487785104_0, from_node, node4801984447).
-prop(way487785104_0, to_node, node4801984449).
-prop(way487785104_0, bidirectional, true).
-prop(way487785104_0, type, way).
-prop(way487785104_1, from_node, node4801984449).
-prop(way487785104_1, to_node, node4801984447).
-prop(way487785104_1, bidirectional, true).
-prop(way487785104_1, type, way).
-prop(way1050979992_0, from_node, node9658018967).
-prop(way1050979992_0, to_node, node9658018965).
-prop(way1050979992_0, bidirectional, true).
-prop(way1050979992_0, type, way).
-prop(way1050979992_1, from_node, node9658018965).
-prop(way1050979992_1, to_node, node9658018967).
-prop(way1050979992_1, bidirectional, true).
-prop(way1050979992_1, type, way).
-prop(way1050979993_0, from_node, node304993190).
-prop(way1050979993_0, to_node, node304993930).
-prop(way1050979993_0, type, way).
-prop(way1050979993_1, from_node, node304993930).
-prop(way1050979993_1, to_node, node304993174).
-prop(way1050979993_1, type, way).
-prop(way1098627857_0, from_node, node2484097896).
-prop(way1098627857_0, to_node, node314203427).
-prop(way1098627857_0, type, way).
-prop(way1168802823_0, from_node, node10869257012).
-prop(way1168802823_0, to_node, node10869257011).
-prop(way1168802823_0, bidirectional, true).
-prop(way1168802823_0, type, way).
-prop(way1168802823_1, from_node, node10869257011).
-prop(way1168802823_1, to_node, node10869257012).
-prop(way1168802823_1, bidirectional, true).
-prop(way1168802823_1, type, way).
-prop(way1168802823_2, from_node, node10869257011).
-prop(way1168802823_2, to_node, node10869257010).
-prop(way1168802823_2, bidirectional, true).
-prop(way1168802823_2, type, way).
-prop(way1168802823_3, from_node, node10869257010).
-prop(way1168802823_3, to_node, node10869257011).
-prop(way1168802823_3, bidirectional, true).
-prop(way1168802823_3, type, way).
-prop(way1168802823_4, from_node, node10869257010).
-prop(way1168802823_4, to_node, node10869257009).
-prop(way1168802823_4, bidirectional, true).
-prop(way1168802823_4, type, way).
-prop(way1168802823_5, from_node, node10869257009).
-prop(way1168802823_5, to_node, node10869257010).
-prop(way1168802823_5, bidirectional, true).
-prop(way1168802823_5, type, way).
-prop(way1168802823_6, from_node, node10869257009).
-prop(way1168802823_6, to_node, node10869257008).
-prop(way1168802823_6, bidirectional, true).
-prop(way1168802823_6, type, way).
-prop(way1168802823_7, from_node, node10869257008).
-prop(way1168802823_7, to_node, node10869257009).
-prop(way1168802823_7, bidirectional, true).
-prop(way1168802823_7, type, way).
-prop(way1188987298_0, from_node, node11040297842).
-prop(way1188987298_0, to_node, node11040297840).
-prop(way1188987298_0, type, way).
-prop(way1235799117_0, from_node, node304993174).
-prop(way1235799117_0, to_node, node11324082776).
-prop(way1235799117_0, type, way).
-prop(way1235799118_0, from_node, node11472722265).
-prop(way1235799118_0, to_node, node11472722267).
-prop(way1235799118_0, bidirectional, true).
-prop(way1235799118_0, type, way).
-prop(way1235799118_1, from_node, node11472722267).
-prop(way1235799118_1, to_node, node11472722265).
-prop(way1235799118_1, bidirectional, true).
-prop(way1235799118_1, type, way).
-prop(way1235799120_0, from_node, node11324082776).
-prop(way1235799120_0, to_node, node11472722265).
-prop(way1235799120_0, bidirectional, true).
-prop(way1235799120_0, type, way).
-prop(way1235799120_1, from_node, node11472722265).
-prop(way1235799120_1, to_node, node11324082776).
-prop(way1235799120_1, bidirectional, true).
-prop(way1235799120_1, type, way).
+% format=5 osm_sha256=96a07c47a647e7b66d73c79350076e326223cb7a1a7d5108bcbe3f3f3b61e746 on_foot=false
+node(node922748928, 41.2057967, 16.600514).
+node(node922748934, 41.2063517, 16.5995411).
+node(node4124388891, 41.2041048, 16.5968235).
+node(node4124401693, 41.2062616, 16.5994768).
+node(node922748969, 41.2056312, 16.6005756).
+node(node2481492030, 41.2023707, 16.5945097).
+node(node304994369, 41.205225, 16.5954616).
+node(node304994370, 41.2051997, 16.5972465).
+node(node4124401734, 41.206303, 16.5985766).
+node(node1363493448, 41.2051088, 16.6005237).
+node(node4124401737, 41.2063037, 16.5986013).
+node(node4124401739, 41.206306, 16.5995085).
+node(node2493668430, 41.2042961, 16.59601).
+node(node2493668432, 41.2034771, 16.5953616).
+node(node2271230545, 41.2023131, 16.597453).
+node(node2144056401, 41.205981, 16.5979763).
+node(node2493668433, 41.2039062, 16.5946498).
+node(node2493668435, 41.2038212, 16.5954157).
+node(node2493668437, 41.2034542, 16.5969379).
+node(node3873858645, 41.2027538, 16.5945202).
+node(node3873858647, 41.2028876, 16.5945899).
+node(node11324082776, 41.2046134, 16.5995019).
+node(node3873858643, 41.2025451, 16.5946228).
+node(node2271230554, 41.2029098, 16.5973791).
+node(node3873858650, 41.2030451, 16.594672).
+node(node3873858649, 41.202987, 16.5948687).
+node(node3873858648, 41.2029407, 16.5950841).
+node(node3873858653, 41.2031615, 16.5951983).
+node(node3873858655, 41.2032297, 16.5947652).
+node(node3873858656, 41.2032523, 16.5945691).
+node(node3873858654, 41.2031902, 16.5949928).
+node(node1338434660, 41.202824, 16.597616).
+node(node1346836068, 41.2046419, 16.594555).
+node(node1346836073, 41.2035351, 16.5947179).
+node(node2496532075, 41.2047117, 16.6003952).
+node(node2493671548, 41.2031972, 16.5980818).
+node(node2493671549, 41.2034388, 16.5977544).
+node(node2493671550, 41.2033436, 16.5981359).
+node(node2493671552, 41.2031505, 16.5942113).
+node(node2144056449, 41.2055654, 16.5979767).
+node(node2493671554, 41.2027273, 16.5959317).
+node(node2493671555, 41.2027442, 16.5952055).
+node(node2493671556, 41.2025846, 16.5958597).
+node(node2493671558, 41.2024535, 16.5948033).
+node(node2493671559, 41.2034991, 16.5951536).
+node(node2493671560, 41.2028253, 16.5943462).
+node(node2493671561, 41.2026074, 16.594889).
+node(node304993930, 41.2040079, 16.600977).
+node(node2493671565, 41.2029382, 16.5943998).
+node(node2493671566, 41.2027817, 16.5949862).
+node(node2493671568, 41.2032872, 16.594197).
+node(node1363512977, 41.2032397, 16.5979403).
+node(node1363512465, 41.2031839, 16.5975731).
+node(node304993939, 41.2035537, 16.6027248).
+node(node1363512467, 41.2033488, 16.5971827).
+node(node1449923733, 41.2019482, 16.5971579).
+node(node304993942, 41.2032822, 16.6031549).
+node(node2493671572, 41.2032664, 16.594436).
+node(node2493671573, 41.2035589, 16.5944976).
+node(node4124392601, 41.2044658, 16.600635).
+node(node9658018967, 41.2042295, 16.6004289).
+node(node9658018965, 41.2042503, 16.5998711).
+node(node1363512478, 41.2026986, 16.5969996).
+node(node314203299, 41.2023656, 16.5986424).
+node(node1363512484, 41.2036007, 16.5982385).
+node(node314203301, 41.2029852, 16.5987932).
+node(node314203305, 41.2026801, 16.5981626).
+node(node1363512492, 41.2027671, 16.5968341).
+node(node314203309, 41.2027081, 16.5987711).
+node(node1363512495, 41.2030501, 16.59701).
+node(node1878960306, 41.2051902, 16.6005073).
+node(node1363513016, 41.2039971, 16.595881).
+node(node1363513018, 41.2049484, 16.5962357).
+node(node1363512508, 41.2021165, 16.5955419).
+node(node1878960318, 41.2057448, 16.5989255).
+node(node314203326, 41.2047653, 16.5985591).
+node(node1363512511, 41.2026212, 16.5971867).
+node(node1878960322, 41.2059603, 16.5981213).
+node(node1878960325, 41.2059907, 16.5979169).
+node(node3873858644, 41.2026832, 16.5946984).
+node(node1451662540, 41.2050645, 16.6004863).
+node(node1878960334, 41.2061216, 16.5981605).
+node(node1363512527, 41.2010678, 16.5958121).
+node(node1363512529, 41.2026339, 16.5944415).
+node(node1878960338, 41.2063353, 16.5982199).
+node(node3873858646, 41.2028373, 16.5947799).
+node(node1878960342, 41.2063835, 16.5982342).
+node(node1363512540, 41.2029823, 16.5972073).
+node(node1363512542, 41.2009314, 16.5959603).
+node(node353122529, 41.2015829, 16.6048893).
+node(node314203365, 41.2045841, 16.5930148).
+node(node1338434277, 41.203126, 16.596823).
+node(node1449923824, 41.2017848, 16.5962098).
+node(node2484053754, 41.2061055, 16.5988749).
+node(node2484053760, 41.2058231, 16.5987112).
+node(node2484055808, 41.2054627, 16.5986432).
+node(node1346867462, 41.202533, 16.5973942).
+node(node2484055814, 41.2049823, 16.5994014).
+node(node565476617, 41.2117916, 16.5915103).
+node(node1346867465, 41.2028384, 16.5966573).
+node(node2144056587, 41.2052965, 16.59849).
+node(node1346867468, 41.2030507, 16.5960962).
+node(node1346867471, 41.2031349, 16.5954189).
+node(node1155831069, 41.2027625, 16.5925241).
+node(node314203427, 41.2035794, 16.5941728).
+node(node10869257008, 41.2023835, 16.5970146).
+node(node2144056625, 41.2058332, 16.5979376).
+node(node10869257009, 41.2024523, 16.5968262).
+node(node10869257011, 41.2025513, 16.5964941).
+node(node10869257012, 41.2027118, 16.5959248).
+node(node10869257010, 41.2024992, 16.5966667).
+node(node1338435895, 41.2048191, 16.5983337).
+node(node4124369726, 41.2025424, 16.5943811).
+node(node1422047049, 41.2028694, 16.5959967).
+node(node1422047051, 41.2030329, 16.5953563).
+node(node1363512978, 41.2030802, 16.5978201).
+node(node308414801, 41.2011768, 16.5956927).
+node(node308414804, 41.2015173, 16.5952212).
+node(node2484030804, 41.2055922, 16.5979294).
+node(node1422047060, 41.2030989, 16.5944572).
+node(node11472722265, 41.2044915, 16.5994842).
+node(node11472722267, 41.2042205, 16.5994449).
+node(node1422047069, 41.2027491, 16.5978221).
+node(node1346825054, 41.2035199, 16.5949281).
+node(node1363534176, 41.2033133, 16.597666).
+node(node1363534177, 41.2036518, 16.5978955).
+node(node2484097889, 41.2038692, 16.5949841).
+node(node2484097896, 41.2041783, 16.5921526).
+node(node1422047082, 41.2025489, 16.596898).
+node(node1422047083, 41.2026222, 16.5967438).
+node(node1422047084, 41.202469, 16.5970758).
+node(node1422047085, 41.2026822, 16.59657).
+node(node1422047086, 41.2023857, 16.5972805).
+node(node11040297840, 41.2033402, 16.5955275).
+node(node11040297842, 41.2031913, 16.5961706).
+node(node4124374398, 41.2030136, 16.5960735).
+node(node305594255, 41.2064003, 16.5972516).
+node(node304993174, 41.2043548, 16.6003972).
+node(node1346840985, 41.2027182, 16.5942972).
+node(node304993179, 41.2050165, 16.5973645).
+node(node304993181, 41.2048285, 16.5955815).
+node(node304993183, 41.2039463, 16.600511).
+node(node304993184, 41.2028351, 16.6004249).
+node(node304993188, 41.2027497, 16.6022869).
+node(node304993190, 41.2032039, 16.6026107).
+node(node2484044204, 41.2051872, 16.6002021).
+node(node2484044206, 41.2057468, 16.6003768).
+node(node2484044217, 41.2062225, 16.5994378).
+node(node2484052922, 41.2054572, 16.5986313).
+node(node1311858619, 41.2008434, 16.5960638).
+node(node922748859, 41.2060622, 16.5992595).
+node(node305594300, 41.2056064, 16.5987789).
+node(node4801984446, 41.2061361, 16.5977493).
+node(node4801984447, 41.206136, 16.5978639).
+node(node315819969, 41.2033337, 16.596246).
+node(node2484052930, 41.2056746, 16.597892).
+node(node315819971, 41.2046795, 16.5951381).
+node(node4801984449, 41.2061866, 16.597895).
+node(node315819975, 41.2045744, 16.5933902).
+node(node315819980, 41.2016037, 16.5951901).
+node(node305594342, 41.2050139, 16.6000023).
+node(node922748903, 41.2062496, 16.5994683).
+node(node305594350, 41.2048511, 16.5981491).
+edge(node304993174, node9658018967, way27776733_0, 14.182873421766764, false).
+edge(node9658018967, node304993183, way27776733_1, 32.230746583691925, false).
+edge(node304993183, node304993184, way27776733_2, 123.7695854953778, false).
+edge(node11324082776, node314203326, way27776786_0, 80.661700301757, false).
+edge(node314203326, node1338435895, way27776786_1, 19.782843584266697, false).
+edge(node1338435895, node305594350, way27776786_2, 15.847984742693015, false).
+edge(node305594350, node304993179, way27776786_3, 68.16634677815759, false).
+edge(node304993188, node353122529, way27776787_0, 253.44793972581704, true).
+edge(node353122529, node304993188, way27776787_1, 253.44793972581704, true).
+edge(node304993930, node304993183, way27776789_0, 39.582544109715336, false).
+edge(node304993942, node304993939, way27776791_0, 46.96944087197162, false).
+edge(node304993181, node304994369, way27776830_0, 45.215426483743045, false).
+edge(node304994369, node304994370, way27776831_0, 149.34776467451883, false).
+edge(node304993179, node304994370, way27776832_0, 22.6367797182055, true).
+edge(node304994370, node304993179, way27776832_1, 22.6367797182055, true).
+edge(node305594255, node1878960342, way27833773_0, 82.22214909354136, true).
+edge(node1878960342, node305594255, way27833773_1, 82.22214909354136, true).
+edge(node922748969, node922748928, way27833774_0, 19.11067913413472, true).
+edge(node922748928, node922748969, way27833774_1, 19.11067913413472, true).
+edge(node314203305, node314203299, way28082645_0, 53.237579074475526, false).
+edge(node314203309, node314203301, way28599416_0, 30.867537116545453, false).
+edge(node314203365, node304994369, way28599422_0, 216.74621634002648, true).
+edge(node304994369, node314203365, way28599422_1, 216.74621634002648, true).
+edge(node315819969, node11040297842, way28724772_0, 17.044397272339534, false).
+edge(node11040297842, node1346867468, way28724772_1, 16.827501366193616, false).
+edge(node1346867468, node4124374398, way28724772_2, 4.541469754039349, false).
+edge(node4124374398, node1422047049, way28724772_3, 17.27373005701122, false).
+edge(node1422047049, node2493671554, way28724772_4, 16.710380488758393, false).
+edge(node2493671554, node10869257012, way28724772_5, 1.8176242676978738, false).
+edge(node10869257012, node2493671556, way28724772_6, 15.156363197680884, false).
+edge(node2493671556, node1363512508, way28724772_7, 58.44778750870651, false).
+edge(node1363512508, node315819980, way28724772_8, 64.16879126974385, false).
+edge(node315819980, node308414804, way28724772_9, 9.953342755749095, false).
+edge(node304993179, node1363513018, way28724773_0, 94.73666447163946, false).
+edge(node1363513018, node304993181, way28724773_1, 56.32986433472177, false).
+edge(node304993181, node315819971, way28724773_2, 40.62613568721876, false).
+edge(node315819971, node1346836068, way28724773_3, 48.96026482834053, false).
+edge(node1346836068, node315819975, way28724773_4, 97.73443482533368, false).
+edge(node314203305, node314203309, way28724775_0, 51.0030053762863, false).
+edge(node315819969, node1338434277, way28724776_0, 53.5125143611355, false).
+edge(node1338434277, node1363512495, way28724776_1, 17.775850194595513, false).
+edge(node315819980, node2481492030, way28724779_0, 102.53829331237478, false).
+edge(node2481492030, node4124369726, way28724779_1, 21.914935444000843, false).
+edge(node4124369726, node1346840985, way28724779_2, 20.770073809001772, false).
+edge(node1346840985, node2493671552, way28724779_3, 48.603793132456516, false).
+edge(node2493671552, node2493671568, way28724779_4, 15.247353153769549, false).
+edge(node2493671568, node314203427, way28724779_5, 32.55417399136198, false).
+edge(node922748928, node2484044206, way78684086_0, 12.748602336889274, true).
+edge(node2484044206, node922748928, way78684086_1, 12.748602336889274, true).
+edge(node1155831069, node314203427, way116105647_0, 165.15470580618262, false).
+edge(node308414801, node10869257011, way116353076_0, 166.89691085970347, false).
+edge(node10869257011, node1422047085, way116353076_1, 15.880218561889444, false).
+edge(node1422047085, node1346867465, way116353076_2, 18.841783688645684, false).
+edge(node1346867465, node1338434277, way116353076_3, 34.854995864054246, false).
+edge(node314203309, node304993184, way116767599_0, 139.0776647376779, false).
+edge(node314203427, node2493671573, way116768230_0, 27.2682637824184, false).
+edge(node2493671573, node1346836073, way116768230_1, 18.619372629852656, false).
+edge(node1346836073, node1346825054, way116768230_2, 17.66641200171269, false).
+edge(node1346825054, node2493671559, way116768230_3, 19.006629474541658, false).
+edge(node2493671559, node2493668432, way116768230_4, 17.572443356418823, false).
+edge(node2493668432, node315819969, way116768230_5, 75.68791343762362, false).
+edge(node922748934, node4124401739, way117200843_0, 5.767182556131943, true).
+edge(node4124401739, node922748934, way117200843_1, 5.767182556131943, true).
+edge(node1363512977, node1363512978, way119051578_0, 20.388099364722947, false).
+edge(node1363512978, node1338434660, way119051578_1, 33.2134996817785, false).
+edge(node1338435895, node315819969, way119051749_0, 240.38611369275907, false).
+edge(node1346825054, node3873858655, way120031087_0, 35.02860817577136, false).
+edge(node3873858655, node3873858650, way120031087_1, 21.957609517296454, false).
+edge(node3873858650, node3873858647, way120031087_2, 18.81194712177872, false).
+edge(node3873858647, node3873858645, way120031087_3, 15.979799910296046, false).
+edge(node3873858645, node1363512529, way120031087_4, 14.869445219765419, false).
+edge(node1363512529, node4124369726, way120031087_5, 11.360080388525846, false).
+edge(node315819971, node2484097889, way120031380_0, 91.01769229549431, false).
+edge(node2484097889, node1346825054, way120031380_1, 39.12191942320994, false).
+edge(node1346836073, node2493668433, way120031506_0, 41.65588035342521, false).
+edge(node2493668433, node1346836068, way120031506_1, 82.18964877212308, false).
+edge(node1346840985, node2493671560, way120031696_0, 12.594792022883489, false).
+edge(node2493671560, node2493671565, way120031696_1, 13.33075088540034, false).
+edge(node2493671565, node1422047060, way120031696_2, 18.503041100798868, false).
+edge(node1422047060, node3873858656, way120031696_3, 19.457430999535898, false).
+edge(node3873858656, node1346836073, way120031696_4, 33.82034110108807, false).
+edge(node305594255, node565476617, way120031864_0, 768.1464624413411, true).
+edge(node565476617, node305594255, way120031864_1, 768.1464624413411, true).
+edge(node1346867471, node4124374398, way120032409_0, 56.40087822808899, true).
+edge(node4124374398, node1346867471, way120032409_1, 56.40087822808899, true).
+edge(node1346867468, node1346867465, way120032413_0, 52.54371618788294, false).
+edge(node1346867465, node1363512492, way120032413_1, 16.78209051836195, false).
+edge(node1363512492, node1363512478, way120032413_2, 15.802730911890366, false).
+edge(node1363512478, node1363512511, way120032413_3, 17.863064319562746, false).
+edge(node1363512511, node1346867462, way120032413_4, 19.938548761744528, false).
+edge(node1363493448, node1451662540, way121904639_0, 5.835609315240743, true).
+edge(node1451662540, node1363493448, way121904639_1, 5.835609315240743, true).
+edge(node1451662540, node2496532075, way121904639_2, 39.963022706850786, true).
+edge(node2496532075, node1451662540, way121904639_3, 39.963022706850786, true).
+edge(node1363512540, node1363512478, way121906590_0, 36.015131879139744, false).
+edge(node1363512478, node1422047082, way121906590_1, 18.690512311319793, false).
+edge(node1422047082, node10869257009, way121906590_2, 12.306954667794564, false).
+edge(node10869257009, node1363512527, way121906590_3, 175.7799596935951, false).
+edge(node1363512529, node3873858643, way121906591_0, 18.098635586473968, false).
+edge(node3873858643, node2493671558, way121906591_1, 18.2148522436431, false).
+edge(node2493671558, node1363512508, way121906591_2, 72.26706419630862, false).
+edge(node1363534177, node2493671549, way121906592_0, 26.463211422035933, false).
+edge(node2493671549, node1363534176, way121906592_1, 15.793530347330725, false).
+edge(node1363534176, node1363512465, way121906592_2, 16.353516680485193, false).
+edge(node1363512467, node1363512495, way121906593_0, 36.22036729006663, true).
+edge(node1363512495, node1363512467, way121906593_1, 36.22036729006663, true).
+edge(node2493668437, node1363512467, way121906595_0, 23.59639672829071, true).
+edge(node1363512467, node2493668437, way121906595_1, 23.59639672829071, true).
+edge(node1363512467, node1363512465, way121906595_2, 37.45605989878201, true).
+edge(node1363512465, node1363512467, way121906595_3, 37.45605989878201, true).
+edge(node1363512465, node1363512978, way121906595_4, 23.663706676781636, true).
+edge(node1363512978, node1363512465, way121906595_5, 23.663706676781636, true).
+edge(node1363512978, node2493671548, way121906595_6, 25.467677946609225, true).
+edge(node2493671548, node1363512978, way121906595_7, 25.467677946609225, true).
+edge(node2493671548, node2493671550, way121906595_8, 16.89641361398305, true).
+edge(node2493671550, node2493671548, way121906595_9, 16.89641361398305, true).
+edge(node2493671550, node1363512484, way121906595_10, 29.84900864264549, true).
+edge(node1363512484, node2493671550, way121906595_11, 29.84900864264549, true).
+edge(node1363513018, node2493668430, way121906624_0, 74.94984011551422, true).
+edge(node2493668430, node1363513018, way121906624_1, 74.94984011551422, true).
+edge(node2493668430, node1363513016, way121906624_2, 34.95497820353624, true).
+edge(node1363513016, node2493668430, way121906624_3, 34.95497820353624, true).
+edge(node1311858619, node1422047086, way121908198_0, 199.43053739342062, false).
+edge(node1422047086, node1346867462, way121908198_1, 18.940863568986355, false).
+edge(node1346867462, node1338434660, way121908198_2, 37.30080723481039, false).
+edge(node1363512542, node10869257008, way121908696_0, 183.98784049110583, false).
+edge(node10869257008, node1422047084, way121908696_1, 10.798219406823439, false).
+edge(node1422047084, node1363512511, way121908696_2, 19.300249702018014, false).
+edge(node1363512511, node2271230554, way121908696_3, 35.90149730439825, false).
+edge(node1422047069, node2271230545, way128759834_0, 57.4799694154695, false).
+edge(node2271230545, node1449923733, way128759834_1, 47.49592251979998, false).
+edge(node1422047049, node1422047085, way128762650_0, 52.28515593771153, false).
+edge(node1422047085, node1422047083, way128762650_1, 15.997905659540002, false).
+edge(node1422047083, node1422047082, way128762650_2, 15.259663017025389, false).
+edge(node1422047082, node1422047084, way128762650_3, 17.326281252497783, false).
+edge(node1422047084, node1422047086, way128762650_4, 19.46993794104095, false).
+edge(node1422047086, node2271230545, way128762650_5, 16.53607366481449, false).
+edge(node922748859, node2484044204, way130873544_0, 125.23829236123518, true).
+edge(node2484044204, node922748859, way130873544_1, 125.23829236123518, true).
+edge(node922748859, node2484053754, way177434729_0, 32.53271611119118, true).
+edge(node2484053754, node922748859, way177434729_1, 32.53271611119118, true).
+edge(node2484053754, node1878960334, way177434729_2, 59.7913001004015, true).
+edge(node1878960334, node2484053754, way177434729_3, 59.7913001004015, true).
+edge(node1878960318, node2484053760, way177434730_0, 19.93010272059978, true).
+edge(node2484053760, node1878960318, way177434730_1, 19.93010272059978, true).
+edge(node2484053760, node1878960322, way177434730_2, 51.65369971500351, true).
+edge(node1878960322, node2484053760, way177434730_3, 51.65369971500351, true).
+edge(node1878960322, node2144056401, way177434730_4, 12.346725126328847, true).
+edge(node2144056401, node1878960322, way177434730_5, 12.346725126328847, true).
+edge(node2144056401, node1878960325, way177434730_6, 5.084938881793607, true).
+edge(node1878960325, node2144056401, way177434730_7, 5.084938881793607, true).
+edge(node922748903, node4124401737, way177434731_0, 72.77939618490527, true).
+edge(node4124401737, node922748903, way177434731_1, 72.77939618490527, true).
+edge(node1878960318, node2484044204, way177434732_0, 123.49081724180098, true).
+edge(node2484044204, node1878960318, way177434732_1, 123.49081724180098, true).
+edge(node2484044204, node1878960306, way177434732_2, 25.534627341802143, true).
+edge(node1878960306, node2484044204, way177434732_3, 25.534627341802143, true).
+edge(node922748903, node2484044217, way180435847_0, 3.9485166475469797, true).
+edge(node2484044217, node922748903, way180435847_1, 3.9485166475469797, true).
+edge(node2484044217, node922748859, way180435847_2, 23.24224832296855, true).
+edge(node922748859, node2484044217, way180435847_3, 23.24224832296855, true).
+edge(node922748859, node1878960318, way180435847_4, 45.0149095721795, true).
+edge(node1878960318, node922748859, way180435847_5, 45.0149095721795, true).
+edge(node1878960318, node305594300, way180435847_6, 19.678495074624887, true).
+edge(node305594300, node1878960318, way180435847_7, 19.678495074624887, true).
+edge(node922748928, node922748934, way180435849_0, 102.14120173602043, true).
+edge(node922748934, node922748928, way180435849_1, 102.14120173602043, true).
+edge(node1878960342, node1878960338, way180435853_0, 5.491481722051496, true).
+edge(node1878960338, node1878960342, way180435853_1, 5.491481722051496, true).
+edge(node1878960338, node1878960334, way180435854_0, 24.276379806608254, true).
+edge(node1878960334, node1878960338, way180435854_1, 24.276379806608254, true).
+edge(node1878960334, node1878960322, way180435854_2, 18.23307417626079, true).
+edge(node1878960322, node1878960334, way180435854_3, 18.23307417626079, true).
+edge(node2144056401, node2144056625, way185504729_0, 16.750463495796588, true).
+edge(node2144056625, node2144056401, way185504729_1, 16.750463495796588, true).
+edge(node2144056625, node2484052930, way185504729_2, 18.043389839252676, true).
+edge(node2484052930, node2144056625, way185504729_3, 18.043389839252676, true).
+edge(node2484052930, node2484030804, way185504729_4, 9.681944200386065, true).
+edge(node2484030804, node2484052930, way185504729_5, 9.681944200386065, true).
+edge(node2144056625, node305594300, way204398520_0, 74.76282801131688, true).
+edge(node305594300, node2144056625, way204398520_1, 74.76282801131688, true).
+edge(node2484044206, node2484044217, way240693096_0, 94.70298447977486, true).
+edge(node2484044217, node2484044206, way240693096_1, 94.70298447977486, true).
+edge(node2484044206, node1878960306, way240693099_0, 62.84660659746794, true).
+edge(node1878960306, node2484044206, way240693099_1, 62.84660659746794, true).
+edge(node1878960306, node1363493448, way240693099_2, 9.154660062933198, true).
+edge(node1363493448, node1878960306, way240693099_3, 9.154660062933198, true).
+edge(node2144056449, node2144056587, way240694287_0, 52.32594487938092, true).
+edge(node2144056587, node2144056449, way240694287_1, 52.32594487938092, true).
+edge(node2144056587, node305594350, way240694288_0, 57.150547785794224, true).
+edge(node305594350, node2144056587, way240694288_1, 57.150547785794224, true).
+edge(node2144056587, node2484055814, way240694289_0, 83.86944308927254, true).
+edge(node2484055814, node2144056587, way240694289_1, 83.86944308927254, true).
+edge(node2484055814, node305594342, way240694289_2, 50.392942737811424, true).
+edge(node305594342, node2484055814, way240694289_3, 50.392942737811424, true).
+edge(node305594342, node1451662540, way240694289_4, 40.8796566559381, true).
+edge(node1451662540, node305594342, way240694289_5, 40.8796566559381, true).
+edge(node2484052922, node2484052930, way240694290_0, 66.40447988426808, true).
+edge(node2484052930, node2484052922, way240694290_1, 66.40447988426808, true).
+edge(node305594300, node2484055808, way240694291_0, 19.600889856919277, true).
+edge(node2484055808, node305594300, way240694291_1, 19.600889856919277, true).
+edge(node2484055808, node2484052922, way240694291_2, 1.1683726558738512, true).
+edge(node2484052922, node2484055808, way240694291_3, 1.1683726558738512, true).
+edge(node2484052922, node2144056587, way240694291_4, 21.42509341210105, true).
+edge(node2144056587, node2484052922, way240694291_5, 21.42509341210105, true).
+edge(node305594300, node305594342, way240694292_0, 121.71894132748193, true).
+edge(node305594342, node305594300, way240694292_1, 121.71894132748193, true).
+edge(node2484053754, node2484053760, way240694319_0, 34.2577696933322, true).
+edge(node2484053760, node2484053754, way240694319_1, 34.2577696933322, true).
+edge(node2484055808, node2484055814, way240694409_0, 82.92642795345823, true).
+edge(node2484055814, node2484055808, way240694409_1, 82.92642795345823, true).
+edge(node2493668430, node2493668435, way241775264_0, 72.52922428956602, true).
+edge(node2493668435, node2493668430, way241775264_1, 72.52922428956602, true).
+edge(node2493668435, node2493668432, way241775264_2, 38.52893375832318, true).
+edge(node2493668432, node2493668435, way241775264_3, 38.52893375832318, true).
+edge(node2493668433, node2484097889, way241775265_0, 28.268449936379458, true).
+edge(node2484097889, node2493668433, way241775265_1, 28.268449936379458, true).
+edge(node2484097889, node2493668435, way241775265_2, 36.49991941771218, true).
+edge(node2493668435, node2484097889, way241775265_3, 36.49991941771218, true).
+edge(node1363534176, node1363512977, way241775696_0, 24.36373407561196, true).
+edge(node1363512977, node1363534176, way241775696_1, 24.36373407561196, true).
+edge(node1363512977, node2493671548, way241775696_2, 12.746399829976669, true).
+edge(node2493671548, node1363512977, way241775696_3, 12.746399829976669, true).
+edge(node2493671549, node2493671550, way241775697_0, 33.626138699741226, true).
+edge(node2493671550, node2493671549, way241775697_1, 33.626138699741226, true).
+edge(node1363512495, node1363512540, way241775698_0, 18.146468711939082, false).
+edge(node1363512540, node2271230554, way241775698_1, 16.479431482126213, false).
+edge(node2271230554, node1338434660, way241775698_2, 21.99605478324832, false).
+edge(node1338434660, node1422047069, way241775698_3, 19.14862791901915, false).
+edge(node1422047069, node314203305, way241775698_4, 29.50179729367336, false).
+edge(node1363512495, node1363512492, way241775699_0, 34.73910106546828, true).
+edge(node1363512492, node1363512495, way241775699_1, 34.73910106546828, true).
+edge(node1363512492, node1422047083, way241775699_2, 17.795319415425695, true).
+edge(node1422047083, node1363512492, way241775699_3, 17.795319415425695, true).
+edge(node1422047083, node10869257010, way241775699_4, 15.121706605042549, true).
+edge(node10869257010, node1422047083, way241775699_5, 15.121706605042549, true).
+edge(node10869257010, node1449923824, way241775699_6, 88.15613400904115, true).
+edge(node1449923824, node10869257010, way241775699_7, 88.15613400904115, true).
+edge(node1422047051, node1422047049, way241775701_0, 56.577063580910526, false).
+edge(node2493671552, node1422047060, way241775702_0, 21.357317362270628, true).
+edge(node1422047060, node2493671552, way241775702_1, 21.357317362270628, true).
+edge(node1422047060, node3873858650, way241775702_2, 18.939926657439543, true).
+edge(node3873858650, node1422047060, way241775702_3, 18.939926657439543, true).
+edge(node3873858650, node3873858649, way241775702_4, 17.678802640632224, true).
+edge(node3873858649, node3873858650, way241775702_5, 17.678802640632224, true).
+edge(node3873858649, node3873858648, way241775702_6, 18.741558183179002, true).
+edge(node3873858648, node3873858649, way241775702_7, 18.741558183179002, true).
+edge(node3873858648, node2493671554, way241775702_8, 74.77603895320274, true).
+edge(node2493671554, node3873858648, way241775702_9, 74.77603895320274, true).
+edge(node2493671555, node2493671556, way241775703_0, 57.53654037610931, true).
+edge(node2493671556, node2493671555, way241775703_1, 57.53654037610931, true).
+edge(node2493671558, node2493671561, way241775704_0, 18.554169301248525, true).
+edge(node2493671561, node2493671558, way241775704_1, 18.554169301248525, true).
+edge(node2493671561, node2493671566, way241775704_2, 21.018117327984, true).
+edge(node2493671566, node2493671561, way241775704_3, 21.018117327984, true).
+edge(node2493671566, node3873858648, way241775704_4, 19.484997110502007, true).
+edge(node3873858648, node2493671566, way241775704_5, 19.484997110502007, true).
+edge(node3873858648, node3873858653, way241775704_6, 26.3452653889587, true).
+edge(node3873858653, node3873858648, way241775704_7, 26.3452653889587, true).
+edge(node3873858653, node2493668432, way241775704_8, 37.65860547056361, true).
+edge(node2493668432, node3873858653, way241775704_9, 37.65860547056361, true).
+edge(node2481492030, node3873858643, way241775705_0, 21.577692009922355, false).
+edge(node3873858643, node3873858644, way241775705_1, 16.607541325399897, false).
+edge(node3873858644, node3873858646, way241775705_2, 18.44189155894233, false).
+edge(node3873858646, node3873858649, way241775705_3, 18.228461663400225, false).
+edge(node3873858649, node3873858654, way241775705_4, 24.865992628169124, false).
+edge(node3873858654, node2493671559, way241775705_5, 36.88855229013933, false).
+edge(node2493671560, node3873858645, way241775706_0, 16.586648003540514, true).
+edge(node3873858645, node2493671560, way241775706_1, 16.586648003540514, true).
+edge(node3873858645, node3873858644, way241775706_2, 16.84902319994447, true).
+edge(node3873858644, node3873858645, way241775706_3, 16.84902319994447, true).
+edge(node3873858644, node2493671561, way241775706_4, 18.036381414426593, true).
+edge(node2493671561, node3873858644, way241775706_5, 18.036381414426593, true).
+edge(node2493671565, node3873858647, way241775707_0, 16.869881139866166, true).
+edge(node3873858647, node2493671565, way241775707_1, 16.869881139866166, true).
+edge(node3873858647, node3873858646, way241775707_2, 16.850904230430164, true).
+edge(node3873858646, node3873858647, way241775707_3, 16.850904230430164, true).
+edge(node3873858646, node2493671566, way241775707_4, 18.333184712127373, true).
+edge(node2493671566, node3873858646, way241775707_5, 18.333184712127373, true).
+edge(node2493671568, node2493671572, way241775708_0, 20.128189301690888, true).
+edge(node2493671572, node2493671568, way241775708_1, 20.128189301690888, true).
+edge(node2493671572, node3873858656, way241775708_2, 11.245055234644466, true).
+edge(node3873858656, node2493671572, way241775708_3, 11.245055234644466, true).
+edge(node3873858656, node3873858655, way241775708_4, 16.597191227215383, true).
+edge(node3873858655, node3873858656, way241775708_5, 16.597191227215383, true).
+edge(node3873858655, node3873858654, way241775708_6, 19.541163125780553, true).
+edge(node3873858654, node3873858655, way241775708_7, 19.541163125780553, true).
+edge(node3873858654, node3873858653, way241775708_8, 17.485947565358174, true).
+edge(node3873858653, node3873858654, way241775708_9, 17.485947565358174, true).
+edge(node3873858653, node1346867471, way241775708_10, 18.691062073161984, true).
+edge(node1346867471, node3873858653, way241775708_11, 18.691062073161984, true).
+edge(node2493671572, node2493671573, way241775709_0, 32.93026692681629, true).
+edge(node2493671573, node2493671572, way241775709_1, 32.93026692681629, true).
+edge(node314203301, node314203326, way404255974_0, 198.90462420647953, false).
+edge(node4124401739, node4124401693, way410629799_0, 5.6042103142562425, true).
+edge(node4124401693, node4124401739, way410629799_1, 5.6042103142562425, true).
+edge(node4124401693, node922748903, way410629800_0, 1.511985022250359, true).
+edge(node922748903, node4124401693, way410629800_1, 1.511985022250359, true).
+edge(node2484030804, node2144056449, way410629801_0, 4.953627302122249, true).
+edge(node2144056449, node2484030804, way410629801_1, 4.953627302122249, true).
+edge(node4124401737, node4124401734, way410629802_0, 2.067785055364913, true).
+edge(node4124401734, node4124401737, way410629802_1, 2.067785055364913, true).
+edge(node4124401734, node1878960338, way410629803_0, 30.055690210171033, true).
+edge(node1878960338, node4124401734, way410629803_1, 30.055690210171033, true).
+edge(node4801984446, node4801984447, way487785102_0, 9.587084463761755, true).
+edge(node4801984447, node4801984446, way487785102_1, 9.587084463761755, true).
+edge(node4801984447, node4801984449, way487785104_0, 6.19887706939621, true).
+edge(node4801984449, node4801984447, way487785104_1, 6.19887706939621, true).
+edge(node9658018967, node9658018965, way1050979992_0, 46.72243833329581, true).
+edge(node9658018965, node9658018967, way1050979992_1, 46.72243833329581, true).
+edge(node304993190, node304993930, way1050979993_0, 163.3177502767434, false).
+edge(node304993930, node304993174, way1050979993_1, 61.97354226193895, false).
+edge(node2484097896, node314203427, way1098627857_0, 181.65638124498386, false).
+edge(node10869257012, node10869257011, way1168802823_0, 50.86229669857632, true).
+edge(node10869257011, node10869257012, way1168802823_1, 50.86229669857632, true).
+edge(node10869257011, node10869257010, way1168802823_2, 15.558748300210102, true).
+edge(node10869257010, node10869257011, way1168802823_3, 15.558748300210102, true).
+edge(node10869257010, node10869257009, way1168802823_4, 14.326879759411218, true).
+edge(node10869257009, node10869257010, way1168802823_5, 14.326879759411218, true).
+edge(node10869257009, node10869257008, way1168802823_6, 17.520321783302723, true).
+edge(node10869257008, node10869257009, way1168802823_7, 17.520321783302723, true).
+edge(node11040297842, node11040297840, way1188987298_0, 56.29207218194257, false).
+edge(node304993174, node11324082776, way1235799117_0, 80.22994656936514, false).
+edge(node11472722265, node11472722267, way1235799118_0, 30.312655377285303, true).
+edge(node11472722267, node11472722265, way1235799118_1, 30.312655377285303, true).
+edge(node11324082776, node11472722265, way1235799120_0, 13.635303724079924, true).
+edge(node11472722265, node11324082776, way1235799120_1, 13.635303724079924, true).
@@ -1,67 +1,109 @@
+% the facts are node(Id, Lat, Lon) and edge(From, To, Way, Weight, Bidi),
+% SWI-Prolog indexes edge/5 on From, and on To when it is asked for bound
+% Weight is the distance in metres between the nodes, computed when the facts are written,
+% Bidi is true if the way is bidirectional
+% the heavy rules are tabled when the flag trip_planner_tabling is true while the rules are loaded,
+% their tables are abolished by the client whenever the facts change
+
 % tells if a variable it's a node
 is_node(X):-
-    prop(X, type, node).
+    node(X, _, _).
 
 % tells the coord of a node
 get_node_coord(X, Lat, Lon):-
-    is_node(X),
-    prop(X, lat, Lat),
-    prop(X, lon, Lon).
+    node(X, Lat, Lon).
 
 % tells if a variable it's a way
 is_way(X):-
-    prop(X, type, way).
+    edge(_, _, X, _, _).
 
 % gets all the ways from a given node From_node to a given node To_node
 get_ways(Way, From_node, To_node):-
-    is_way(Way),
-    prop(Way, from_node, From_node),
-    prop(Way, to_node, To_node).
+    edge(From_node, To_node, Way, _, _).
 
 % gets all the info of all the neighbours of a given From_node (without limitations)
 get_neighbours(From_node, To_node, To_node_lat, To_node_lon):-
-    get_ways(_, From_node, To_node),
-    get_node_coord(To_node, To_node_lat, To_node_lon).
+    edge(From_node, To_node, _, _, _),
+    node(To_node, To_node_lat, To_node_lon).
 
 % gets all the info of all the neighbours of a given From_node (with limitations)
 % true if exist a way from From_node to To_node
 % or if exist a way from To_node to From_node and the way is bidirectional
 % or if exist a way between the nodes (besides the direction) and im on foot
+:- if(current_prolog_flag(trip_planner_tabling, true)).
+:- table get_available_neighbours/4.
+:- endif.
 get_available_neighbours(From_node, To_node, To_node_lat, To_node_lon):-
-    get_ways(_, From_node, To_node),
-    get_node_coord(To_node, To_node_lat, To_node_lon);
-    get_ways(Way, To_node, From_node),
-    get_node_coord(To_node, To_node_lat, To_node_lon),
-    prop(Way, bidirectional, true);
+    edge(From_node, To_node, _, _, _),
+    node(To_node, To_node_lat, To_node_lon);
+    edge(To_node, From_node, _, _, true),
+    node(To_node, To_node_lat, To_node_lon);
     on_foot,
-    (get_ways(_, From_node, To_node),
-    get_node_coord(To_node, To_node_lat, To_node_lon);
-    get_ways(_, To_node, From_node),
-    get_node_coord(To_node, To_node_lat, To_node_lon)).
+    (edge(From_node, To_node, _, _, _),
+    node(To_node, To_node_lat, To_node_lon);
+    edge(To_node, From_node, _, _, _),
+    node(To_node, To_node_lat, To_node_lon)).
 
 % get all the nodes in KB
 get_all_node(Node, Lat, Lon):-
-    is_node(Node),
-    prop(Node, lat, Lat),
-    prop(Node, lon, Lon).
+    node(Node, Lat, Lon).
+
+% get all the ids of the ways in KB
+get_all_way_ids(Way):-
+    edge(_, _, Way, _, _).
 
 % get all the ways in KB
-get_all_ways(Way, From_node, To_node, bidi):-
-    is_way(Way),
-    prop(Way, from_node, From_node),
-    prop(Way, to_node, To_node),
-    prop(Way, bidirectional, bidi).
+get_all_ways(Way, From_node, To_node, Bidi):-
+    edge(From_node, To_node, Way, _, Bidi).
 
+% the properties of nodes and ways as they were written before node/3 and edge/5
+prop(X, lat, Lat):-
+    node(X, Lat, _).
+prop(X, lon, Lon):-
+    node(X, _, Lon).
+prop(X, type, node):-
+    node(X, _, _).
+prop(Way, from_node, From_node):-
+    edge(From_node, _, Way, _, _).
+prop(Way, to_node, To_node):-
+    edge(_, To_node, Way, _, _).
+prop(Way, bidirectional, true):-
+    edge(_, _, Way, _, true).
+prop(Way, type, way):-
+    edge(_, _, Way, _, _).
 
-% gets the distance between two nodes
+% gets the distance in metres between two nodes, the same measure of the weights of the edges
+:- if(current_prolog_flag(trip_planner_tabling, true)).
+:- table get_distance/3.
+:- endif.
 get_distance(From_node, To_node, Distance):-
-    get_node_coord(From_node, From_node_lat, From_node_lon),
-    get_node_coord(To_node, To_node_lat, To_node_lon),
-    Distance is sqrt((From_node_lat - To_node_lat) ** 2 + (From_node_lon - To_node_lon) ** 2).
+    haversine_distance(From_node, To_node, Km),
+    Distance is Km * 1000.
+
+% gets every edge of the graph with the distance between its nodes
+% all the adjacency list can be read with a single query
+get_weighted_edge(From_node, To_node, Distance):-
+    edge(From_node, To_node, _, Distance, _).
+
+% gets all the neighbours of a given From_node with the distance to reach each of them
+:- if(current_prolog_flag(trip_planner_tabling, true)).
+:- table get_weighted_neighbours/5.
+:- endif.
+get_weighted_neighbours(From_node, To_node, To_node_lat, To_node_lon, Distance):-
+    edge(From_node, To_node, _, Distance, _),
+    node(To_node, To_node_lat, To_node_lon).
+
+% gets all the nodes with an edge to a given To_node with the distance of the edge, used to search backwards
+:- if(current_prolog_flag(trip_planner_tabling, true)).
+:- table get_weighted_predecessors/5.
+:- endif.
+get_weighted_predecessors(To_node, From_node, From_node_lat, From_node_lon, Distance):-
+    edge(From_node, To_node, _, Distance, _),
+    node(From_node, From_node_lat, From_node_lon).
 
 % haversine distance
 % given two nodes returns the distance between them in km
-haversine_distance(From_node, To_node):-
+haversine_distance(From_node, To_node, Distance):-
     get_node_coord(From_node, Lat1, Lon1),
     get_node_coord(To_node, Lat2, Lon2),
     % Convert latitude and longitude from decimal degree to radians
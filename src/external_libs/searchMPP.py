@@ -8,40 +8,99 @@
 # Attribution-NonCommercial-ShareAlike 4.0 International License.
 # See: https://creativecommons.org/licenses/by-nc-sa/4.0/deed.en
 
+from array import array
+
 from src.external_libs.searchGeneric import AStarSearcher
 from src.external_libs.searchProblem import Path
+from src.service.search.indexed_frontier import IndexedFrontierPQ
 
 class SearcherMPP(AStarSearcher):
     """returns a searcher for a problem.
     Paths can be found by repeatedly calling search().
+    The frontier holds integer node indexes, each at most once: when a cheaper path to a node
+    is found its value is lowered. The best cost and the arc used to reach each node are kept
+    in arrays indexed by node, and a Path is built only for the solution.
     """
     def __init__(self, problem):
+        self.node_index = {}  # node -> integer index
+        self.nodes = []  # integer index -> node
+        self.cost = array('d')  # best cost found to reach each node
+        self.parent = array('l')  # index of the previous node on the best path, -1 for the start
+        self.parent_arc = []  # the arc used to reach each node, None for the start
+        self.explored = array('b')  # 1 when the node has been expanded
+        self.start_path = None
         super().__init__(problem)
-        self.explored = set()
+
+    def _index_of(self, node):
+        """returns the index of node, registering it the first time it is seen"""
+        index = self.node_index.get(node)
+        if index is None:
+            index = len(self.nodes)
+            self.node_index[node] = index
+            self.nodes.append(node)
+            self.cost.append(float('inf'))
+            self.parent.append(-1)
+            self.parent_arc.append(None)
+            self.explored.append(0)
+        return index
+
+    def initialize_frontier(self):
+        self.frontier = IndexedFrontierPQ()
+
+    def add_to_frontier(self, path):
+        """add the start path to the frontier, its end node is reached with the cost of the path"""
+        self.start_path = path
+        index = self._index_of(path.end())
+        self.cost[index] = path.cost
+        self.frontier.add(index, path.cost + self.problem.heuristic(path.end()))
+
+    def _relax(self, index, arc):
+        """add the node at the end of arc to the frontier if arc gives it a cheaper path"""
+        to_index = self._index_of(arc.to_node)
+        if self.explored[to_index]:
+            return
+        cost = self.cost[index] + arc.cost
+        if cost < self.cost[to_index]:
+            self.cost[to_index] = cost
+            self.parent[to_index] = index
+            self.parent_arc[to_index] = arc
+            self.frontier.add(to_index, cost + self.problem.heuristic(arc.to_node))
+
+    def _build_path(self, index):
+        """builds the Path that reaches the node index following the parents"""
+        arcs = []
+        while self.parent[index] != -1:
+            arcs.append(self.parent_arc[index])
+            index = self.parent[index]
+        path = self.start_path
+        for arc in reversed(arcs):
+            path = Path(path, arc)
+        return path
 
     def search(self):
         self.display(1, f"Starting search from {self.problem.start_node()} to {self.problem.to_node}")
         while not self.empty_frontier():
-            self.path = self.frontier.pop()
-            if self.path.end() not in self.explored:
-                self.explored.add(self.path.end())
-                self.num_expanded += 1
-                if self.problem.is_goal(self.path.end()):
-                    self.solution = self.path  # store the solution found
-                    self.display(1,
-                                 f"Solution: {self.path} (cost: {self.path.cost})\n {self.num_expanded} paths have "
-                                 f"been expanded and {len(self.frontier)} paths remain in the frontier")
-                    print(f"    Il percorso è: {self.path}")
-                    print(
-                        f"    Sono stati esplorati {self.num_expanded} percorsi e ne rimangono {len(self.frontier)} nella frontiera.")
-                    return self.path
-                else:
-                    self.display(4, f"Expanding: {self.path} (cost: {self.path.cost})")
-                    neighs = self.problem.neighbors(self.path.end())
-                    self.display(2, f"Expanding: {self.path} with neighbors {neighs}")
-                    for arc in neighs:
-                        self.add_to_frontier(Path(self.path, arc))
-                    self.display(3, f"New frontier: {[p.end() for p in self.frontier]}")
-        self.display(0, "No (more) solutions. Total of",
-                     self.num_expanded, "paths expanded.")
+            index = self.frontier.pop()
+            self.explored[index] = 1
+            self.num_expanded += 1
+            node = self.nodes[index]
+            if self.problem.is_goal(node):
+                self.path = self._build_path(index)
+                self.solution = self.path  # store the solution found
+                self.display(1,
+                             f"Solution: {self.path} (cost: {self.path.cost})\n {self.num_expanded} paths have "
+                             f"been expanded and {len(self.frontier)} paths remain in the frontier "
+                             f"(at most {self.frontier.peak_size})")
+                print(f"    Il percorso è: {self.path}")
+                print(
+                    f"    Sono stati esplorati {self.num_expanded} percorsi e ne rimangono {len(self.frontier)} nella frontiera.")
+                return self.path
+            else:
+                self.display(4, f"Expanding: {node} (cost: {self.cost[index]})")
+                neighs = self.problem.neighbors(node)
+                self.display(2, f"Expanding: {node} with neighbors {neighs}")
+                for arc in neighs:
+                    self._relax(index, arc)
+                self.display(3, f"New frontier: {[self.nodes[i] for i in self.frontier]}")
+        self.display(0, f"No (more) solutions. Total of {self.num_expanded} paths expanded.")
         self.display(1, f"Search ended")
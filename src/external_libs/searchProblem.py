@@ -39,6 +39,8 @@ class Search_problem(Displayable):
 
 class Arc(object):
     """An arc has a from_node and a to_node node and a (non-negative) cost"""
+    __slots__ = ('from_node', 'to_node', 'action', 'cost')
+
     def __init__(self, from_node, to_node, cost=1, action=None):
         self.from_node = from_node
         self.to_node = to_node
@@ -156,7 +158,8 @@ class Search_problem_from_explicit_graph(Search_problem):
 
 class Path(object):
     """A path is either a node or a path followed by an arc"""
-    
+    __slots__ = ('initial', 'arc', 'cost')
+
     def __init__(self,initial,arc=None):
         """initial is either a node (in which case arc is None) or
         a path (in which case arc is an object of type Arc)"""
@@ -1,18 +1,22 @@
 import logging
-import time
-from random import randint
 
 from src.service.search.dp import DynamicProgramming
-from src.external_libs.searchMPP import SearcherMPP
 from src.service.search.floyd_warshall import FloydWarshall
+from src.service.search.distance_oracle import DistanceOracle
+from src.service.search.contraction_hierarchies import ContractionHierarchies
+from src.service.search.landmarks import LandmarkHeuristic
+from src.service.search.legs import search_legs
+from src.service.pipeline.staged_executor import StagedExecutor
 from src.service.data.osm_xml_parser import OSMXmlParser
 from src.service.data.facts_writer import FactsWriter
+from src.service.data.file_hash import file_sha256
 from src.service.prolog.pyswip_client import PySwipClient
+from src.service.graph.compiled_graph import CompiledGraph
+from src.service.graph.graph_cache import GraphCache
 from src.model.prolog.node import Node
+from src.external_libs.searchProblem import Path
 from src.service.data.osm_xml_parser import ParsingResult
 
-from src.service.search.my_search_problem import MySearchProblem
-
 
 class Environment:
     """
@@ -20,7 +24,12 @@ class Environment:
     """
 
     def __init__(self, path_to_prolog_facts: str, path_to_prolog_rules: str,
-                 path_to_osm_data: str, on_foot: bool, total_time: int, total_budget: int, total_poi: int):
+                 path_to_osm_data: str, on_foot: bool, total_time: int, total_budget: int, total_poi: int,
+                 streaming_parse: bool = False, path_to_graph_cache: str = None, use_distance_oracle: bool = False,
+                 use_contraction_hierarchies: bool = False, landmark_count: int = 0, dp_epsilon: float = 0.0,
+                 bidirectional_search: bool = False, prolog_tabling: bool = False, pipeline_workers: int = 1,
+                 one_to_many_legs: bool = False, start_coordinates: tuple[float, float] = None,
+                 by_travel_time: bool = False):
         self.path_to_prolog_facts = path_to_prolog_facts
         self.path_to_prolog_rules = path_to_prolog_rules
         self.path_to_osm_data = path_to_osm_data
@@ -28,6 +37,18 @@ class Environment:
         self.total_time = total_time
         self.total_budget = total_budget
         self.total_poi = total_poi
+        self.streaming_parse = streaming_parse
+        self.path_to_graph_cache = path_to_graph_cache
+        self.use_distance_oracle = use_distance_oracle
+        self.use_contraction_hierarchies = use_contraction_hierarchies
+        self.landmark_count = landmark_count
+        self.dp_epsilon = dp_epsilon
+        self.bidirectional_search = bidirectional_search
+        self.prolog_tabling = prolog_tabling
+        self.pipeline_workers = pipeline_workers
+        self.one_to_many_legs = one_to_many_legs
+        self.start_coordinates = start_coordinates
+        self.by_travel_time = by_travel_time
 
 
 def main(env: Environment):
@@ -41,53 +62,125 @@ def main(env: Environment):
     logging.basicConfig(level=logging.CRITICAL)
     logging.info("Application started.")
     logging.debug("Initiating internal services..")
-    # Initiating services
+    # The stages that don't depend on each other overlap, the ones using the prolog engine stay on this thread
+    uses_prolog = env.path_to_graph_cache is None
+    pipeline = StagedExecutor(env.pipeline_workers)
+    pipeline.add_stage('knowledge_base', lambda: _load_knowledge_base(env), in_main_thread=True)
+    # The dp doesn't need the graph, so it runs while the knowledge base is loaded
+    pipeline.add_stage('dp', lambda: _solve_dp(env))
+    pipeline.add_stage('graph', _compiled_graph, ('knowledge_base',), in_main_thread=uses_prolog)
+    # Calculating the map of the entire graph, or only the distances that will be asked for
+    if env.use_distance_oracle:
+        pipeline.add_stage('distances', DistanceOracle, ('graph',))
+    else:
+        pipeline.add_stage('distances', FloydWarshall, ('knowledge_base',), in_main_thread=uses_prolog)
+    # Only the stages whose result is used by the search of the legs are added
+    one_to_many = env.one_to_many_legs and (env.use_distance_oracle or not uses_prolog)
+    uses_hierarchies = env.use_contraction_hierarchies and not one_to_many
+    leg_inputs = ('knowledge_base', 'tour', 'distances')
+    if uses_hierarchies:
+        # Preprocessing the graph for the point-to-point searches
+        pipeline.add_stage('hierarchies', ContractionHierarchies, ('graph',))
+        leg_inputs += ('hierarchies',)
+    if not one_to_many and not uses_hierarchies:
+        # The estimates used by the A* heuristic, the exact distances or the landmark lower bounds
+        pipeline.add_stage('estimates', lambda graph, fw: LandmarkHeuristic(graph, env.landmark_count)
+                           if env.landmark_count > 0 else fw.get_lsdb(), ('graph', 'distances'))
+        leg_inputs += ('estimates',)
+    # Picking up nodes, the first is the start node
+    pipeline.add_stage('selected_nodes', lambda graph, howmany: select_nodes(
+        howmany + 1, graph, env.start_coordinates), ('graph', 'dp'))
+    # Finding the best path reordering nodes
+    pipeline.add_stage('tour', lambda fw, nodes: fw.best_path(nodes), ('distances', 'selected_nodes'))
+    # The legs don't depend on each other, they are searched in parallel when the graph is compiled and large
+    pipeline.add_stage('paths', lambda *inputs: _search_paths(env, **dict(zip(leg_inputs, inputs))), leg_inputs,
+                       in_main_thread=uses_prolog)
+    results = pipeline.run()
+    if isinstance(results['knowledge_base'], PySwipClient):
+        logging.info(f"Knowledge base query cache: {results['knowledge_base'].cache_info()}")
+    logging.info("Application has been shutdown")
+
+
+def _load_knowledge_base(env: Environment) -> PySwipClient | CompiledGraph:
+    """
+    It loads the knowledge base, updating the facts, or the compiled graph, if the open street data changed
+    :param env: The environment variables
+    :return: The prolog client, or the compiled graph if a cache directory is given, with the travel times as the
+    costs of the edges if they are asked for
+    """
     parser_osm = OSMXmlParser()
     writer = FactsWriter()
-    # Path to the file
-    _update_facts_file(env.path_to_osm_data, parser_osm, env.path_to_prolog_facts, env.on_foot, writer)
-    prolog_client = PySwipClient(env.path_to_prolog_facts, env.path_to_prolog_rules)
+    if env.path_to_graph_cache is None:
+        if env.by_travel_time:
+            logging.warning('The travel times are stored only in the compiled graph, the paths are the shortest ones.')
+        _update_facts_file(env.path_to_osm_data, parser_osm, env.path_to_prolog_facts, env.on_foot, writer,
+                           env.streaming_parse)
+        return PySwipClient(env.path_to_prolog_facts, env.path_to_prolog_rules, tabling=env.prolog_tabling)
+    # The compiled graph answers in place of the prolog client, the data is parsed only if the cache is stale
+    graph = GraphCache(env.path_to_graph_cache).load_or_build(
+        env.path_to_osm_data, env.on_foot,
+        lambda: _update_facts_file(env.path_to_osm_data, parser_osm, env.path_to_prolog_facts, env.on_foot,
+                                   writer, env.streaming_parse, need_result=True))
+    # With the travel times as costs every search, and the distances of the tour, look for the fastest paths
+    return graph.by_travel_time() if env.by_travel_time else graph
+
+
+def _search_paths(env: Environment, knowledge_base: PySwipClient | CompiledGraph, tour: list[Node],
+                  distances: FloydWarshall | DistanceOracle, hierarchies: ContractionHierarchies = None,
+                  estimates=None) -> list[Path | None]:
+    """
+    It searches the path of every leg of the tour
+    :param env: The environment variables
+    :param knowledge_base: The knowledge base in use
+    :param tour: The nodes in the order of visit
+    :param distances: The distances used to order the tour
+    :param hierarchies: The preprocessed graph, if the legs are searched with the contraction hierarchies
+    :param estimates: The estimates used by the heuristic, if the legs are searched with A*
+    :return: The path of each leg
+    """
+    return search_legs(tour, estimates, knowledge_base, hierarchies, env.bidirectional_search, env.pipeline_workers,
+                       env.one_to_many_legs, distances)
+
+
+def _solve_dp(env: Environment) -> int:
+    """
+    It chooses the points of interest to visit
+    :param env: The environment variables
+    :return: The number of points of interest chosen
+    """
     # Setting up dp parameters
-    dp = DynamicProgramming(total_poi_main)
+    # Setting dp_epsilon greater than 0 gives an approximated solution, with a much smaller table
+    dp = DynamicProgramming(env.total_poi, env.dp_epsilon)
     # Generating users preferences, time and cost for each poi
     dp.generate()
     # Calculating the best solution
     logging.info("Calculating the best solution..")
-    dp.calculate(0, total_time_main, total_budget_main)
+    dp.calculate(0, env.total_time, env.total_budget)
     logging.info("Solution calculated.")
-    howmany = dp.get_solution(0, total_time_main, total_budget_main)
-    # Calculating the map of the entire graph
-    fw = FloydWarshall(prolog_client)
-    # Picking up nodes
-    selected_nodes = select_nodes(howmany + 1, fw.get_lsdb(), prolog_client)  # first is the start node
-    # Finding the best path reordering nodes
-    selected_nodes = fw.best_path(selected_nodes)
-    for i in range(len(selected_nodes) - 1):
-        problem = MySearchProblem(selected_nodes[i], selected_nodes[i + 1], fw.get_lsdb(), prolog_client)
-        searcher = SearcherMPP(problem)
-        path = searcher.search()
-    problem = MySearchProblem(selected_nodes[len(selected_nodes)-1], selected_nodes[0], fw.get_lsdb(), prolog_client)
-    searcher = SearcherMPP(problem)
-    path = searcher.search()
-    logging.info("Application has been shutdown")
+    return dp.get_solution(0, env.total_time, env.total_budget)
 
 
-def select_nodes(howmany: int, dist: dict, prolog_client: PySwipClient) -> list[Node]:
+def select_nodes(howmany: int, graph: CompiledGraph, start_coordinates: tuple[float, float] = None) -> list[Node]:
+    """
+    It picks distinct nodes at random that can all be reached from each other, from the largest strongly connected
+    component of the graph
+    :param howmany: The number of nodes to pick
+    :param graph: The compiled graph, with its components
+    :param start_coordinates: The latitude and the longitude where the trip starts, if given the first node is the
+    closest one to them in a component with at least howmany nodes, and the others are picked from its component
+    :return: The nodes picked
+    """
     logging.debug("Selecting nodes..")
-    nodes = prolog_client.ask_all_node()
-    selected_node = []
-    different = False
-    while not different:
-        different = True
-        selected_node = []
-        for i in range(howmany):
-            selected_node.append(nodes[randint(0, len(nodes) - 1)])
-            for j in range(i):
-                if selected_node[i] == selected_node[j] or not _is_connected(selected_node[i], selected_node[j], dist):
-                    different = False
-                    break
-            if not different:
-                break
+    if start_coordinates is None:
+        selected_node = [graph.node(i) for i in graph.components().sample(howmany)]
+    else:
+        # The start is snapped to a node whose component has room for all the nodes to pick
+        components = graph.components()
+        start = graph.nearest_node(*start_coordinates, min_component_size=howmany)
+        print(f"Il punto di partenza {start_coordinates} corrisponde al nodo {start.id}")
+        start_index = graph.index_of_node(start)
+        others = [i for i in components.sample(howmany, int(components.component_of[start_index])) if i != start_index]
+        selected_node = [start] + [graph.node(i) for i in others[:howmany - 1]]
     print("I nodi corrispondenti sono: ")
     for node in selected_node:
         logging.debug(f"Selected node {node}")
@@ -97,34 +190,43 @@ def select_nodes(howmany: int, dist: dict, prolog_client: PySwipClient) -> list[
 
 
 def _update_facts_file(path_to_osm_data: str, parser: OSMXmlParser, path_to_prolog_facts: str, on_foot: bool,
-                       writer: FactsWriter) -> ParsingResult:
+                       writer: FactsWriter, streaming: bool = False, need_result: bool = False) -> ParsingResult | None:
     """
-    A subroutine to parse data from the open street model and store the facts related on a file
+    A subroutine to parse data from the open street model and store the facts related on a file.
+    The facts are tagged with the hash of the data and the profile, and they are written only if one of them changed.
     :param path_to_osm_data: The path of the file of the open street model
     :param parser: The parser of the xml
     :param path_to_prolog_facts: The path to store the prolog facts
     :param writer: The class that writes the facts on file
-    :return:
+    :param streaming: If the open street data has to be parsed incrementally
+    :param need_result: If the data has to be parsed even when the facts are up to date
+    :return: The parsing result, None if the facts are up to date and the result isn't needed
     """
+    tag = writer.make_tag(file_sha256(path_to_osm_data), on_foot)
+    up_to_date = writer.is_up_to_date(path_to_prolog_facts, tag)
+    if up_to_date and not need_result:
+        logging.info(f"Facts in '{path_to_prolog_facts}' are up to date.")
+        return None
     logging.info(f"Importing open street data from:'{path_to_osm_data}'..")
     result = None
     with open(path_to_osm_data, 'r', encoding='utf-8') as file:
-        result = parser.parse_osm_xml(file, on_foot)
+        result = parser.parse_osm_xml(file, on_foot, streaming)
     logging.info('Imported open street data completed.')
     assert result is not None, 'A parsing result should be produced'
-    writer.write_facts(result, path_to_prolog_facts, on_foot)
+    if not up_to_date:
+        writer.write_facts(result, path_to_prolog_facts, on_foot, tag)
     return result
 
 
-def _is_connected(nodeA: Node, nodeB: Node, dist: dict) -> bool:
+def _compiled_graph(knowledge_base: PySwipClient | CompiledGraph) -> CompiledGraph:
     """
-    Checks if there is a path from nodeA to nodeB
-    :param nodeA: the first node to check
-    :param nodeB: the second node to check
-    :return: True if the 2 nodes are connected
+    It returns the graph compiled in arrays, reading it from the knowledge base if it's not compiled yet
+    :param knowledge_base: The knowledge base in use
+    :return: The compiled graph
     """
-    logging.debug(f'Checking {nodeA} and {nodeB}')
-    return not (dist[nodeA.id][nodeB.id] == float('inf') or dist[nodeB.id][nodeA.id] == float('inf'))
+    if isinstance(knowledge_base, CompiledGraph):
+        return knowledge_base
+    return CompiledGraph.from_knowledge_base(knowledge_base)
 
 
 if __name__ == "__main__":
@@ -138,6 +240,25 @@ if __name__ == "__main__":
     total_poi_main = 100
     total_time_main = 300
     total_budget_main = 100
+    streaming_parse_main = False
+    graph_cache_path_main = None
+    use_distance_oracle_main = False
+    use_contraction_hierarchies_main = False
+    landmark_count_main = 0
+    dp_epsilon_main = 0.0
+    bidirectional_search_main = False
+    prolog_tabling_main = False
+    pipeline_workers_main = 1
+    one_to_many_legs_main = False
+    start_coordinates_main = None
+    by_travel_time_main = False
     env_main = Environment(prolog_facts_path_main, prolog_rules_path_main,
-                           open_street_data_path_main, on_foot_main, total_time_main, total_budget_main, total_poi_main)
+                           open_street_data_path_main, on_foot_main, total_time_main, total_budget_main, total_poi_main,
+                           streaming_parse=streaming_parse_main, path_to_graph_cache=graph_cache_path_main,
+                           use_distance_oracle=use_distance_oracle_main,
+                           use_contraction_hierarchies=use_contraction_hierarchies_main,
+                           landmark_count=landmark_count_main, dp_epsilon=dp_epsilon_main,
+                           bidirectional_search=bidirectional_search_main, prolog_tabling=prolog_tabling_main,
+                           pipeline_workers=pipeline_workers_main, one_to_many_legs=one_to_many_legs_main,
+                           start_coordinates=start_coordinates_main, by_travel_time=by_travel_time_main)
     main(env_main)
@@ -54,4 +54,4 @@ class Node:
         lon = float(node_element.get(NodeOSMEnum.LON.value))
         lat = float(node_element.get(NodeOSMEnum.LAT.value))
         tag_proprieties = TagProprieties.from_osm_xml_element(node_element)
-        return cls(id_node, lon, lat, tag_proprieties)
+        return cls(id_node, lat, lon, tag_proprieties)
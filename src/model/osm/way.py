@@ -1,18 +1,27 @@
+import re
 import string
 from enum import Enum
 from xml.etree.ElementTree import Element
 from src.model.osm.tag_proprieties import TagProprieties
 import logging
+import os
 
-from src.service.rdf.sparql_on_rdf_client import sparql_client
+from src.service.rdf.ontology_resolver import OntologyResolver
+
+_RESOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'resources')
+"""
+The directory of the resources, found from this file so that the ontology is read from any working directory
+"""
+
+_ontology_resolver = OntologyResolver(os.path.join(_RESOURCES, 'open_street_map', 'ontology.ttl'),
+                                      os.path.join(_RESOURCES, 'cache', 'ontology_values.json'))
+"""
+The resolver shared by all the enums, the ontology is parsed at most once
+"""
 
 
 def retrieve_value(prop, mean):
-    sparql = sparql_client('../resources/open_street_map/ontology.ttl');
-    prop_range = sparql.ask_range_of_prop(prop)
-    value = sparql.ask_label_for_meaning_in_range(mean, prop_range)
-    value = value.replace(f"{prop}=", "")
-    return value
+    return _ontology_resolver.resolve(prop, mean)
 
 
 class WayOSMEnum(Enum):
@@ -140,6 +149,18 @@ class Way:
 
     _ONE_WAY = 'oneway'
 
+    DEFAULT_MAX_SPEED = 50
+    """
+    The max speed in km/h of the ways that don't specify it, the italian city street limit
+    """
+
+    _SPEED_PATTERN = re.compile(r'\s*(\d+(?:\.\d+)?)\s*(mph)?', re.IGNORECASE)
+    """
+    The leading number of a value of the tag maxspeed, and its unit if it's in mph
+    """
+
+    _KM_PER_MILE = 1.609344
+
     def __init__(self, id_way, node_list: list[int] = None, tag_proprieties=None):
         """
         :param id_way:
@@ -194,12 +215,45 @@ class Way:
             value = OnewayOSMEnum.IN_REVERSE_ORDER
         return value
 
-    def get_max_speed(self) -> int:
+    def get_edges(self, on_foot: bool) -> list[tuple[int, int]]:
+        """
+        It returns the directed edges generated by this way, following the direction of the street
+        :param on_foot: If True every edge can be walked in both directions
+        :return: The list of pairs (from node id, to node id) in the order of the way
         """
-        It returns the max speed for this way. If not specified, it returns 50 as the italian city street limit.
+        edges = []
+        for i in range(1, len(self.node_list)):
+            from_node = self.node_list[i - 1]
+            to_node = self.node_list[i]
+            # Swapping the direction of the edge
+            if self.get_type() == OnewayOSMEnum.IN_REVERSE_ORDER:
+                from_node, to_node = to_node, from_node
+            edges.append((from_node, to_node))
+            if self.get_type() == OnewayOSMEnum.BIDIRECTIONAL or on_foot:
+                edges.append((to_node, from_node))
+        return edges
+
+    def get_max_speed(self) -> float:
+        """
+        It returns the max speed for this way in km/h. The leading number of the tag is read, converting the speeds
+        in mph, and with more values the lowest one is taken. If not specified, or if no value is a positive number,
+        as with 'none', 'walk' or 'IT:urban', it returns 50 as the italian city street limit.
         :return:
         """
-        speed = self.tag_proprieties.get('maxspeed')
-        if speed is None or len(speed) == 0:
-            return 50
-        return int(next(iter(speed)))
+        speeds = [self._parse_speed(value) for value in self.tag_proprieties.get('maxspeed') or ()]
+        speeds = [speed for speed in speeds if speed is not None and speed > 0]
+        if len(speeds) == 0:
+            return self.DEFAULT_MAX_SPEED
+        return min(speeds)
+
+    @classmethod
+    def _parse_speed(cls, value: str) -> float | None:
+        """
+        :param value: A value of the tag maxspeed, as '50', '30 mph' or 'none'
+        :return: The speed in km/h, None if the value doesn't start with a number
+        """
+        match = cls._SPEED_PATTERN.match(str(value))
+        if match is None:
+            return None
+        speed = float(match.group(1))
+        return speed * cls._KM_PER_MILE if match.group(2) else speed
@@ -1,34 +1,36 @@
 import logging
+import threading
+from array import array
+
 
 class Node:
     """
-    The node returned by a prolog query
+    The node returned by a prolog query.
+    The nodes are interned by the node registry: there is a single object for each id, so two nodes are equal only
+    if they are the same object, and key is the dense integer index of the node in the registry.
     """
+    __slots__ = ('id', 'lat', 'lon', 'key')
 
-    def __init__(self, id: str, lat: float, lon: float):
+    def __init__(self, id: str, lat: float, lon: float, key: int):
         """
 
         :param id: The id of the node
         :param lat: The lattitude of the node
         :param lon: The longitude of the node
+        :param key: The index of the node in the registry
         """
         self.id = id
         self.lat = lat
         self.lon = lon
-
-    def __eq__(self, other):
-        if not isinstance(other, Node):
-            return False
-        return (self.id == other.id
-                and self.lat == other.lat
-                and self.lon == other.lon)
-
-    def __hash__(self):
-        return hash(self.id)
+        self.key = key
 
     def __repr__(self):
         return '{' + f"id: {self.id}, lat: {self.lat}, lon: {self.lon}" + '}'
 
+    def __reduce__(self):
+        # A node sent to another process is interned in the registry of that process
+        return _intern, (self.id, self.lat, self.lon)
+
     @classmethod
     def from_prolog_dictionary_result(cls, dictionary: dict) -> 'Node':
         """
@@ -36,4 +38,109 @@ class Node:
         :param dictionary: The dictionary with all the keys
         :return: The node obtained
         """
-        return Node(dictionary['Node'], float(dictionary['Lat']), float(dictionary['Lon']))
+        return node_registry.intern(dictionary['Node'], float(dictionary['Lat']), float(dictionary['Lon']))
+
+
+class NodeRegistry:
+    """
+    It interns every node once into a dense integer index, keeping the coordinates in arrays.
+    The node objects are created only when they are asked for. The pipeline asks for nodes from more threads, so the
+    registration and the creation of the nodes are guarded by a lock, and a single object is created for each key.
+    """
+
+    def __init__(self):
+        self._keys = dict()  # id -> key
+        self.ids = []
+        self.lat = array('d')
+        self.lon = array('d')
+        self._nodes = []
+        self._lock = threading.Lock()
+
+    def key_of(self, node_id: str, lat: float, lon: float) -> int:
+        """
+        It registers the node the first time it's seen
+        :param node_id: The id of the node
+        :param lat: The latitude of the node
+        :param lon: The longitude of the node
+        :return: The key of the node
+        """
+        key = self._keys.get(node_id)
+        if key is not None:
+            return key
+        with self._lock:
+            key = self._keys.get(node_id)
+            if key is None:
+                key = len(self.ids)
+                self.ids.append(node_id)
+                self.lat.append(lat)
+                self.lon.append(lon)
+                self._nodes.append(None)
+                # Published last, so a key read without the lock always has its node slot
+                self._keys[node_id] = key
+        return key
+
+    def intern(self, node_id: str, lat: float, lon: float) -> Node:
+        """
+        :return: The single node with the given id, registered the first time it's seen
+        """
+        return self.node(self.key_of(node_id, lat, lon))
+
+    def key(self, node_id: str) -> int:
+        """
+        :param node_id: The id of a registered node
+        :return: The key of the node
+        """
+        return self._keys[node_id]
+
+    def node(self, key: int) -> Node:
+        """
+        :param key: The key of a registered node
+        :return: The node
+        """
+        node = self._nodes[key]
+        if node is not None:
+            return node
+        with self._lock:
+            node = self._nodes[key]
+            if node is None:
+                node = Node(self.ids[key], self.lat[key], self.lon[key], key)
+                self._nodes[key] = node
+        return node
+
+    def positions(self, keys) -> array:
+        """
+        It maps every key to its position in the given sequence, so that the arrays ordered as the sequence can be
+        read with the keys of the nodes
+        :param keys: The keys of the nodes, in order
+        :return: The position of each key, -1 for the keys that aren't in the sequence
+        """
+        positions = array('q', [-1]) * len(self)
+        for position, key in enumerate(keys):
+            positions[key] = position
+        logging.debug(f'Positions of {len(positions)} registered nodes computed.')
+        return positions
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __reduce__(self):
+        # The registry sent to another process registers the same nodes there, in the same order, so that the keys
+        # are the same in both processes. It has to be sent before any node or structure indexed by key.
+        return _restore_registry, (self.ids, self.lat, self.lon)
+
+
+node_registry = NodeRegistry()
+"""
+The registry shared by every source of nodes, the knowledge base and the compiled graph
+"""
+
+
+def _intern(node_id: str, lat: float, lon: float) -> Node:
+    return node_registry.intern(node_id, lat, lon)
+
+
+def _restore_registry(ids: list[str], lat: array, lon: array) -> NodeRegistry:
+    for key, node_id in enumerate(ids):
+        if node_registry.key_of(node_id, lat[key], lon[key]) != key:
+            raise ValueError(f'The node {node_id} is registered with a different key in this process')
+    return node_registry
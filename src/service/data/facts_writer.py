@@ -2,22 +2,57 @@ from src.service.data.osm_xml_parser import ParsingResult
 from src.model.osm.node import Node
 from src.model.osm.way import Way
 from src.model.osm.way import OnewayOSMEnum
+from src.service.graph.edge_weights import haversine_metres
 import logging
+import os
 
 
 class FactsWriter:
     """
     The class that writes down the info parsed from the open street model and generates the event on the edges.
+    The nodes are written as node(Id, Lat, Lon) and the edges as edge(From, To, Way, Weight, Bidi): the starting node
+    is the first argument, so SWI-Prolog indexes the edges on it and a neighbour lookup hits a single clause set.
+    """
+
+    _FORMAT_VERSION = 5
+    """
+    The version of the schema of the facts, it has to be increased when the written facts change
     """
 
     def __init__(self):
         logging.debug('FactsWriter service initialed.')
 
-    def write_facts(self, data: ParsingResult, output_path: str, on_foot: bool):
+    @staticmethod
+    def make_tag(osm_sha256: str, on_foot: bool) -> str:
+        """
+        It returns the tag that identifies the facts written from the given data
+        :param osm_sha256: The hash of the file of the open street model
+        :param on_foot: The profile of the facts
+        :return: The tag, a prolog comment written on the first line of the facts
+        """
+        return (f"% format={FactsWriter._FORMAT_VERSION} osm_sha256={osm_sha256} "
+                f"on_foot={str(on_foot).lower()}")
+
+    @staticmethod
+    def is_up_to_date(output_path: str, tag: str) -> bool:
+        """
+        Tells if the facts on the given path were written with the given tag, so they don't need to be written again
+        :param output_path: The path of the facts
+        :param tag: The expected tag
+        :return: True if the file starts with the tag
+        """
+        try:
+            with open(output_path, 'r') as f:
+                return f.readline().rstrip('\n') == tag
+        except OSError:
+            return False
+
+    def write_facts(self, data: ParsingResult, output_path: str, on_foot: bool, tag: str = None):
         """
         It writes down the facts, on the given path, from the parsing of open street data and generated events.
         :param data: The data from the parsing
         :param output_path: The path to store the file
+        :param tag: If given, it's written on the first line to recognise the data the facts come from
         :return:
         """
         logging.debug('Started writing facts..')
@@ -25,7 +60,12 @@ class FactsWriter:
         for node in data.node_list:
             node_dict[node.id_node] = node
 
-        with open(output_path, 'w') as f:
+        # The facts are written on a temporary file that replaces the old one only when it's complete, so an
+        # interrupted write never leaves a truncated file with a valid tag
+        temporary_path = output_path + '.tmp'
+        with open(temporary_path, 'w') as f:
+            if tag is not None:
+                f.write(f"{tag}\n")
             if on_foot:
                 f.write('on_foot.\n')
             #node_ids = []
@@ -38,25 +78,26 @@ class FactsWriter:
             # Writing edges
             logging.debug('Writing way facts..')
             ways_ids = []
+            weights = iter(self._edge_weights(data, node_dict, on_foot))
             for way in data.way_list:
-                self._write_way(f, way, node_dict, ways_ids, on_foot)
+                self._write_way(f, way, node_dict, ways_ids, on_foot, weights)
             logging.debug(f"Total number of ways {len(ways_ids)}")
             logging.debug('Writing way facts completed.')
 
             logging.debug('Writing event facts..')
 
+        os.replace(temporary_path, output_path)
         logging.debug('Writing facts finished.')
 
-    def _write_fact(self, f, subject: str, attribute: str, value: str | float):
+    def _write_fact(self, f, predicate: str, *arguments: str):
         """
         It writes on the file a fact
         :param f: The file on which write the fact
-        :param subject: The subject of the fact
-        :param attribute: The attribute of the fact
-        :param value: The value of the fact
+        :param predicate: The name of the fact
+        :param arguments: The arguments of the fact
         :return:
         """
-        f.write(f"prop({subject}, {attribute}, {value}).\n")
+        f.write(f"{predicate}({', '.join(arguments)}).\n")
 
     def _write_node(self, f, node: Node):
         """
@@ -65,33 +106,42 @@ class FactsWriter:
         :param node: The node of which write the related fact
         :return:
         """
-        node_id = self._generate_node_id_fact(node)
-        self._write_fact(f, node_id, 'lat', str(node.lat))
-        self._write_fact(f, node_id, 'lon', str(node.lon))
-        self._write_fact(f, node_id, 'type', 'node')
+        self._write_fact(f, 'node', self._generate_node_id_fact(node), str(node.lat), str(node.lon))
 
-    def _write_way(self, f, way: Way, node_dict: dict, ways_ids: list[str], on_foot: bool):
+    @staticmethod
+    def _edge_weights(data: ParsingResult, node_dict: dict, on_foot: bool) -> list[float]:
+        """
+        It computes the weight of every edge at once, as the distance in metres between its nodes
+        :param data: The data from the parsing
+        :param node_dict: The dictionary of the node present
+        :param on_foot: The profile of the facts
+        :return: The weights, in the order the edges are written
+        """
+        edges = [(node_dict[from_node_id], node_dict[to_node_id])
+                 for way in data.way_list for from_node_id, to_node_id in way.get_edges(on_foot)]
+        return haversine_metres([float(from_node.lat) for from_node, _ in edges],
+                                [float(from_node.lon) for from_node, _ in edges],
+                                [float(to_node.lat) for _, to_node in edges],
+                                [float(to_node.lon) for _, to_node in edges]).tolist()
+
+    def _write_way(self, f, way: Way, node_dict: dict, ways_ids: list[str], on_foot: bool, weights):
         """
         It writes on the file the facts related to the open street way.
         :param f: The file on which write the facts
         :param way: The open street data way to write the facts about
         :param node_dict: The dictionary of the node present
         :param ways_ids: The list of all the ids generated from a single way of open street map
+        :param weights: The iterator over the weights of the edges, from the first edge of this way
         :return:
         """
         edge_counter = 0
-        for i in range(1, len(way.node_list)):
-            from_node = node_dict.get(way.node_list[i - 1])
-            to_node = node_dict.get(way.node_list[i])
-            # Swapping the direction of the edge
-            if way.get_type() == OnewayOSMEnum.IN_REVERSE_ORDER:
-                from_node, to_node = to_node, from_node
-
-            edge_counter = self._write_edge(f, way, from_node, to_node, edge_counter, ways_ids)
-            if way.get_type() == OnewayOSMEnum.BIDIRECTIONAL or on_foot:
-                edge_counter = self._write_edge(f, way, to_node, from_node, edge_counter, ways_ids)
+        for from_node_id, to_node_id in way.get_edges(on_foot):
+            from_node = node_dict.get(from_node_id)
+            to_node = node_dict.get(to_node_id)
+            edge_counter = self._write_edge(f, way, from_node, to_node, edge_counter, ways_ids, next(weights))
 
-    def _write_edge(self, f, way: Way, from_node: Node, to_node: Node, edge_counter: int, way_ids: list[str]):
+    def _write_edge(self, f, way: Way, from_node: Node, to_node: Node, edge_counter: int, way_ids: list[str],
+                    weight: float):
         """
         It writes down the edge facts related
         :param f: The file to write
@@ -100,14 +150,13 @@ class FactsWriter:
         :param to_node: The to node
         :param edge_counter: how many edges has been generated by the original way
         :param way_ids: The array of ways generated
+        :param weight: The distance in metres between the nodes, written with all its digits
         :return: The new number of edges after the generation
         """
         way_id = self._generate_way_id_fact(way, edge_counter)
-        self._write_fact(f, way_id, 'from_node', f"node{from_node.id_node}")
-        self._write_fact(f, way_id, 'to_node', f"node{to_node.id_node}")
-        if(way.get_type() == OnewayOSMEnum.BIDIRECTIONAL):
-            self._write_fact(f, way_id, 'bidirectional', 'true')
-        self._write_fact(f, way_id, 'type', 'way')
+        bidirectional = 'true' if way.get_type() == OnewayOSMEnum.BIDIRECTIONAL else 'false'
+        self._write_fact(f, 'edge', self._generate_node_id_fact(from_node), self._generate_node_id_fact(to_node),
+                         way_id, repr(weight), bidirectional)
         way_ids.append(way_id)
         return edge_counter + 1
 
@@ -0,0 +1,14 @@
+import hashlib
+
+
+def file_sha256(path: str) -> str:
+    """
+    It computes the hash of a file reading it in chunks
+    :param path: The path of the file
+    :return: The hexadecimal digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -2,7 +2,7 @@ import logging
 import xml.etree.ElementTree as elementTree
 import logging
 
-from src.model.osm.node import Node
+from src.model.osm.node import Node, NodeOSMEnum
 from src.model.osm.way import Way
 
 
@@ -32,12 +32,15 @@ class OSMXmlParser:
     def __init__(self):
         logging.debug('OSMXmlParser service initialed.')
 
-    def parse_osm_xml(self, file, on_foot):
+    def parse_osm_xml(self, file, on_foot, streaming: bool = False):
         """
         :param self:
         :param file: The file with
+        :param streaming: If True the file is parsed incrementally, see parse_osm_xml_streaming
         :return:
         """
+        if streaming:
+            return self.parse_osm_xml_streaming(file, on_foot)
         logging.debug('Starting the parse of osm xml data..')
         tree = elementTree.parse(file)
         root = tree.getroot()
@@ -63,6 +66,81 @@ class OSMXmlParser:
 
         logging.debug('Filtering unused data..')
         logging.debug(f'Number of node before filtering {len(node_dict)} number of ways {len(ways)}')
+        drivable_ways, node_refs = self._filter_ways(ways, on_foot)
+
+        nodes = list(map(lambda id_node: node_dict.get(id_node), node_refs))
+        logging.debug(f'Completed filtering of unused data. node found {len(nodes)}')
+        return ParsingResult(nodes, drivable_ways)
+
+    def parse_osm_xml_streaming(self, file, on_foot) -> ParsingResult:
+        """
+        It parses the xml incrementally, clearing every element once it has been read, so that the memory used
+        does not depend on the size of the xml. The file is read twice: the first time only the ways are kept,
+        the second time only the nodes referenced by the kept ways are built.
+        :param file: The file with the open street data, it must be seekable
+        :param on_foot: If the ways not drivable by car have to be kept
+        :return: The same result of parse_osm_xml
+        """
+        logging.debug('Starting the streaming parse of osm xml data..')
+
+        # Parsing ways
+        logging.debug('Starting parsing of way..')
+        ways = []
+        for wayElement in self._iter_elements(file, 'way'):
+            way = Way.from_xlm_element(wayElement)
+            if on_foot or way.is_drivable():
+                ways.append(way)
+        logging.debug('Parsing of way completed.')
+
+        logging.debug('Filtering unused data..')
+        drivable_ways, node_refs = self._filter_ways(ways, on_foot)
+
+        # Parsing only the nodes that are referenced by the ways
+        file.seek(0)
+        node_dict = dict()
+        logging.debug('Starting parsing of nodes..')
+        for nodeElement in self._iter_elements(file, 'node'):
+            if int(nodeElement.get(NodeOSMEnum.ID.value)) in node_refs:
+                node = Node.from_osm_xml_element(nodeElement)
+                node_dict.update({node.id_node: node})
+        logging.debug('Parsing of nodes completed.')
+
+        nodes = list(map(lambda id_node: node_dict.get(id_node), node_refs))
+        logging.debug(f'Completed filtering of unused data. node found {len(nodes)}')
+        return ParsingResult(nodes, drivable_ways)
+
+    def _iter_elements(self, file, tag: str):
+        """
+        It yields, one at a time, the complete elements with the given tag that are direct children of the root.
+        Every element is cleared, together with the already read children of the root, as soon as it has been used.
+        :param file: The file to read
+        :param tag: The tag of the elements to yield
+        :return: A generator of the elements
+        """
+        root = None
+        depth = 0
+        for event, element in elementTree.iterparse(file, events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = element
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+            if element.tag == tag:
+                yield element
+            element.clear()
+            root.clear()
+
+    def _filter_ways(self, ways: list[Way], on_foot) -> tuple[list[Way], set[int]]:
+        """
+        It removes the ways that are not usable and simplifies the others keeping only the nodes at the extremes
+        and the ones shared between two or more ways
+        :param ways: All the ways parsed
+        :param on_foot: If the ways not drivable by car have to be kept
+        :return: The ways kept and the set of ids of the nodes referenced by them
+        """
         node_refs = set()
         node_cnt = dict()
         if on_foot:
@@ -94,8 +172,4 @@ class OSMXmlParser:
                     del(w.node_list[i])
 
         drivable_ways = list(filter(lambda _: len(_.node_list) > 1, drivable_ways))
-
-
-        nodes = list(map(lambda id_node: node_dict.get(id_node), node_refs))
-        logging.debug(f'Completed filtering of unused data. node found {len(nodes)}')
-        return ParsingResult(nodes, drivable_ways)
+        return drivable_ways, node_refs
@@ -0,0 +1,368 @@
+import logging
+import os
+from array import array
+
+import numpy as np
+
+from src.model.osm.way import Way
+from src.model.prolog.node import Node, node_registry
+from src.service.data.osm_xml_parser import ParsingResult
+from src.service.graph.components import ComponentIndex
+from src.service.graph.edge_weights import haversine_metres, travel_seconds
+from src.service.graph.spatial_index import SpatialIndex
+
+
+class CompiledGraph:
+    """
+    The road graph compiled in arrays: the coordinates of the nodes and the adjacency in compressed sparse row
+    format. It answers the same questions of the knowledge base used by the search, so it can replace it.
+    The weights of the edges are computed once when the graph is compiled, as the distance in metres between their
+    nodes and as the time to travel them at the max speed of their way.
+    """
+
+    ARRAYS = ('node_ids', 'lat', 'lon', 'indptr', 'indices', 'weights', 'travel_times')
+    """
+    The names of the arrays stored on disk, one file for each
+    """
+
+    def __init__(self, node_ids: np.ndarray, lat: np.ndarray, lon: np.ndarray,
+                 indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray, travel_times: np.ndarray):
+        """
+        :param node_ids: The open street map id of each node, the position is the index of the node
+        :param lat: The latitude of each node
+        :param lon: The longitude of each node
+        :param indptr: The edges leaving the node i are the ones from indptr[i] to indptr[i + 1]
+        :param indices: The index of the node reached by each edge
+        :param weights: The cost of each edge, the distance in metres between its nodes, or the travel time on the
+        graph returned by by_travel_time
+        :param travel_times: The seconds needed to travel each edge
+        """
+        self.node_ids = node_ids
+        self.lat = lat
+        self.lon = lon
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.travel_times = travel_times
+        # The nodes are registered only when they are needed, so that loading a memory-mapped graph stays cheap
+        self._keys = None
+        self._positions = None
+        self._adjacency_lists = None
+        self._reversed = None
+        self._components = None
+        self._spatial_index = None
+
+    @classmethod
+    def from_parsing_result(cls, data: ParsingResult, on_foot: bool) -> 'CompiledGraph':
+        """
+        It compiles the graph from the parsing of open street data, generating the same edges written as facts
+        :param data: The data from the parsing
+        :param on_foot: If every edge can be walked in both directions
+        :return: The compiled graph
+        """
+        logging.debug('Compiling the graph..')
+        node_ids = np.array([node.id_node for node in data.node_list], dtype=np.int64)
+        lat = np.array([node.lat for node in data.node_list], dtype=np.float64)
+        lon = np.array([node.lon for node in data.node_list], dtype=np.float64)
+        position = {node_id: i for i, node_id in enumerate(node_ids.tolist())}
+        edges = []
+        max_speeds = []
+        for way in data.way_list:
+            # The speed is read once for each way, it can be a fraction when it's converted from mph
+            max_speed = way.get_max_speed()
+            for from_id, to_id in way.get_edges(on_foot):
+                edges.append((position[from_id], position[to_id]))
+                max_speeds.append(max_speed)
+        edges = np.array(edges, dtype=np.int64).reshape(-1, 2)
+        graph = cls._from_edges(node_ids, lat, lon, edges[:, 0], edges[:, 1],
+                                max_speeds=np.array(max_speeds, dtype=np.float64))
+        logging.debug(f'Graph compiled with {len(node_ids)} nodes and {len(graph.indices)} edges.')
+        return graph
+
+    @classmethod
+    def from_knowledge_base(cls, knowledge_base) -> 'CompiledGraph':
+        """
+        It compiles the graph reading the nodes and the weighted edges from the knowledge base.
+        The knowledge base doesn't tell the speed of the ways, so the travel times are computed at the default one.
+        :param knowledge_base: The client of the knowledge base
+        :return: The compiled graph
+        """
+        logging.debug('Compiling the graph from the knowledge base..')
+        nodes = knowledge_base.ask_all_node()
+        node_ids = np.array([cls._osm_id(node.id) for node in nodes], dtype=np.int64)
+        lat = np.array([node.lat for node in nodes], dtype=np.float64)
+        lon = np.array([node.lon for node in nodes], dtype=np.float64)
+        position = {node.id: i for i, node in enumerate(nodes)}
+        edges = knowledge_base.ask_weighted_edges()
+        sources = np.array([position[from_id] for from_id, _, _ in edges], dtype=np.int64)
+        targets = np.array([position[to_id] for _, to_id, _ in edges], dtype=np.int64)
+        weights = np.array([distance for _, _, distance in edges], dtype=np.float64)
+        return cls._from_edges(node_ids, lat, lon, sources, targets, weights)
+
+    @classmethod
+    def _from_edges(cls, node_ids: np.ndarray, lat: np.ndarray, lon: np.ndarray, sources: np.ndarray,
+                    targets: np.ndarray, weights: np.ndarray = None, max_speeds: np.ndarray = None,
+                    travel_times: np.ndarray = None) -> 'CompiledGraph':
+        """
+        It builds the compressed rows from the list of edges, keeping the order of the edges of each node.
+        :param sources: The index of the starting node of each edge
+        :param targets: The index of the ending node of each edge
+        :param weights: The cost of each edge, if None it's the distance in metres between the coordinates of its
+        nodes, as in the knowledge base, computed for all the edges at once
+        :param max_speeds: The max speed in km/h of the way of each edge, the default speed if None
+        :param travel_times: The seconds needed to travel each edge, if None they are computed from the weights and
+        the max speeds
+        :return: The compiled graph
+        """
+        order = np.argsort(sources, kind='stable')
+        sources = sources[order]
+        targets = targets[order]
+        indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(node_ids)), out=indptr[1:])
+        if weights is None:
+            weights = haversine_metres(lat[sources], lon[sources], lat[targets], lon[targets])
+        else:
+            weights = weights[order]
+        if travel_times is None:
+            max_speeds = Way.DEFAULT_MAX_SPEED if max_speeds is None else max_speeds[order]
+            travel_times = travel_seconds(weights, max_speeds)
+        else:
+            travel_times = travel_times[order]
+        return cls(node_ids, lat, lon, indptr, targets.astype(np.int32), weights, travel_times)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> 'CompiledGraph':
+        """
+        It loads the graph saved in the given directory
+        :param directory: The directory with the arrays
+        :param mmap: If True the arrays are memory-mapped instead of being read
+        :return: The graph loaded
+        """
+        mmap_mode = 'r' if mmap else None
+        arrays = [np.load(os.path.join(directory, f'{name}.npy'), mmap_mode=mmap_mode) for name in cls.ARRAYS]
+        graph = cls(*arrays)
+        if all(os.path.isfile(os.path.join(directory, f'{name}.npy')) for name in ComponentIndex.ARRAYS):
+            graph._components = ComponentIndex.load(directory, mmap)
+        if all(os.path.isfile(os.path.join(directory, f'{name}.npy')) for name in SpatialIndex.ARRAYS):
+            graph._spatial_index = SpatialIndex.load(directory, graph.lat, graph.lon, mmap)
+        return graph
+
+    def save(self, directory: str):
+        """
+        It saves every array of the graph, its components and its spatial index, in the given directory
+        :param directory: The directory where to save the arrays
+        :return:
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(os.path.join(directory, f'{name}.npy'), np.ascontiguousarray(getattr(self, name)))
+        self.components().save(directory)
+        self.spatial_index().save(directory)
+
+    def reversed(self) -> 'CompiledGraph':
+        """
+        It returns the graph with every edge reversed, used to search backwards from a node
+        :return: The reversed graph, it shares the nodes with this one
+        """
+        sources = np.repeat(np.arange(self.node_count(), dtype=np.int64), np.diff(self.indptr))
+        return self._from_edges(self.node_ids, self.lat, self.lon, np.asarray(self.indices, dtype=np.int64),
+                                sources, np.asarray(self.weights), travel_times=np.asarray(self.travel_times))
+
+    def by_travel_time(self) -> 'CompiledGraph':
+        """
+        It returns the graph with the travel times as the costs of the edges, so that the searches, the distances and
+        the estimates computed on it give the fastest paths instead of the shortest ones
+        :return: The graph, it shares the arrays, the components and the spatial index with this one
+        """
+        graph = CompiledGraph(self.node_ids, self.lat, self.lon, self.indptr, self.indices, self.travel_times,
+                              self.travel_times)
+        # The components and the grid don't depend on the costs of the edges
+        graph._components = self._components
+        graph._spatial_index = self._spatial_index
+        return graph
+
+    def components(self) -> ComponentIndex:
+        """
+        It returns the strongly connected components of the graph, computed once and then reused
+        :return: The index of the components
+        """
+        if self._components is None:
+            self._components = ComponentIndex.from_graph(self)
+        return self._components
+
+    def spatial_index(self) -> SpatialIndex:
+        """
+        It returns the grid over the coordinates of the nodes, built once and then reused
+        :return: The spatial index
+        """
+        if self._spatial_index is None:
+            self._spatial_index = SpatialIndex.from_graph(self)
+        return self._spatial_index
+
+    def nearest_node(self, lat: float, lon: float, min_component_size: int = 1) -> Node:
+        """
+        It snaps the coordinates to the closest node of the graph whose strongly connected component is large enough,
+        so that a trip starting there can reach enough other nodes. The candidates are asked for in growing batches,
+        from the closest.
+        :param lat: The latitude
+        :param lon: The longitude
+        :param min_component_size: The least number of nodes of the component of the node
+        :return: The closest node
+        """
+        index = self.spatial_index()
+        components = self.components()
+        k = 1
+        while True:
+            candidates = index.nearest(lat, lon, k)
+            for i in candidates:
+                if components.size(int(components.component_of[i])) >= min_component_size:
+                    return self.node(i)
+            if len(candidates) < k:
+                raise ValueError(f'No strongly connected component has {min_component_size} nodes')
+            k *= 2
+
+    def adjacency_lists(self) -> tuple[list[int], list[int], list[float]]:
+        """
+        It returns the compressed rows as python lists, that are faster to read one item at a time.
+        They are computed once and then reused.
+        :return: The lists indptr, indices and weights
+        """
+        if self._adjacency_lists is None:
+            self._adjacency_lists = (self.indptr.tolist(), self.indices.tolist(), self.weights.tolist())
+        return self._adjacency_lists
+
+    @property
+    def keys(self) -> list[int]:
+        """
+        The key of each node in the registry, the nodes are all registered the first time it's asked for
+        """
+        if self._keys is None:
+            self._keys = [node_registry.key_of(self._prolog_id(node_id), node_lat, node_lon)
+                          for node_id, node_lat, node_lon in zip(self.node_ids.tolist(), self.lat.tolist(),
+                                                                 self.lon.tolist())]
+        return self._keys
+
+    @property
+    def index_of_key(self) -> array:
+        """
+        The index in the arrays of each registered node, -1 for the nodes that aren't in the graph
+        """
+        if self._positions is None:
+            self._positions = node_registry.positions(self.keys)
+        return self._positions
+
+    def index_of(self, node_id: str) -> int:
+        """
+        :param node_id: The id of the node in the knowledge base
+        :return: The index of the node in the arrays
+        """
+        # The nodes of the graph have to be registered before the key of one is looked up
+        positions = self.index_of_key
+        key = node_registry.key(node_id)
+        if key >= len(positions) or positions[key] < 0:
+            raise KeyError(node_id)
+        return positions[key]
+
+    def index_of_node(self, node: Node) -> int:
+        """
+        :param node: A node of the graph
+        :return: The index of the node in the arrays
+        """
+        return self._index_of_key(node.key, node.id)
+
+    def _index_of_key(self, key: int, node_id: str) -> int:
+        if key >= len(self.index_of_key) or self.index_of_key[key] < 0:
+            raise KeyError(node_id)
+        return self.index_of_key[key]
+
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    def edge_count(self) -> int:
+        return len(self.indices)
+
+    def ask_all_node(self) -> list[Node]:
+        """
+        It returns all the nodes of the graph
+        :return: The list of all the nodes
+        """
+        return [self.node(i) for i in range(self.node_count())]
+
+    def ask_neighbours_of_node(self, from_node_id: str) -> list[Node]:
+        """
+        It returns the neighbours of a node
+        :param from_node_id: The node id
+        :return: The list of neighbours
+        """
+        i = self.index_of(from_node_id)
+        return [self.node(j) for j in self.indices[self.indptr[i]:self.indptr[i + 1]].tolist()]
+
+    def ask_weighted_neighbours_of_node(self, from_node_id: str) -> list[tuple[Node, float]]:
+        """
+        It returns the neighbours of a node with the cost of the edge to reach each of them
+        :param from_node_id: The node id
+        :return: The list of (neighbour, distance)
+        """
+        i = self.index_of(from_node_id)
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return [(self.node(j), w) for j, w in zip(self.indices[start:end].tolist(), self.weights[start:end].tolist())]
+
+    def ask_weighted_predecessors_of_node(self, to_node_id: str) -> list[tuple[Node, float]]:
+        """
+        It returns the nodes with an edge to the given one, with the cost of the edge.
+        The reversed graph is computed the first time and then reused.
+        :param to_node_id: The node id
+        :return: The list of (predecessor, distance)
+        """
+        if self._reversed is None:
+            self._reversed = self.reversed()
+        return self._reversed.ask_weighted_neighbours_of_node(to_node_id)
+
+    def get_distance_between_nodes(self, from_node_id: str, to_node_id: str) -> float:
+        """
+        It returns the distance between two nodes
+        :param from_node_id: The id of the starting node
+        :param to_node_id: The id of the ending node
+        :return: the distance in metres between the two nodes
+        """
+        i = self.index_of(from_node_id)
+        j = self.index_of(to_node_id)
+        return float(haversine_metres(self.lat[i], self.lon[i], self.lat[j], self.lon[j]))
+
+    def ask_weighted_edges(self) -> list[tuple[str, str, float]]:
+        """
+        It returns all the edges of the graph with their distance
+        :return: The list of (from node id, to node id, distance)
+        """
+        ids = [node_registry.ids[key] for key in self.keys]
+        sources = np.repeat(np.arange(self.node_count()), np.diff(self.indptr)).tolist()
+        return [(ids[i], ids[j], w) for i, j, w in zip(sources, self.indices.tolist(), self.weights.tolist())]
+
+    def node(self, i: int) -> Node:
+        """
+        It returns the node, as returned by the knowledge base, for the given index
+        :param i: The index of the node
+        :return: The node
+        """
+        if self._keys is None:
+            # A single node is registered, without registering the whole graph
+            return node_registry.intern(self._prolog_id(int(self.node_ids[i])), float(self.lat[i]), float(self.lon[i]))
+        return node_registry.node(self._keys[i])
+
+    @staticmethod
+    def _prolog_id(node_id: int) -> str:
+        """
+        It returns the id used in the knowledge base for the given open street map id
+        :param node_id: The open street map id
+        :return: The id of the fact
+        """
+        return f"node{node_id}"
+
+    @staticmethod
+    def _osm_id(prolog_id: str) -> int:
+        """
+        It returns the open street map id of the given id of the knowledge base
+        :param prolog_id: The id of the fact
+        :return: The open street map id
+        """
+        return int(prolog_id.removeprefix('node'))
@@ -0,0 +1,128 @@
+import logging
+import os
+from random import sample
+
+import numpy as np
+
+
+class ComponentIndex:
+    """
+    The strongly connected components of the graph: two nodes are in the same component when each one can be reached
+    from the other. The nodes are stored grouped by component, so that a component can be sampled directly.
+    """
+
+    ARRAYS = ('component_of', 'members', 'starts')
+    """
+    The names of the arrays stored on disk, one file for each
+    """
+
+    def __init__(self, component_of: np.ndarray, members: np.ndarray, starts: np.ndarray):
+        """
+        :param component_of: The component of each node
+        :param members: The nodes grouped by component
+        :param starts: The nodes of the component c are the ones from members[starts[c]] to members[starts[c + 1]]
+        """
+        self.component_of = component_of
+        self.members = members
+        self.starts = starts
+
+    @classmethod
+    def from_graph(cls, graph) -> 'ComponentIndex':
+        """
+        It finds the components with the algorithm of Tarjan, without recursion
+        :param graph: The compiled graph
+        :return: The index of the components
+        """
+        logging.debug('Computing the strongly connected components..')
+        indptr, indices, _ = graph.adjacency_lists()
+        count = graph.node_count()
+        component_of = [-1] * count
+        order = [-1] * count  # the order of visit of each node
+        low = [0] * count  # the first visited node reachable from each node, while it's on the stack
+        stack = []
+        visited = 0
+        components = 0
+        for root in range(count):
+            if order[root] != -1:
+                continue
+            work = [(root, indptr[root])]  # the nodes of the current path with the next edge to follow
+            order[root] = low[root] = visited
+            visited += 1
+            stack.append(root)
+            while work:
+                v, edge = work[-1]
+                if edge < indptr[v + 1]:
+                    work[-1] = (v, edge + 1)
+                    w = indices[edge]
+                    if order[w] == -1:
+                        order[w] = low[w] = visited
+                        visited += 1
+                        stack.append(w)
+                        work.append((w, indptr[w]))
+                    elif component_of[w] == -1:
+                        low[v] = min(low[v], order[w])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[v])
+                if low[v] == order[v]:
+                    while True:
+                        w = stack.pop()
+                        component_of[w] = components
+                        if w == v:
+                            break
+                    components += 1
+        component_of = np.array(component_of, dtype=np.int32)
+        members = np.argsort(component_of, kind='stable').astype(np.int32)
+        starts = np.zeros(components + 1, dtype=np.int64)
+        np.cumsum(np.bincount(component_of, minlength=components), out=starts[1:])
+        logging.debug(f'Found {components} strongly connected components.')
+        return cls(component_of, members, starts)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> 'ComponentIndex':
+        """
+        It loads the index saved in the given directory
+        :param directory: The directory with the arrays
+        :param mmap: If True the arrays are memory-mapped instead of being read
+        :return: The index loaded
+        """
+        mmap_mode = 'r' if mmap else None
+        return cls(*[np.load(os.path.join(directory, f'{name}.npy'), mmap_mode=mmap_mode) for name in cls.ARRAYS])
+
+    def save(self, directory: str):
+        """
+        It saves every array of the index in the given directory
+        :param directory: The directory where to save the arrays
+        :return:
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(os.path.join(directory, f'{name}.npy'), np.ascontiguousarray(getattr(self, name)))
+
+    def component_count(self) -> int:
+        return len(self.starts) - 1
+
+    def largest(self) -> int:
+        """
+        :return: The component with the most nodes
+        """
+        return int(np.argmax(np.diff(self.starts)))
+
+    def size(self, component: int) -> int:
+        return int(self.starts[component + 1] - self.starts[component])
+
+    def sample(self, k: int, component: int = None) -> list[int]:
+        """
+        It picks k distinct nodes at random from a single component, in O(k)
+        :param k: The number of nodes
+        :param component: The component to pick them from, the largest one if None
+        :return: The indexes of the nodes picked
+        """
+        if component is None:
+            component = self.largest()
+        if k > self.size(component):
+            raise ValueError(f'The component {component} has only {self.size(component)} nodes, {k} were asked')
+        start = int(self.starts[component])
+        return [int(self.members[i]) for i in sample(range(start, start + self.size(component)), k)]
@@ -0,0 +1,31 @@
+import numpy as np
+
+EARTH_RADIUS = 6371000.0
+"""
+The mean radius of the earth in metres, the same used by haversine_distance in the rules
+"""
+
+
+def haversine_metres(from_lat, from_lon, to_lat, to_lon) -> np.ndarray:
+    """
+    It computes the great circle distance of every pair of coordinates at once
+    :param from_lat: The latitudes of the starting points, in degrees
+    :param from_lon: The longitudes of the starting points, in degrees
+    :param to_lat: The latitudes of the ending points, in degrees
+    :param to_lon: The longitudes of the ending points, in degrees
+    :return: The distances in metres
+    """
+    from_lat, from_lon, to_lat, to_lon = (np.radians(np.asarray(values, dtype=np.float64))
+                                          for values in (from_lat, from_lon, to_lat, to_lon))
+    a = np.sin((to_lat - from_lat) / 2) ** 2 + np.cos(from_lat) * np.cos(to_lat) * np.sin((to_lon - from_lon) / 2) ** 2
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(a))
+
+
+def travel_seconds(metres, max_speed) -> np.ndarray:
+    """
+    It computes the time to travel every distance at the given speed
+    :param metres: The distances in metres
+    :param max_speed: The speeds in km/h
+    :return: The times in seconds
+    """
+    return np.asarray(metres, dtype=np.float64) / (np.asarray(max_speed, dtype=np.float64) / 3.6)
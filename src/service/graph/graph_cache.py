@@ -0,0 +1,102 @@
+import json
+import logging
+import os
+from typing import Callable
+
+from src.service.data.file_hash import file_sha256
+from src.service.data.osm_xml_parser import ParsingResult
+from src.service.graph.compiled_graph import CompiledGraph
+from src.service.graph.components import ComponentIndex
+from src.service.graph.spatial_index import SpatialIndex
+
+
+class GraphCache:
+    """
+    The on-disk cache of the compiled graph. A graph is compiled once for each open street data file and profile,
+    then it is memory-mapped by the following runs. If the source file changes the graph is compiled again.
+    """
+
+    _VERSION = 6
+    """
+    The version of the format of the cache, it has to be increased when the stored arrays change
+    """
+
+    _META_FILE = 'meta.json'
+
+    def __init__(self, cache_dir: str):
+        """
+        :param cache_dir: The directory where the compiled graphs are stored
+        """
+        self.cache_dir = cache_dir
+        logging.debug('GraphCache service initiated.')
+
+    def load_or_build(self, path_to_osm_data: str, on_foot: bool,
+                      parse: Callable[[], ParsingResult]) -> CompiledGraph:
+        """
+        It loads the compiled graph for the given data, compiling it if it is missing or stale
+        :param path_to_osm_data: The path of the file of the open street model
+        :param on_foot: The profile of the graph
+        :param parse: The function that parses the open street data, called only if the graph has to be compiled
+        :return: The compiled graph
+        """
+        directory = self.get_directory(on_foot)
+        meta = self._expected_meta(path_to_osm_data, on_foot)
+        if self._is_valid(directory, meta):
+            logging.info(f"Loading compiled graph from '{directory}'..")
+            return CompiledGraph.load(directory)
+        logging.info(f"Compiled graph in '{directory}' missing or stale, compiling it..")
+        graph = CompiledGraph.from_parsing_result(parse(), on_foot)
+        self._store(directory, graph, meta)
+        return graph
+
+    def get_directory(self, on_foot: bool) -> str:
+        """
+        :param on_foot: The profile of the graph
+        :return: The directory of the compiled graph for the given profile
+        """
+        return os.path.join(self.cache_dir, 'graph_foot' if on_foot else 'graph_car')
+
+    def _expected_meta(self, path_to_osm_data: str, on_foot: bool) -> dict:
+        """
+        It computes the metadata that a valid compiled graph must have
+        :param path_to_osm_data: The path of the file of the open street model
+        :param on_foot: The profile of the graph
+        :return: The metadata
+        """
+        return {'version': self._VERSION, 'osm_sha256': file_sha256(path_to_osm_data), 'on_foot': on_foot}
+
+    def _is_valid(self, directory: str, meta: dict) -> bool:
+        """
+        Tells if the compiled graph in the directory is complete and built from the same data
+        :param directory: The directory of the compiled graph
+        :param meta: The expected metadata
+        :return: True if the graph can be loaded
+        """
+        try:
+            with open(os.path.join(directory, self._META_FILE), 'r') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if any(stored.get(key) != value for key, value in meta.items()):
+            return False
+        return all(os.path.isfile(os.path.join(directory, f'{name}.npy'))
+                   for name in CompiledGraph.ARRAYS + ComponentIndex.ARRAYS + SpatialIndex.ARRAYS)
+
+    def _store(self, directory: str, graph: CompiledGraph, meta: dict):
+        """
+        It saves the graph, writing the metadata last so that an interrupted write is detected as stale
+        :param directory: The directory of the compiled graph
+        :param graph: The graph to save
+        :param meta: The metadata of the graph
+        :return:
+        """
+        meta_path = os.path.join(directory, self._META_FILE)
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+        graph.save(directory)
+        meta = dict(meta, nodes=graph.node_count(), edges=graph.edge_count())
+        with open(meta_path + '.tmp', 'w') as f:
+            json.dump(meta, f)
+        os.replace(meta_path + '.tmp', meta_path)
+        logging.debug(f"Compiled graph stored in '{directory}'.")
+
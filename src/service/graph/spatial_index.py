@@ -0,0 +1,251 @@
+import logging
+import math
+import os
+
+import numpy as np
+
+from src.service.graph.edge_weights import EARTH_RADIUS
+
+
+class SpatialIndex:
+    """
+    A uniform grid over the coordinates of the nodes, used to snap arbitrary coordinates to the graph.
+    The nodes are stored grouped by cell, and the cells of a row are consecutive, so a run of cells in a row is a single
+    slice of the members. The coordinates are projected on the plane tangent to the centre of the area, so the distances
+    are in metres, as the weights of the compiled graph, and they are accurate at the scale of a city.
+    """
+
+    ARRAYS = ('grid_members', 'grid_starts', 'grid_bounds')
+    """
+    The names of the arrays stored on disk, one file for each
+    """
+
+    METRES_PER_DEGREE = EARTH_RADIUS * math.pi / 180
+    """
+    The metres of a degree of latitude
+    """
+
+    NODES_PER_CELL = 2
+    """
+    The number of nodes in a cell on average, used to choose the size of the cells
+    """
+
+    def __init__(self, lat: np.ndarray, lon: np.ndarray, grid_members: np.ndarray, grid_starts: np.ndarray,
+                 grid_bounds: np.ndarray):
+        """
+        :param lat: The latitude of each node
+        :param lon: The longitude of each node
+        :param grid_members: The nodes grouped by cell, the cell of row i and column j is the cell i * columns + j
+        :param grid_starts: The nodes of the cell c are the ones from grid_members[grid_starts[c]] to
+        grid_members[grid_starts[c + 1]]
+        :param grid_bounds: The first latitude, the first longitude, the size of a cell in metres, the number of rows,
+        the number of columns, the length of the longest edge in metres and the metres of a degree of longitude
+        """
+        self.lat = lat
+        self.lon = lon
+        self.grid_members = grid_members
+        self.grid_starts = grid_starts
+        self.grid_bounds = grid_bounds
+        self.min_lat, self.min_lon, self.cell_size = (float(value) for value in grid_bounds[:3])
+        self.rows, self.columns = int(grid_bounds[3]), int(grid_bounds[4])
+        self.max_edge_length = float(grid_bounds[5])
+        self.metres_per_degree_lon = float(grid_bounds[6])
+
+    @classmethod
+    def from_graph(cls, graph) -> 'SpatialIndex':
+        """
+        It puts every node of the graph in the cell of its coordinates
+        :param graph: The compiled graph
+        :return: The spatial index
+        """
+        logging.debug('Building the spatial index..')
+        lat = np.asarray(graph.lat, dtype=np.float64)
+        lon = np.asarray(graph.lon, dtype=np.float64)
+        count = len(lat)
+        min_lat, min_lon = (float(lat.min()), float(lon.min())) if count else (0.0, 0.0)
+        centre_lat = (min_lat + float(lat.max())) / 2 if count else 0.0
+        metres_per_degree_lon = cls.METRES_PER_DEGREE * math.cos(math.radians(centre_lat))
+        y = (lat - min_lat) * cls.METRES_PER_DEGREE
+        x = (lon - min_lon) * metres_per_degree_lon
+        height, width = (float(y.max()), float(x.max())) if count else (0.0, 0.0)
+        # Square cells, sized so that a cell holds a few nodes when they are spread over the whole area
+        cell_size = math.sqrt(height * width * cls.NODES_PER_CELL / max(count, 1)) or max(height, width, 1.0)
+        rows = int(height / cell_size) + 1
+        columns = int(width / cell_size) + 1
+        cell_of = ((y / cell_size).astype(np.int64).clip(0, rows - 1) * columns
+                   + (x / cell_size).astype(np.int64).clip(0, columns - 1))
+        grid_members = np.argsort(cell_of, kind='stable').astype(np.int32)
+        grid_starts = np.zeros(rows * columns + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cell_of, minlength=rows * columns), out=grid_starts[1:])
+        sources = np.repeat(np.arange(count), np.diff(np.asarray(graph.indptr)))
+        targets = np.asarray(graph.indices)
+        lengths = np.hypot(y[sources] - y[targets], x[sources] - x[targets])
+        max_edge_length = float(lengths.max()) if len(lengths) else 0.0
+        grid_bounds = np.array([min_lat, min_lon, cell_size, rows, columns, max_edge_length, metres_per_degree_lon],
+                               dtype=np.float64)
+        logging.debug(f'Spatial index built with {rows}x{columns} cells.')
+        return cls(lat, lon, grid_members, grid_starts, grid_bounds)
+
+    @classmethod
+    def load(cls, directory: str, lat: np.ndarray, lon: np.ndarray, mmap: bool = True) -> 'SpatialIndex':
+        """
+        It loads the index saved in the given directory
+        :param directory: The directory with the arrays
+        :param lat: The latitude of each node of the graph
+        :param lon: The longitude of each node of the graph
+        :param mmap: If True the arrays are memory-mapped instead of being read
+        :return: The index loaded
+        """
+        mmap_mode = 'r' if mmap else None
+        return cls(lat, lon,
+                   *[np.load(os.path.join(directory, f'{name}.npy'), mmap_mode=mmap_mode) for name in cls.ARRAYS])
+
+    def save(self, directory: str):
+        """
+        It saves every array of the index in the given directory
+        :param directory: The directory where to save the arrays
+        :return:
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(os.path.join(directory, f'{name}.npy'), np.ascontiguousarray(getattr(self, name)))
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> list[int]:
+        """
+        It finds the k nodes closest to the given coordinates, visiting the cells in rings around them
+        :param lat: The latitude
+        :param lon: The longitude
+        :param k: The number of nodes
+        :return: The indexes of the nodes, from the closest
+        """
+        k = min(k, len(self.grid_members))
+        if k <= 0:
+            return []
+        row, column = self._cell(lat, lon)
+        # The rings before the first one that touches the grid are empty
+        ring = max(0, row - self.rows + 1, -row, column - self.columns + 1, -column)
+        last_ring = max(row, self.rows - 1 - row, column, self.columns - 1 - column)
+        candidates = []
+        while ring <= last_ring:
+            candidates.extend(self._ring(row, column, ring))
+            # Every node outside the rings visited is farther than ring cells from the coordinates
+            if len(candidates) >= k and self._sorted(candidates, lat, lon)[k - 1][0] <= ring * self.cell_size:
+                break
+            ring += 1
+        return [i for _, i in self._sorted(candidates, lat, lon)[:k]]
+
+    def nearest_many(self, lat, lon) -> np.ndarray:
+        """
+        It snaps a batch of coordinates to their closest nodes
+        :param lat: The latitudes
+        :param lon: The longitudes
+        :return: The index of the closest node to each pair of coordinates
+        """
+        return np.array([self.nearest(point_lat, point_lon)[0] for point_lat, point_lon in zip(lat, lon)],
+                        dtype=np.int64)
+
+    def within_radius(self, lat: float, lon: float, radius: float) -> list[int]:
+        """
+        It finds the nodes at most at the given distance from the coordinates
+        :param lat: The latitude
+        :param lon: The longitude
+        :param radius: The distance in metres
+        :return: The indexes of the nodes, from the closest
+        """
+        d_lat, d_lon = radius / self.METRES_PER_DEGREE, radius / self.metres_per_degree_lon
+        first_row, first_column = self._cell(lat - d_lat, lon - d_lon)
+        last_row, last_column = self._cell(lat + d_lat, lon + d_lon)
+        first_column, last_column = max(first_column, 0), min(last_column, self.columns - 1)
+        candidates = []
+        if first_column <= last_column:
+            for row in range(max(first_row, 0), min(last_row, self.rows - 1) + 1):
+                candidates.extend(self._run(row, first_column, last_column))
+        return [i for distance, i in self._sorted(candidates, lat, lon) if distance <= radius]
+
+    def nearest_edge(self, lat: float, lon: float, graph) -> tuple[int, int, float, float] | None:
+        """
+        It snaps the coordinates to the closest point of an edge of the graph.
+        An edge at most at distance d has its starting node at most at distance d plus the longest edge, so only the
+        edges leaving the nodes in that radius are measured, with d the distance of the closest node.
+        :param lat: The latitude
+        :param lon: The longitude
+        :param graph: The compiled graph the index was built on
+        :return: The index of the starting node of the edge, the index of its ending node, how far along the edge is
+        the closest point, from 0 to 1, and its distance in metres. None if the graph has no nodes.
+        """
+        closest = self.nearest(lat, lon)
+        if not closest:
+            return None
+        start = closest[0]
+        best = (start, start, 0.0, self._distance(start, lat, lon))
+        indptr, indices, _ = graph.adjacency_lists()
+        for u in self.within_radius(lat, lon, best[3] + self.max_edge_length):
+            for e in range(indptr[u], indptr[u + 1]):
+                v = indices[e]
+                fraction, distance = self._project(lat, lon, u, v)
+                if distance < best[3]:
+                    best = (u, v, fraction, distance)
+        return best
+
+    def _project(self, lat: float, lon: float, u: int, v: int) -> tuple[float, float]:
+        """
+        :return: How far along the segment from u to v is the point closest to the coordinates, and its distance
+        """
+        # The coordinates in metres from the node u
+        y, x = self._metres(lat - self.lat[u], lon - self.lon[u])
+        d_y, d_x = self._metres(self.lat[v] - self.lat[u], self.lon[v] - self.lon[u])
+        squared_length = d_y * d_y + d_x * d_x
+        fraction = 0.0
+        if squared_length > 0:
+            fraction = min(1.0, max(0.0, (y * d_y + x * d_x) / squared_length))
+        return fraction, math.hypot(fraction * d_y - y, fraction * d_x - x)
+
+    def _metres(self, d_lat: float, d_lon: float) -> tuple[float, float]:
+        """
+        :return: The given differences of latitude and longitude in metres
+        """
+        return float(d_lat) * self.METRES_PER_DEGREE, float(d_lon) * self.metres_per_degree_lon
+
+    def _distance(self, i: int, lat: float, lon: float) -> float:
+        """
+        :return: The distance in metres of the node from the coordinates
+        """
+        return math.hypot(*self._metres(self.lat[i] - lat, self.lon[i] - lon))
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        """
+        :return: The row and the column of the cell of the coordinates, they can be outside the grid
+        """
+        y, x = self._metres(lat - self.min_lat, lon - self.min_lon)
+        return math.floor(y / self.cell_size), math.floor(x / self.cell_size)
+
+    def _run(self, row: int, first_column: int, last_column: int) -> list[int]:
+        """
+        :return: The nodes in the cells of the row from the first to the last column, both included
+        """
+        cell = row * self.columns
+        return self.grid_members[self.grid_starts[cell + first_column]:
+                                 self.grid_starts[cell + last_column + 1]].tolist()
+
+    def _ring(self, row: int, column: int, ring: int) -> list[int]:
+        """
+        :return: The nodes in the cells at exactly ring cells from the given one, in the grid
+        """
+        first_column, last_column = max(column - ring, 0), min(column + ring, self.columns - 1)
+        if first_column > last_column:
+            return []
+        nodes = []
+        for i in range(max(row - ring, 0), min(row + ring, self.rows - 1) + 1):
+            if abs(i - row) == ring:
+                nodes.extend(self._run(i, first_column, last_column))
+            else:
+                for j in (column - ring, column + ring) if ring > 0 else (column,):
+                    if 0 <= j < self.columns:
+                        nodes.extend(self._run(i, j, j))
+        return nodes
+
+    def _sorted(self, candidates: list[int], lat: float, lon: float) -> list[tuple[float, int]]:
+        """
+        :return: The distance of each candidate from the coordinates, with the candidate, from the closest
+        """
+        return sorted((self._distance(i, lat, lon), i) for i in candidates)
@@ -0,0 +1,153 @@
+import io
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import redirect_stdout
+from typing import Callable
+
+
+class Stage:
+    """
+    A step of the pipeline, it's run when all the stages it depends on are completed
+    """
+
+    def __init__(self, name: str, function: Callable, depends_on: tuple[str, ...], in_main_thread: bool):
+        """
+        :param name: The name of the stage, its result is saved with this name
+        :param function: The function to run, it receives the results of the stages it depends on, in order
+        :param depends_on: The names of the stages that have to be completed before
+        :param in_main_thread: If True the stage is run by the thread that runs the pipeline, as it's needed by
+        the libraries bound to a thread, like the prolog engine
+        """
+        self.name = name
+        self.function = function
+        self.depends_on = depends_on
+        self.in_main_thread = in_main_thread
+
+
+class StagedExecutor:
+    """
+    It runs the stages of a pipeline as soon as the stages they depend on are completed, so that the independent
+    stages overlap on a pool of threads.
+    What a stage prints is held back and printed in the order the stages were added, so the output is the same of
+    running them one after the other.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """
+        :param max_workers: How many stages can run at the same time, with 1 the stages are run one after the other
+        """
+        self.max_workers = max_workers
+        self.stages = []
+        self.results = dict()
+
+    def add_stage(self, name: str, function: Callable, depends_on: tuple[str, ...] = (),
+                  in_main_thread: bool = False):
+        """
+        It adds a stage to the pipeline, after the stages it depends on
+        :param name: The name of the stage
+        :param function: The function to run with the results of the stages it depends on
+        :param depends_on: The names of the stages that have to be completed before
+        :param in_main_thread: If True the stage is never run on the pool
+        :return:
+        """
+        known = {stage.name for stage in self.stages}
+        missing = [dependency for dependency in depends_on if dependency not in known]
+        if missing:
+            raise ValueError(f"The stage '{name}' depends on stages not added before: {missing}")
+        self.stages.append(Stage(name, function, tuple(depends_on), in_main_thread or self.max_workers <= 1))
+
+    def run(self) -> dict:
+        """
+        It runs all the stages, an exception raised by a stage is raised again here
+        :return: The result of each stage, by name
+        """
+        output = _StageOutput(sys.stdout)
+        outputs = [io.StringIO() for _ in self.stages]
+        printed = 0
+        running = dict()  # future -> position of the stage
+        started = set()
+        stdout, sys.stdout = sys.stdout, output
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as pool:
+                while len(self.results) < len(self.stages):
+                    ready = [i for i, stage in enumerate(self.stages)
+                             if i not in started and all(d in self.results for d in stage.depends_on)]
+                    for i in ready:
+                        if not self.stages[i].in_main_thread:
+                            started.add(i)
+                            running[pool.submit(self._run_stage, self.stages[i], output, outputs[i])] = i
+                    main_thread_ready = [i for i in ready if self.stages[i].in_main_thread]
+                    if main_thread_ready:
+                        i = main_thread_ready[0]
+                        started.add(i)
+                        future = Future()
+                        future.set_result(self._run_stage(self.stages[i], output, outputs[i]))
+                        completed = [future]
+                        running[future] = i
+                    else:
+                        completed, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        i = running.pop(future)
+                        self.results[self.stages[i].name] = future.result()
+                    # The output of a stage is printed once every stage before it is completed
+                    while printed < len(self.stages) and self.stages[printed].name in self.results:
+                        stdout.write(outputs[printed].getvalue())
+                        printed += 1
+        finally:
+            sys.stdout = stdout
+        return self.results
+
+    def _run_stage(self, stage: Stage, output: '_StageOutput', buffer: io.StringIO):
+        logging.debug(f"Stage '{stage.name}' started.")
+        start_time = time.time()
+        output.local.buffer = buffer
+        try:
+            result = stage.function(*[self.results[dependency] for dependency in stage.depends_on])
+        finally:
+            output.local.buffer = None
+        logging.debug(f"Stage '{stage.name}' completed in {time.time() - start_time}s.")
+        return result
+
+
+class _StageOutput(io.TextIOBase):
+    """
+    The standard output used while the pipeline runs: what is printed by a stage goes to the buffer of the stage
+    running in the same thread
+    """
+
+    def __init__(self, target):
+        self.target = target
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        return (self.target if buffer is None else buffer).write(text)
+
+    def flush(self):
+        self.target.flush()
+
+
+def map_in_processes(function: Callable, items: list, max_workers: int,
+                     initializer: Callable = None, initargs: tuple = ()) -> list[tuple]:
+    """
+    It calls the function on every item in a pool of processes, the data shared by all the calls is passed once
+    to each process through the initializer
+    :param function: A function defined at the top level of a module, so that it can be sent to the processes
+    :param items: The arguments of the calls
+    :param max_workers: The number of processes
+    :param initializer: The function that receives the shared data in each process
+    :param initargs: The shared data
+    :return: For each item, in order, the result of the call and what it printed
+    """
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=initializer, initargs=initargs) as pool:
+        return list(pool.map(_call_capturing_output, [function] * len(items), items))
+
+
+def _call_capturing_output(function: Callable, item) -> tuple:
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        result = function(item)
+    return result, buffer.getvalue()
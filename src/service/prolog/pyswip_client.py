@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 from pyswip import Prolog
 from src.model.prolog.node import Node
 import logging
@@ -6,19 +8,88 @@ import time
 
 class PySwipClient:
     """
-    The Client to interact with the knowledge base
+    The Client to interact with the knowledge base.
+    The results of the queries are kept in a bounded cache, so a repeated query costs a dictionary lookup,
+    until the facts are reloaded.
     """
 
-    def __init__(self, path_to_facts: str, path_to_rules: str):
+    TABLING_FLAG = 'trip_planner_tabling'
+    """
+    The prolog flag read by the table directives of the rules, the heavy rules are tabled only if it's true
+    """
+
+    def __init__(self, path_to_facts: str, path_to_rules: str, quick_load: bool = True, cache_size: int = 4096,
+                 tabling: bool = False):
         """
         :param path_to_facts: the path to the facts to import
         :param path_to_rules: the path to the rules to import
+        :param quick_load: If True the facts are compiled once to a quick load file (.qlf) next to them, and the
+        following runs load it instead of the source, until the facts change
+        :param cache_size: How many query results are kept, 0 disables the cache
+        :param tabling: If True the heavy rules are tabled by prolog, so their answers are computed once
         """
         self.prolog = Prolog()
-        self.prolog.consult(path_to_facts)
+        self.path_to_facts = path_to_facts
+        self.quick_load = quick_load
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._load_facts()
+        # The table directives are next to the rules, they are applied while the rules are loaded
+        self._run(f"create_prolog_flag({self.TABLING_FLAG}, {str(tabling).lower()}, [type(boolean)])")
         self.prolog.consult(path_to_rules)
         logging.debug('Service PySwipClient initiated.')
 
+    def _load_facts(self):
+        if self.quick_load:
+            self._quick_load(self.path_to_facts)
+        else:
+            self.prolog.consult(self.path_to_facts)
+
+    def reload_facts(self):
+        """
+        It loads the facts again, after the file has been written, dropping every cached result and table
+        :return:
+        """
+        logging.debug(f"Reloading facts from '{self.path_to_facts}'..")
+        self._run(f"unload_file('{self._prolog_path(self.path_to_facts)}')")
+        self._load_facts()
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        It drops every cached result, and every table, whose answers could depend on the old facts
+        :return:
+        """
+        self._run('abolish_all_tables')
+        self._cache.clear()
+        logging.debug('Query cache invalidated.')
+
+    def cache_info(self) -> dict:
+        """
+        :return: The hits, the misses and the size of the query cache
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._cache), 'max_size': self.cache_size}
+
+    def _quick_load(self, path: str):
+        """
+        It loads the file from its quick load version, that is created, or created again, if it's older than the file
+        :param path: The path of the prolog file
+        :return:
+        """
+        logging.debug(f"Loading '{path}' with quick load file..")
+        start_time = time.time()
+        self._run(f"load_files('{self._prolog_path(path)}', [qcompile(auto)])")
+        logging.debug(f'Time passed loading {path}: {time.time() - start_time}s')
+
+    @staticmethod
+    def _prolog_path(path: str) -> str:
+        """
+        :return: The path written as the content of a quoted prolog atom
+        """
+        return path.replace('\\', '/').replace("'", "\\'")
+
     def ask_all_way_ids(self) -> list[str]:
         """
         It asks for all the ids of edges present
@@ -44,6 +115,24 @@ class PySwipClient:
         result = self._query(f"get_neighbours({from_node_id}, Node, Lat, Lon)")
         return list(map(lambda _: Node.from_prolog_dictionary_result(_), result))
 
+    def ask_weighted_neighbours_of_node(self, from_node_id: str) -> list[tuple[Node, float]]:
+        """
+        It asks for the neighbours of a node together with the distance to reach each of them
+        :param from_node_id: The node id
+        :return: The list of (neighbour, distance)
+        """
+        result = self._query(f"get_weighted_neighbours({from_node_id}, Node, Lat, Lon, Distance)")
+        return list(map(lambda _: (Node.from_prolog_dictionary_result(_), _['Distance']), result))
+
+    def ask_weighted_predecessors_of_node(self, to_node_id: str) -> list[tuple[Node, float]]:
+        """
+        It asks for the nodes with an edge to the given one, together with the distance of the edge
+        :param to_node_id: The node id
+        :return: The list of (predecessor, distance)
+        """
+        result = self._query(f"get_weighted_predecessors({to_node_id}, Node, Lat, Lon, Distance)")
+        return list(map(lambda _: (Node.from_prolog_dictionary_result(_), _['Distance']), result))
+
     def get_distance_between_nodes(self, from_node_id: str, to_node_id: str) -> int:
         """
         It asks for the distance between two nodes
@@ -54,8 +143,34 @@ class PySwipClient:
         result = self._query(f"get_distance({from_node_id}, {to_node_id}, Distance)")
         return result[0]['Distance']
 
+    def ask_weighted_edges(self) -> list[tuple[str, str, float]]:
+        """
+        It asks, with a single query, for all the edges of the graph with their distance
+        :return: The list of (from node id, to node id, distance), the edges of a node keep the order of its neighbours
+        """
+        result = self._query('get_weighted_edge(From_node, To_node, Distance)')
+        return list(map(lambda _: (_['From_node'], _['To_node'], _['Distance']), result))
 
     def _query(self, query):
+        """
+        It returns the result of the query from the cache, asking prolog only the first time
+        :param query: The query to launch
+        :return: The list of the answers
+        """
+        key = ' '.join(query.split())
+        if key in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return list(self._cache[key])
+        self.misses += 1
+        return_value = self._run(query)
+        if self.cache_size > 0:
+            self._cache[key] = tuple(return_value)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return return_value
+
+    def _run(self, query):
         """
         It wraps up the result of the query and returns the list
         :param query: The query to launch
@@ -0,0 +1,81 @@
+import json
+import logging
+import os
+
+from src.service.data.file_hash import file_sha256
+
+
+class OntologyResolver:
+    """
+    It resolves the values of the tags of open street map from their meaning in the ontology.
+    The ontology is parsed at most once, with a single query for every property, and the resolved table is stored
+    on a cache file that is reused until the ontology changes.
+    """
+
+    def __init__(self, path_to_ontology: str, path_to_cache: str = None):
+        """
+        :param path_to_ontology: The path to the turtle file of the ontology
+        :param path_to_cache: The path of the file where to store the resolved values, None to disable it
+        """
+        self.path_to_ontology = path_to_ontology
+        self.path_to_cache = path_to_cache
+        self.values = None
+
+    def resolve(self, prop: str, mean: str) -> str:
+        """
+        It returns the value of the tag for the given meaning
+        :param prop: The property, the key of the tag
+        :param mean: The meaning in the range of the property
+        :return: The value of the tag, without the key
+        """
+        if self.values is None:
+            self.values = self._load_values()
+        return self.values[prop][mean]
+
+    def _load_values(self) -> dict:
+        """
+        It reads the values from the cache file, resolving them on the ontology if the cache is missing or stale
+        :return: The dictionary property -> meaning -> value
+        """
+        digest = file_sha256(self.path_to_ontology)
+        cached = self._read_cache()
+        if cached is not None and cached.get('ontology_sha256') == digest:
+            logging.debug('Ontology values loaded from cache.')
+            return cached['values']
+        values = self._query_values()
+        self._write_cache({'ontology_sha256': digest, 'values': values})
+        return values
+
+    def _query_values(self) -> dict:
+        """
+        It parses the ontology and resolves all the values with a single query
+        :return: The dictionary property -> meaning -> value
+        """
+        # Imported here so that rdflib is loaded only when the cache can't be used
+        from src.service.rdf.sparql_on_rdf_client import sparql_client
+        logging.debug(f"Resolving values from the ontology '{self.path_to_ontology}'..")
+        labels = sparql_client(self.path_to_ontology).ask_labels_of_all_props()
+        values = dict()
+        for prop, means in labels.items():
+            values[prop] = {mean: label.replace(f"{prop}=", "") for mean, label in means.items()}
+        logging.debug('Values resolved from the ontology.')
+        return values
+
+    def _read_cache(self) -> dict | None:
+        if self.path_to_cache is None:
+            return None
+        try:
+            with open(self.path_to_cache, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, content: dict):
+        if self.path_to_cache is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path_to_cache) or '.', exist_ok=True)
+            with open(self.path_to_cache, 'w', encoding='utf-8') as f:
+                json.dump(content, f)
+        except OSError as e:
+            logging.warning(f"Can't write the ontology cache '{self.path_to_cache}': {e}")
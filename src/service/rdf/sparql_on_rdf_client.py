@@ -1,45 +1,111 @@
-from rdflib import Graph, Namespace
+from rdflib import Graph, Literal, Namespace
+from rdflib.namespace import RDFS
+from rdflib.plugins.sparql import prepareQuery
+
+OSM = Namespace("https://w3id.org/openstreetmap/terms#")
+
+_RANGE_OF_PROP = prepareQuery("""
+                SELECT ?domain ?range
+                WHERE {
+                  ?prop
+                    rdfs:label ?prop_label;
+                    rdfs:domain ?domain;
+                    rdfs:range ?range .
+                }
+                """, initNs={'osm': OSM, 'rdfs': RDFS})
+
+_LABEL_FOR_MEANING_IN_RANGE = prepareQuery("""
+                SELECT ?label
+                WHERE {
+                  ?mean
+                    a ?range;
+                    rdfs:label ?label.
+                }
+                """, initNs={'osm': OSM, 'rdfs': RDFS})
+
+_LABELS_IN_RANGES_OF_PROP = prepareQuery("""
+                SELECT ?range ?mean ?label
+                WHERE {
+                  ?prop
+                    rdfs:label ?prop_label;
+                    rdfs:range ?range .
+                  ?mean
+                    a ?range;
+                    rdfs:label ?label.
+                }
+                """, initNs={'osm': OSM, 'rdfs': RDFS})
+
+_LABELS_OF_ALL_PROPS = prepareQuery("""
+                SELECT ?prop ?mean ?label
+                WHERE {
+                  ?prop
+                    rdfs:label ?prop_label;
+                    rdfs:range ?range .
+                  FILTER(STR(?prop_label) = CONCAT(STRAFTER(STR(?prop), "#"), "=*"))
+                  ?mean
+                    a ?range;
+                    rdfs:label ?label.
+                }
+                """, initNs={'osm': OSM, 'rdfs': RDFS})
 
 
 class sparql_client():
+    """
+    The queries are prepared once, when the module is imported, and run with bound variables.
+    The results are memoized, so asking the same thing twice doesn't query the graph again.
+    """
+
     def __init__(self, path):
         self.path = path
         self.graph = Graph()
         self.graph.parse(self.path, format="turtle")
+        self.memo = dict()
 
     def ask_range_of_prop(self, prop):
-        query = f"""
-                PREFIX osm: <https://w3id.org/openstreetmap/terms#>
-                PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-                
-                SELECT ?domain ?range
-                WHERE {{
-                  osm:{prop}
-                    rdfs:label "{prop}=*"@en;
-                    rdfs:domain ?domain;
-                    rdfs:range ?range .
-                }}
-                """
-        rows = self.graph.query(query)
-        osm = "https://w3id.org/openstreetmap/terms#"
-        for row in rows:
-            range = str(row['range']).replace(osm, "")
-            return range
+        key = ('range_of_prop', prop)
+        if key not in self.memo:
+            rows = self.graph.query(_RANGE_OF_PROP, initBindings={'prop': OSM[prop],
+                                                                  'prop_label': Literal(f"{prop}=*", lang='en')})
+            self.memo[key] = next((self._local_name(row['range']) for row in rows), None)
+        return self.memo[key]
 
     def ask_label_for_meaning_in_range(self, mean, range):
-        query = f"""
-                PREFIX osm: <https://w3id.org/openstreetmap/terms#>
-                PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-                
-                SELECT ?label
-                WHERE {{
-                  osm:{mean}
-                    a osm:{range};
-                    rdfs:label ?label.
-                }}
-                """
-        rows = self.graph.query(query)
-        osm = "https://w3id.org/openstreetmap/terms#"
-        for row in rows:
-            label = str(row['label']).replace(osm, "")
-            return label
\ No newline at end of file
+        key = ('label_for_meaning_in_range', mean, range)
+        if key not in self.memo:
+            rows = self.graph.query(_LABEL_FOR_MEANING_IN_RANGE, initBindings={'mean': OSM[mean],
+                                                                               'range': OSM[range]})
+            self.memo[key] = next((self._local_name(row['label']) for row in rows), None)
+        return self.memo[key]
+
+    def ask_labels_in_ranges_of_prop(self, prop):
+        """
+        It returns, in a single query, the label of every meaning in every range of the property
+        :param prop: The property
+        :return: The dictionary range -> meaning -> label
+        """
+        key = ('labels_in_ranges_of_prop', prop)
+        if key not in self.memo:
+            rows = self.graph.query(_LABELS_IN_RANGES_OF_PROP, initBindings={'prop': OSM[prop],
+                                                                             'prop_label': Literal(f"{prop}=*",
+                                                                                                   lang='en')})
+            labels = dict()
+            for row in rows:
+                range_labels = labels.setdefault(self._local_name(row['range']), dict())
+                range_labels.setdefault(self._local_name(row['mean']), self._local_name(row['label']))
+            self.memo[key] = labels
+        return self.memo[key]
+
+    def ask_labels_of_all_props(self):
+        key = ('labels_of_all_props',)
+        if key not in self.memo:
+            rows = self.graph.query(_LABELS_OF_ALL_PROPS)
+            labels = dict()
+            for row in rows:
+                prop_labels = labels.setdefault(self._local_name(row['prop']), dict())
+                prop_labels.setdefault(self._local_name(row['mean']), self._local_name(row['label']))
+            self.memo[key] = labels
+        return self.memo[key]
+
+    @staticmethod
+    def _local_name(term):
+        return str(term).replace(str(OSM), "")
@@ -0,0 +1,132 @@
+from array import array
+
+from src.external_libs.display import Displayable
+from src.external_libs.searchProblem import Path
+from src.service.search.indexed_frontier import IndexedFrontierPQ
+
+FORWARD, BACKWARD = 0, 1
+
+
+class SearcherBidirectional(Displayable):
+    """
+    A bidirectional A* searcher, in place of SearcherMPP: one search goes forward from the start node and one goes
+    backward from the goal, so that the explored area is two small discs instead of a large one.
+    Both searches use the average of the two heuristics as potential, (h(v) - h_reverse(v)) / 2 forward and its
+    opposite backward, which is consistent when the two heuristics are consistent. With both heuristics equal to
+    0 it's a bidirectional Dijkstra.
+    Besides the methods of Search_problem, the problem must have goal_node(), reverse_neighbors(node), that returns
+    the arcs reaching the node, and reverse_heuristic(node), that estimates the cost from the start node.
+    """
+
+    def __init__(self, problem):
+        """
+        :param problem: The problem to solve
+        """
+        self.problem = problem
+        self.num_expanded = 0
+        self.solution = None
+        self.node_index = {}  # node -> integer index
+        self.nodes = []  # integer index -> node
+        self.potential = array('d')  # forward potential of each node, the backward one is its opposite
+        self.cost = (array('d'), array('d'))  # best cost found to reach each node, in each direction
+        self.parent_arc = ([], [])  # the arc used to reach each node, in each direction
+        self.explored = (array('b'), array('b'))  # 1 when the node has been expanded, in each direction
+        self.frontier = (IndexedFrontierPQ(), IndexedFrontierPQ())  # index -> potential + cost, in each direction
+        super().__init__()
+
+    def _index_of(self, node) -> int:
+        """
+        It returns the index of node, registering it the first time it is seen
+        """
+        index = self.node_index.get(node)
+        if index is None:
+            index = len(self.nodes)
+            self.node_index[node] = index
+            self.nodes.append(node)
+            # inf - inf is nan: a node that can't be reached from the start or can't reach the goal is never pushed
+            self.potential.append((self.problem.heuristic(node) - self.problem.reverse_heuristic(node)) / 2)
+            for direction in (FORWARD, BACKWARD):
+                self.cost[direction].append(float('inf'))
+                self.parent_arc[direction].append(None)
+                self.explored[direction].append(0)
+        return index
+
+    def _push(self, direction: int, index: int, cost: float):
+        """
+        It adds the node to the frontier of the given direction, if it can be on a path from the start to the goal
+        """
+        potential = self.potential[index] if direction == FORWARD else -self.potential[index]
+        if potential == potential and abs(potential) != float('inf'):
+            self.frontier[direction].add(index, cost + potential)
+
+    def search(self):
+        """
+        :return: The path from the start node to the goal, None if it doesn't exist
+        """
+        start, goal = self.problem.start_node(), self.problem.goal_node()
+        self.display(1, f"Starting search from {start} to {goal}")
+        start_index, goal_index = self._index_of(start), self._index_of(goal)
+        self.cost[FORWARD][start_index] = 0
+        self.cost[BACKWARD][goal_index] = 0
+        self._push(FORWARD, start_index, 0)
+        self._push(BACKWARD, goal_index, 0)
+        best = float('inf') if start_index != goal_index else 0
+        meeting = (start_index, None, goal_index)  # the arc between the two searches on the best path found
+        while True:
+            top_forward, top_backward = self.frontier[FORWARD].top_value(), self.frontier[BACKWARD].top_value()
+            # The reduced costs of the two directions sum to the real cost, so no path can be cheaper than best
+            if top_forward + top_backward >= best:
+                break
+            direction = FORWARD if top_forward <= top_backward else BACKWARD
+            index = self.frontier[direction].pop()
+            self.explored[direction][index] = 1
+            self.num_expanded += 1
+            node = self.nodes[index]
+            self.display(4, f"Expanding: {node} (cost: {self.cost[direction][index]})")
+            if direction == FORWARD:
+                arcs = self.problem.neighbors(node)
+            else:
+                arcs = self.problem.reverse_neighbors(node)
+            for arc in arcs:
+                other = self._index_of(arc.to_node if direction == FORWARD else arc.from_node)
+                cost = self.cost[direction][index] + arc.cost
+                through = cost + self.cost[1 - direction][other]
+                if through < best:
+                    best = through
+                    meeting = (index, arc, other) if direction == FORWARD else (other, arc, index)
+                if not self.explored[direction][other] and cost < self.cost[direction][other]:
+                    self.cost[direction][other] = cost
+                    self.parent_arc[direction][other] = arc
+                    self._push(direction, other, cost)
+        if best == float('inf'):
+            self.display(0, f"No (more) solutions. Total of {self.num_expanded} paths expanded.")
+            return None
+        path = self._build_path(*meeting)
+        self.solution = path
+        frontier_size = len(self.frontier[FORWARD]) + len(self.frontier[BACKWARD])
+        self.display(1, f"Solution: {path} (cost: {path.cost})\n {self.num_expanded} paths have "
+                        f"been expanded and {frontier_size} paths remain in the frontier (at most "
+                        f"{self.frontier[FORWARD].peak_size} forward and {self.frontier[BACKWARD].peak_size} backward)")
+        print(f"    Il percorso è: {path}")
+        print(f"    Sono stati esplorati {self.num_expanded} percorsi e ne rimangono {frontier_size} nella frontiera.")
+        return path
+
+    def _build_path(self, forward_index: int, arc, backward_index: int) -> Path:
+        """
+        It joins the path of the forward search to forward_index, the arc and the path of the backward search
+        from backward_index
+        """
+        arcs = []
+        while self.parent_arc[FORWARD][forward_index] is not None:
+            arcs.append(self.parent_arc[FORWARD][forward_index])
+            forward_index = self.node_index[arcs[-1].from_node]
+        arcs.reverse()
+        if arc is not None:
+            arcs.append(arc)
+        while self.parent_arc[BACKWARD][backward_index] is not None:
+            arcs.append(self.parent_arc[BACKWARD][backward_index])
+            backward_index = self.node_index[arcs[-1].to_node]
+        path = Path(self.problem.start_node())
+        for arc in arcs:
+            path = Path(path, arc)
+        return path
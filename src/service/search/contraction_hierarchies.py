@@ -0,0 +1,245 @@
+import heapq
+import logging
+
+from src.external_libs.display import Displayable
+from src.external_libs.searchProblem import Arc, Path
+from src.service.graph.compiled_graph import CompiledGraph
+
+
+class ContractionHierarchies:
+    """
+    The preprocessing of the graph for point-to-point routing with contraction hierarchies.
+    The nodes are contracted one at a time, from the least important, adding a shortcut between two neighbours
+    whenever the only shortest path between them passes through the contracted node.
+    A query is then a bidirectional search that only follows edges towards more important nodes.
+    """
+
+    def __init__(self, graph: CompiledGraph, witness_settled_limit: int = 500):
+        """
+        :param graph: The graph to preprocess
+        :param witness_settled_limit: How many nodes the local search for a witness path can settle, a lower
+        limit makes the preprocessing faster but adds more shortcuts
+        """
+        self.graph = graph
+        self.witness_settled_limit = witness_settled_limit
+        n = graph.node_count()
+        self.rank = [0] * n
+        self.middle = dict()
+        """
+        The node skipped by each shortcut, (from, to) -> middle node
+        """
+        self.weight = dict()
+        """
+        The cost of the cheapest edge, or shortcut, between two nodes, (from, to) -> cost
+        """
+        self.up_forward = [[] for _ in range(n)]
+        self.up_backward = [[] for _ in range(n)]
+        self._preprocess()
+
+    def _preprocess(self):
+        logging.debug('Contracting the graph..')
+        n = self.graph.node_count()
+        indptr, indices, weights = self.graph.adjacency_lists()
+        out_edges = [dict() for _ in range(n)]
+        in_edges = [dict() for _ in range(n)]
+        for u in range(n):
+            for e in range(indptr[u], indptr[u + 1]):
+                v, w = indices[e], weights[e]
+                if v != u and w < out_edges[u].get(v, float('inf')):
+                    out_edges[u][v] = w
+                    in_edges[v][u] = w
+        for u in range(n):
+            self.weight.update({(u, v): w for v, w in out_edges[u].items()})
+
+        contracted = [False] * n
+        deleted_neighbours = [0] * n
+        heap = [(self._priority(v, out_edges, in_edges, contracted, deleted_neighbours), v) for v in range(n)]
+        heapq.heapify(heap)
+        order = 0
+        shortcuts = 0
+        while heap:
+            _, v = heapq.heappop(heap)
+            # Lazy update: the priority may have changed since it was pushed
+            priority = self._priority(v, out_edges, in_edges, contracted, deleted_neighbours)
+            if heap and priority > heap[0][0]:
+                heapq.heappush(heap, (priority, v))
+                continue
+            for u, w, weight in self._shortcuts(v, out_edges, in_edges, contracted):
+                out_edges[u][w] = weight
+                in_edges[w][u] = weight
+                self.weight[(u, w)] = weight
+                self.middle[(u, w)] = v
+                shortcuts += 1
+            contracted[v] = True
+            self.rank[v] = order
+            order += 1
+            for neighbour in set(out_edges[v]) | set(in_edges[v]):
+                deleted_neighbours[neighbour] += 1
+
+        for (u, v), w in self.weight.items():
+            if self.rank[v] > self.rank[u]:
+                self.up_forward[u].append((v, w))
+            else:
+                self.up_backward[v].append((u, w))
+        logging.debug(f'Graph contracted, {shortcuts} shortcuts added.')
+
+    def _priority(self, v: int, out_edges: list[dict], in_edges: list[dict], contracted: list[bool],
+                  deleted_neighbours: list[int]) -> int:
+        """
+        The importance of a node: the edge difference of its contraction plus how many neighbours were contracted
+        """
+        removed = sum(1 for u in in_edges[v] if not contracted[u]) + sum(1 for w in out_edges[v] if not contracted[w])
+        added = len(self._shortcuts(v, out_edges, in_edges, contracted))
+        return added - removed + deleted_neighbours[v]
+
+    def _shortcuts(self, v: int, out_edges: list[dict], in_edges: list[dict],
+                   contracted: list[bool]) -> list[tuple[int, int, float]]:
+        """
+        It finds the shortcuts needed to contract the node v
+        :return: The list of (from, to, cost) of the shortcuts
+        """
+        shortcuts = []
+        targets = {w: weight for w, weight in out_edges[v].items() if not contracted[w]}
+        for u, in_weight in in_edges[v].items():
+            if contracted[u]:
+                continue
+            max_cost = in_weight + max((weight for w, weight in targets.items() if w != u), default=0)
+            witness = self._witness_search(u, v, max_cost, out_edges, contracted)
+            for w, out_weight in targets.items():
+                if w != u and witness.get(w, float('inf')) > in_weight + out_weight:
+                    shortcuts.append((u, w, in_weight + out_weight))
+        return shortcuts
+
+    def _witness_search(self, source: int, excluded: int, max_cost: float, out_edges: list[dict],
+                        contracted: list[bool]) -> dict:
+        """
+        A local Dijkstra from the source that avoids the excluded node and the contracted ones
+        :return: The distances found, dictionary node -> distance
+        """
+        dist = {source: 0.0}
+        heap = [(0.0, source)]
+        settled = 0
+        while heap and settled < self.witness_settled_limit:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            if d > max_cost:
+                break
+            settled += 1
+            for w, weight in out_edges[u].items():
+                if w == excluded or contracted[w]:
+                    continue
+                new_d = d + weight
+                if new_d < dist.get(w, float('inf')):
+                    dist[w] = new_d
+                    heapq.heappush(heap, (new_d, w))
+        return dist
+
+    def query(self, source: int, target: int) -> tuple[float, list[int], int]:
+        """
+        It finds the shortest path between two nodes with a bidirectional upward search
+        :param source: The index of the starting node
+        :param target: The index of the node to reach
+        :return: The cost of the path, the indexes of the nodes of the unpacked path (empty if there is no path)
+        and the number of nodes settled by the search
+        """
+        dist = ({source: 0.0}, {target: 0.0})
+        parent = ({source: None}, {target: None})
+        heaps = ([(0.0, source)], [(0.0, target)])
+        edges = (self.up_forward, self.up_backward)
+        best, meeting = float('inf'), None
+        settled = 0
+        while any(heaps):
+            for side in (0, 1):
+                heap = heaps[side]
+                if not heap:
+                    continue
+                d, u = heapq.heappop(heap)
+                if d > dist[side][u]:
+                    continue
+                if d >= best:
+                    # No path through the nodes left on this side can be shorter
+                    heap.clear()
+                    continue
+                settled += 1
+                other = dist[1 - side].get(u)
+                if other is not None and d + other < best:
+                    best, meeting = d + other, u
+                for v, weight in edges[side][u]:
+                    new_d = d + weight
+                    if new_d < dist[side].get(v, float('inf')):
+                        dist[side][v] = new_d
+                        parent[side][v] = u
+                        heapq.heappush(heap, (new_d, v))
+        if meeting is None:
+            return float('inf'), [], settled
+        forward = self._walk_back(parent[0], meeting)[::-1]
+        backward = self._walk_back(parent[1], meeting)
+        packed = forward + backward[1:]
+        path = [packed[0]]
+        for u, v in zip(packed, packed[1:]):
+            path.extend(self._unpack(u, v))
+        return best, path, settled
+
+    @staticmethod
+    def _walk_back(parent: dict, node: int) -> list[int]:
+        nodes = []
+        while node is not None:
+            nodes.append(node)
+            node = parent[node]
+        return nodes
+
+    def _unpack(self, u: int, v: int) -> list[int]:
+        """
+        It replaces the shortcut from u to v with the original edges
+        :return: The nodes after u up to v
+        """
+        nodes = []
+        stack = [(u, v)]
+        while stack:
+            a, b = stack.pop()
+            m = self.middle.get((a, b))
+            if m is None:
+                nodes.append(b)
+            else:
+                stack.append((m, b))
+                stack.append((a, m))
+        return nodes
+
+
+class SearcherCH(Displayable):
+    """
+    A searcher that answers a search problem with the contraction hierarchies, in place of SearcherMPP.
+    The problem must have from_node and to_node as the nodes of the graph.
+    """
+
+    def __init__(self, problem, hierarchies: ContractionHierarchies):
+        """
+        :param problem: The problem to solve
+        :param hierarchies: The preprocessed graph
+        """
+        self.problem = problem
+        self.hierarchies = hierarchies
+        self.num_expanded = 0
+        self.solution = None
+        super().__init__()
+
+    def search(self):
+        """
+        :return: The path from the start node to the goal, None if it doesn't exist
+        """
+        graph = self.hierarchies.graph
+        self.display(1, f"Starting search from {self.problem.start_node()} to {self.problem.to_node}")
+        cost, nodes, self.num_expanded = self.hierarchies.query(graph.index_of_node(self.problem.start_node()),
+                                                                graph.index_of_node(self.problem.to_node))
+        if not nodes:
+            self.display(0, f"No (more) solutions. Total of {self.num_expanded} paths expanded.")
+            return None
+        path = Path(self.problem.start_node())
+        for u, v in zip(nodes, nodes[1:]):
+            path = Path(path, Arc(path.end(), graph.node(v), self.hierarchies.weight[(u, v)]))
+        self.solution = path
+        self.display(1, f"Solution: {path} (cost: {path.cost})\n {self.num_expanded} nodes have been settled")
+        print(f"    Il percorso è: {path}")
+        print(f"    Sono stati esplorati {self.num_expanded} nodi.")
+        return path
@@ -0,0 +1,29 @@
+import heapq
+
+import numpy as np
+
+from src.service.graph.compiled_graph import CompiledGraph
+
+
+def dijkstra(graph: CompiledGraph, source: int) -> np.ndarray:
+    """
+    It computes the distance from the source to every node of the graph, using a binary heap
+    :param graph: The graph to search
+    :param source: The index of the starting node
+    :return: The array of the distances, inf for the nodes that can't be reached
+    """
+    indptr, indices, weights = graph.adjacency_lists()
+    dist = [float('inf')] * graph.node_count()
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            new_d = d + weights[e]
+            if new_d < dist[v]:
+                dist[v] = new_d
+                heapq.heappush(heap, (new_d, v))
+    return np.array(dist, dtype=np.float64)
@@ -0,0 +1,78 @@
+from array import array
+from collections.abc import Mapping
+
+import numpy as np
+
+
+class DistanceMatrix(Mapping):
+    """
+    A read-only view of a dense matrix of distances that is indexed by the keys of the nodes in the registry,
+    as a dictionary of dictionaries.
+    dist[from_node.key][to_node.key] gives the distance between the two nodes.
+    """
+
+    def __init__(self, matrix: np.ndarray, index: array):
+        """
+        :param matrix: The square matrix of the distances
+        :param index: The position in the matrix of each node key, -1 for the nodes that aren't in it
+        """
+        self.matrix = matrix
+        self.index = index
+
+    def __getitem__(self, key: int) -> 'DistanceRow':
+        return DistanceRow(self.matrix[position(self.index, key)], self.index)
+
+    def __iter__(self):
+        return iter_keys(self.index)
+
+    def __len__(self):
+        return len(self.matrix)
+
+    def column(self, key: int) -> 'DistanceRow':
+        """
+        :param key: The key of the node to reach
+        :return: The distances from every node to the given one, indexed by the key of the starting node
+        """
+        return DistanceRow(self.matrix[:, position(self.index, key)], self.index)
+
+
+class DistanceRow(Mapping):
+    """
+    The distances from a single node, indexed by the key of the node reached
+    """
+
+    def __init__(self, row: np.ndarray, index: array):
+        """
+        :param row: The distances from the node
+        :param index: The position in the row of each node key, -1 for the nodes that aren't in it
+        """
+        self.row = row
+        self.index = index
+
+    def __getitem__(self, key: int) -> float:
+        return float(self.row[position(self.index, key)])
+
+    def __iter__(self):
+        return iter_keys(self.index)
+
+    def __len__(self):
+        return len(self.row)
+
+
+def position(index: array, key: int) -> int:
+    """
+    :param index: The position of each node key
+    :param key: The key of the node
+    :return: The position of the node, a KeyError is raised if the node isn't indexed
+    """
+    if key >= len(index) or index[key] < 0:
+        raise KeyError(key)
+    return index[key]
+
+
+def iter_keys(index: array):
+    """
+    :param index: The position of each node key
+    :return: The keys of the nodes that are indexed
+    """
+    return (key for key, i in enumerate(index) if i >= 0)
@@ -0,0 +1,80 @@
+import logging
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Callable
+
+from src.service.graph.compiled_graph import CompiledGraph
+from src.service.search.dijkstra import dijkstra
+from src.service.search.distance_matrix import DistanceRow, iter_keys, position
+from src.service.search.one_to_many import ShortestPathTree
+from src.service.search.tour import best_path
+
+
+class DistanceOracle(Mapping):
+    """
+    A lazy replacement of the all-pairs matrix of FloydWarshall. The distances from a node are computed with Dijkstra
+    only when they are asked for, and the last rows used are kept in a bounded cache.
+    dist[from_node.key][to_node.key] gives the distance between the two nodes, as with the matrix.
+    A row is kept as the shortest path tree that computed it, so the paths from the node are known as well.
+    """
+
+    def __init__(self, graph: CompiledGraph, max_rows: int = 256):
+        """
+        :param graph: The graph to compute the distances on
+        :param max_rows: How many rows, in each direction, can be kept in the cache
+        """
+        self.graph = graph
+        self.reversed_graph = graph.reversed()
+        self.max_rows = max_rows
+        self.index = graph.index_of_key
+        self._rows = OrderedDict()
+        self._columns = OrderedDict()
+        logging.debug('DistanceOracle service initiated.')
+
+    def __getitem__(self, key: int) -> DistanceRow:
+        return DistanceRow(self.tree(key).dist, self.index)
+
+    def __iter__(self):
+        return iter_keys(self.index)
+
+    def __len__(self):
+        return self.graph.node_count()
+
+    def column(self, key: int) -> DistanceRow:
+        """
+        :param key: The key of the node to reach
+        :return: The distances from every node to the given one, indexed by the key of the starting node
+        """
+        return DistanceRow(self._cached(self._columns, lambda source: dijkstra(self.reversed_graph, source), key),
+                           self.index)
+
+    def tree(self, key: int) -> ShortestPathTree:
+        """
+        :param key: The key of the starting node
+        :return: The shortest paths from the node to every other one, found by the same sweep of its row
+        """
+        return self._cached(self._rows, lambda source: ShortestPathTree(self.graph, source), key)
+
+    def best_path(self, nodes, exact_limit: int = 12):
+        return best_path(nodes, self, exact_limit)
+
+    def get_lsdb(self):
+        return self
+
+    def _cached(self, cache: OrderedDict, compute: Callable, key: int):
+        """
+        It returns the distances from the node, computing them only if they are not in the cache
+        :param cache: The cache of the rows for one direction
+        :param compute: The function that computes the distances from the index of the node
+        :param key: The key of the starting node
+        :return: The distances from the node
+        """
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        logging.debug(f'Computing distances from {self.graph.node(position(self.index, key)).id}..')
+        row = compute(position(self.index, key))
+        cache[key] = row
+        if len(cache) > self.max_rows:
+            cache.popitem(last=False)
+        return row
@@ -1,12 +1,24 @@
 import logging
 from random import randint
 
+import numpy as np
+
 
 class DynamicProgramming:
-    def __init__(self, n):
+    def __init__(self, n, epsilon=0.0):
+        """
+        :param n: The number of elements
+        :param epsilon: If greater than 0 time and cost are rounded up to coarser units, so that the table is smaller.
+        The solution is always feasible and at least as good as the best one with (1 - epsilon) of time and budget.
+        """
         self.n = n
+        self.epsilon = epsilon
         self.interest, self.time, self.cost = [], [], []
-        self.memo = {}
+        self.start = None  # The first element of the table built
+        self.max_time, self.max_budget = -1, -1  # The limits of the table built
+        self.time_unit, self.budget_unit = 1, 1  # The units of time and budget of the table built
+        self.values = None  # values[t][b]: best interest from the element start on, with time t and budget b units
+        self.choices = None  # choices[i - start]: packed bits, set where taking the element i is strictly better
 
     def generate(self):
         logging.debug("Generating random values for the dp problem..")
@@ -19,31 +31,125 @@ class DynamicProgramming:
             print(f"    Elemento {i}: interesse {self.interest[i]}, tempo {self.time[i]}, costo {self.cost[i]}")
         logging.debug("Generation completed.")
 
+    def prepare(self, i, max_time, max_budget):
+        """
+        It builds the table once for the largest limits, so that every smaller time and budget is answered without
+        building it again
+        :param i: The first element that can be selected
+        :param max_time: The largest time that will be asked for
+        :param max_budget: The largest budget that will be asked for
+        """
+        if not self._is_built(i, max_time, max_budget):
+            self._build(i, max_time, max_budget)
+
     def calculate(self, i, t, b):  # Actual element, time left, budget left
-        if i == self.n:
-            return 0
-        if (i, t, b) in self.memo:
-            return self.memo[(i, t, b)]
-        if self.time[i] > t or self.cost[i] > b:
-            self.memo[(i, t, b)] = self.calculate(i + 1, t, b)
-        else:
-            self.memo[(i, t, b)] = max(self.calculate(i + 1, t, b),
-                                   self.calculate(i + 1, t - self.time[i], b - self.cost[i]) + self.interest[i])
-        return self.memo[(i, t, b)]
+        self.prepare(i, t, b)
+        return int(self.values[t // self.time_unit, b // self.budget_unit])
+
+    def select(self, i, t, b):
+        """
+        It finds the elements of the best solution, following one bit for each element
+        :return: The indexes of the selected elements
+        """
+        self.prepare(i, t, b)
+        t_units, b_units = t // self.time_unit, b // self.budget_unit
+        selected = []
+        for j in range(i, self.n):
+            if self._is_taken(j, t_units, b_units):
+                selected.append(j)
+                t_units -= -(-self.time[j] // self.time_unit)
+                b_units -= -(-self.cost[j] // self.budget_unit)
+        return selected
+
+    def answer_all(self, i, queries):
+        """
+        It answers many what-if queries with a single table, built for the largest time and budget asked for
+        :param i: The first element that can be selected
+        :param queries: The pairs of time and budget
+        :return: For each query, the best interest and the indexes of the selected elements
+        """
+        queries = list(queries)
+        if not queries:
+            return []
+        self.prepare(i, max(t for t, _ in queries), max(b for _, b in queries))
+        return [(self.calculate(i, t, b), self.select(i, t, b)) for t, b in queries]
+
+    def get_guarantee(self, i, t, b):
+        """
+        It tells how good the solution for the given limits is, when it's approximated
+        :return: The time and the budget such that the solution is at least as good as the best one within them
+        """
+        self.prepare(i, t, b)
+        most = self._most_elements(i, t, b)
+        # Every element rounded up adds less than one unit, and the limit rounded down loses less than one unit
+        return (max(0, t - (most + 1) * (self.time_unit - 1)),
+                max(0, b - (most + 1) * (self.budget_unit - 1)))
+
+    def _is_built(self, i, t, b):
+        return self.start == i and t <= self.max_time and b <= self.max_budget
+
+    def _most_elements(self, i, t, b):
+        """
+        :return: The maximum number of elements, from the element i on, that can be taken together within the limits
+        """
+        times = np.cumsum(sorted(self.time[i:]))
+        costs = np.cumsum(sorted(self.cost[i:]))
+        return int(min(np.searchsorted(times, t, side='right'), np.searchsorted(costs, b, side='right')))
+
+    def _units(self, i, t, b):
+        """
+        The largest units such that rounding up every element loses at most epsilon of the time and of the budget
+        """
+        if self.epsilon <= 0:
+            return 1, 1
+        most = self._most_elements(i, t, b)
+        return 1 + int(self.epsilon * t / (most + 1)), 1 + int(self.epsilon * b / (most + 1))
+
+    def _build(self, i, t, b):
+        """
+        It fills the table bottom-up, from the last element to the element i, keeping only the layer of the
+        current element and one bit for each state to remember if the element is taken
+        """
+        self.time_unit, self.budget_unit = self._units(i, t, b)
+        logging.debug(f"Building the dp table from element {i} with time {t} and budget {b}, "
+                      f"units of time {self.time_unit} and budget {self.budget_unit}..")
+        times = [-(-x // self.time_unit) for x in self.time]
+        costs = [-(-x // self.budget_unit) for x in self.cost]
+        t_units, b_units = t // self.time_unit, b // self.budget_unit
+        values = np.zeros((t_units + 1, b_units + 1), dtype=np.int64)
+        taken = np.zeros((t_units + 1, b_units + 1), dtype=bool)
+        choices = [None] * (self.n - i)
+        for j in range(self.n - 1, i - 1, -1):
+            taken.fill(False)
+            if times[j] <= t_units and costs[j] <= b_units:
+                # Taking j with time t and budget b leaves time t - time[j] and budget b - cost[j].
+                # with_j is a new array, so the layer can be updated in place
+                with_j = values[:t_units + 1 - times[j], :b_units + 1 - costs[j]] + self.interest[j]
+                without_j = values[times[j]:, costs[j]:]
+                np.greater(with_j, without_j, out=taken[times[j]:, costs[j]:])
+                np.maximum(without_j, with_j, out=without_j)
+            choices[j - i] = np.packbits(taken, axis=None)
+        self.start, self.max_time, self.max_budget = i, t, b
+        self.values, self.choices = values, choices
+        logging.debug("Table built.")
+
+    def _is_taken(self, i, t_units, b_units):
+        position = t_units * self.values.shape[1] + b_units
+        return (self.choices[i - self.start][position >> 3] >> (7 - (position & 7))) & 1 == 1
 
     def get_solution(self, i, t, b):
         logging.debug("Getting solution of the dp problem..")
         print("Soluzione del problema dp:")
-        cnt = 0
-        while i < self.n:
-            if self.calculate(i, t, b) == self.calculate(i + 1, t, b):
-                i += 1
-            else:
-                logging.debug(f"Selected {i} with interest {self.interest[i]}, time {self.time[i]} and cost {self.cost[i]}")
-                print(f"    Selezionato {i} con interesse {self.interest[i]}, tempo {self.time[i]} e costo {self.cost[i]}")
-                cnt += 1
-                t -= self.time[i]
-                b -= self.cost[i]
-                i += 1
+        self.prepare(i, t, b)
+        if self.time_unit > 1 or self.budget_unit > 1:
+            guaranteed_time, guaranteed_budget = self.get_guarantee(i, t, b)
+            logging.debug(f"Approximated solution, at least as good as the best one with time {guaranteed_time} "
+                          f"and budget {guaranteed_budget}")
+            print(f"    Soluzione approssimata, buona almeno quanto la migliore con tempo {guaranteed_time} "
+                  f"e budget {guaranteed_budget}")
+        selected = self.select(i, t, b)
+        for j in selected:
+            logging.debug(f"Selected {j} with interest {self.interest[j]}, time {self.time[j]} and cost {self.cost[j]}")
+            print(f"    Selezionato {j} con interesse {self.interest[j]}, tempo {self.time[j]} e costo {self.cost[j]}")
         logging.debug("Solution calculated.")
-        return cnt
\ No newline at end of file
+        return len(selected)
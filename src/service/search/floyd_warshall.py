@@ -1,65 +1,39 @@
-import itertools
-import logging
+import numpy as np
 
+from src.model.prolog.node import node_registry
 from src.service.prolog.pyswip_client import PySwipClient
+from src.service.graph.compiled_graph import CompiledGraph
+from src.service.search.distance_matrix import DistanceMatrix
+from src.service.search.tour import best_path
 
 
 class FloydWarshall:
-    def __init__(self, prolog: PySwipClient):
+    def __init__(self, prolog: PySwipClient | CompiledGraph, dtype=np.float64):
+        """
+        :param prolog: The knowledge base to read the graph from
+        :param dtype: The type of the matrix, np.float32 halves the memory used
+        """
         self.prolog = prolog
+        self.dtype = dtype
         self.dist = self._create_matrix()
 
-    def _create_matrix(self) -> dict:
+    def _create_matrix(self) -> DistanceMatrix:
         nodes = self.prolog.ask_all_node()
-        self.dist = dict()
-        for node in nodes:
-            self.dist[node.id] = dict()
-            for node2 in nodes:
-                if node.id == node2.id:
-                    self.dist[node.id][node2.id] = 0
-                else:
-                    self.dist[node.id][node2.id] = float('inf')
-        for node in nodes:
-            for neighbour in self.prolog.ask_neighbours_of_node(node.id):
-                self.dist[node.id][neighbour.id] = self.prolog.get_distance_between_nodes(node.id, neighbour.id)
-        for k in nodes:
-            for i in nodes:
-                for j in nodes:
-                    self.dist[i.id][j.id] = min(self.dist[i.id][j.id], self.dist[i.id][k.id] + self.dist[k.id][j.id])
+        position = {node.id: i for i, node in enumerate(nodes)}
+        matrix = np.full((len(nodes), len(nodes)), np.inf, dtype=self.dtype)
+        np.fill_diagonal(matrix, 0)
+        for from_node_id, to_node_id, distance in self.prolog.ask_weighted_edges():
+            matrix[position[from_node_id], position[to_node_id]] = distance
+        # Relaxing every pair through k at once, row k and column k don't change while doing it
+        through_k = np.empty_like(matrix)
+        for k in range(len(nodes)):
+            np.add(matrix[:, k, np.newaxis], matrix[np.newaxis, k, :], out=through_k)
+            np.minimum(matrix, through_k, out=matrix)
+        self.dist = DistanceMatrix(matrix, node_registry.positions([node.key for node in nodes]))
         return self.dist
 
-    def best_path(self, nodes):
-        logging.debug("Calculating best path..")
-        start = nodes[0]
-        goals = nodes[1:]
-
-        perms = list(itertools.permutations(goals))
-
-        best = None
-        minimum = float('inf')
-        for perm in perms:
-            prev = start
-
-            path_cost = 0
-
-            for node in perm:
-                path_cost += self.dist[prev.id][node.id]
-                prev = node
-
-            path_cost += self.dist[prev.id][start.id]
-
-            if path_cost <= minimum:
-                minimum = path_cost
-                best = perm
-
-        best = list(best)
-        best.insert(0, start)
-        logging.debug("The best path is: " + str(best))
-        print("La strada migliore da seguire è: ")
-        for i in range(len(best)):
-            print(f"  Nodo {i+1}: {best[i]}")
-        logging.debug("Best path calculated.")
-        return best
+    def best_path(self, nodes, exact_limit: int = 12):
+        return best_path(nodes, self.dist, exact_limit)
 
     def get_lsdb(self):
         return self.dist
@@ -0,0 +1,129 @@
+class IndexedFrontierPQ:
+    """
+    A frontier of integer keys, as the indexes of the nodes, kept in a d-ary heap that holds each key at most once.
+    The position of each key in the heap is kept, so lowering the value of a key already in the frontier is
+    O(log n) and the frontier never holds more elements than there are keys.
+    The ties are broken as in FrontierPQ: the key added, or lowered, last comes first.
+    """
+
+    def __init__(self, arity: int = 4):
+        """
+        :param arity: The number of children of each element of the heap
+        """
+        self.arity = arity
+        self.frontier_index = 0  # the number of additions, used to break the ties
+        self.heap = []  # the keys, ordered as a heap
+        self.value = dict()  # key -> value, for the keys in the frontier
+        self.order = dict()  # key -> -frontier_index of its last addition
+        self.position = dict()  # key -> position in the heap
+        self.value_count = dict()  # value -> number of keys with that value
+        self.peak_size = 0  # the largest size reached by the frontier
+
+    def empty(self) -> bool:
+        """
+        :return: True if the frontier is empty
+        """
+        return not self.heap
+
+    def add(self, key: int, value: float) -> bool:
+        """
+        It adds the key to the frontier, or it lowers its value if the key is already in the frontier
+        :param key: The key to add
+        :param value: The value of the key
+        :return: True if the frontier has changed
+        """
+        if key in self.position:
+            if value >= self.value[key]:
+                return False
+            self._uncount(self.value[key])
+        else:
+            self.position[key] = len(self.heap)
+            self.heap.append(key)
+            self.peak_size = max(self.peak_size, len(self.heap))
+        self.frontier_index += 1
+        self.value[key] = value
+        self.order[key] = -self.frontier_index
+        self.value_count[value] = self.value_count.get(value, 0) + 1
+        self._sift_up(self.position[key])
+        return True
+
+    def pop(self) -> int:
+        """
+        It removes the key with the minimum value from the frontier
+        :return: The key removed
+        """
+        key = self.heap[0]
+        last = self.heap.pop()
+        if self.heap:
+            self.heap[0] = last
+            self.position[last] = 0
+            self._sift_down(0)
+        del self.position[key]
+        del self.order[key]
+        self._uncount(self.value.pop(key))
+        return key
+
+    def top_value(self) -> float:
+        """
+        :return: The minimum value of the frontier, inf if it's empty
+        """
+        return self.value[self.heap[0]] if self.heap else float('inf')
+
+    def count(self, value: float) -> int:
+        """
+        :param value: The value to look for
+        :return: The number of keys of the frontier with the given value
+        """
+        return self.value_count.get(value, 0)
+
+    def _uncount(self, value: float):
+        if self.value_count[value] == 1:
+            del self.value_count[value]
+        else:
+            self.value_count[value] -= 1
+
+    def _less(self, a: int, b: int) -> bool:
+        """
+        :return: True if the key a comes before the key b
+        """
+        return (self.value[a], self.order[a]) < (self.value[b], self.order[b])
+
+    def _sift_up(self, i: int):
+        heap, key = self.heap, self.heap[i]
+        while i > 0:
+            parent = (i - 1) // self.arity
+            if not self._less(key, heap[parent]):
+                break
+            heap[i] = heap[parent]
+            self.position[heap[i]] = i
+            i = parent
+        heap[i] = key
+        self.position[key] = i
+
+    def _sift_down(self, i: int):
+        heap, key = self.heap, self.heap[i]
+        size = len(heap)
+        while True:
+            first = self.arity * i + 1
+            if first >= size:
+                break
+            child = first
+            for c in range(first + 1, min(first + self.arity, size)):
+                if self._less(heap[c], heap[child]):
+                    child = c
+            if not self._less(heap[child], key):
+                break
+            heap[i] = heap[child]
+            self.position[heap[i]] = i
+            i = child
+        heap[i] = key
+        self.position[key] = i
+
+    def __repr__(self):
+        return str([(self.value[key], key) for key in self.heap])
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __iter__(self):
+        return iter(self.heap)
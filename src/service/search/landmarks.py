@@ -0,0 +1,105 @@
+import logging
+
+import numpy as np
+
+from src.service.graph.compiled_graph import CompiledGraph
+from src.service.search.dijkstra import dijkstra
+from src.service.search.distance_matrix import DistanceRow, position
+
+
+class LandmarkHeuristic:
+    """
+    The ALT heuristic: the exact distances from and to a few landmarks are stored, and by the triangle inequality
+    they give a lower bound of the distance between any two nodes. It needs O(L * V) memory instead of the O(V ^ 2)
+    of the complete matrix.
+    """
+
+    def __init__(self, graph: CompiledGraph, landmark_count: int = 8, dtype=np.float64):
+        """
+        :param graph: The graph to search
+        :param landmark_count: How many landmarks to use, more landmarks give tighter bounds
+        :param dtype: The type of the stored distances
+        """
+        self.graph = graph
+        self.index = graph.index_of_key
+        self.landmarks = []
+        self.from_landmark = np.empty((0, graph.node_count()), dtype=dtype)
+        self.to_landmark = np.empty((0, graph.node_count()), dtype=dtype)
+        self._select_landmarks(min(landmark_count, graph.node_count()))
+
+    def _select_landmarks(self, landmark_count: int):
+        """
+        It picks the landmarks one at a time, each one as far as possible from the ones already picked.
+        The landmarks are kept in the part of the graph reached from the best of a few starting nodes, so that they
+        are not wasted on small disconnected pieces of the map.
+        """
+        logging.debug(f'Selecting {landmark_count} landmarks..')
+        if landmark_count == 0:
+            return
+        reversed_graph = self.graph.reversed()
+        seeds = np.linspace(0, self.graph.node_count() - 1, num=min(self.graph.node_count(), 8), dtype=int)
+        rows = [dijkstra(self.graph, int(seed)) for seed in seeds]
+        # The first landmark is the farthest node from the seed that reaches the most nodes
+        farness = self._far_score(max(rows, key=lambda row: np.isfinite(row).sum())[np.newaxis, :])
+        for _ in range(landmark_count):
+            farness[self.landmarks] = -1
+            landmark = int(np.argmax(farness))
+            self.landmarks.append(landmark)
+            self.from_landmark = np.vstack([self.from_landmark, dijkstra(self.graph, landmark)])
+            self.to_landmark = np.vstack([self.to_landmark, dijkstra(reversed_graph, landmark)])
+            farness = self._far_score(self.from_landmark)
+        logging.debug(f'Landmarks selected: {[self.graph.node(i).id for i in self.landmarks]}')
+
+    @staticmethod
+    def _far_score(distances: np.ndarray) -> np.ndarray:
+        """
+        :param distances: The distances from each landmark, one row for each of them
+        :return: For each node, the distance from the nearest landmark. It's inf for the nodes that only some
+        landmarks reach, and -1 for the nodes that no landmark reaches.
+        """
+        reached = np.isfinite(distances)
+        score = np.where(reached.all(axis=0), distances.min(axis=0), np.inf)
+        return np.where(reached.any(axis=0), score, -1)
+
+    def lower_bounds_to(self, target: int) -> np.ndarray:
+        """
+        It computes the lower bound of the distance from every node to the target, for each landmark L:
+        d(v, t) >= d(L, t) - d(L, v) and d(v, t) >= d(v, L) - d(t, L)
+        :param target: The index of the node to reach
+        :return: The lower bounds, never negative
+        """
+        with np.errstate(invalid='ignore'):
+            forward = self.from_landmark[:, target, np.newaxis] - self.from_landmark
+            backward = self.to_landmark - self.to_landmark[:, target, np.newaxis]
+            # inf - inf means that the landmark doesn't tell anything about the pair
+            bounds = np.fmax(np.nan_to_num(forward, nan=0, posinf=np.inf, neginf=0),
+                             np.nan_to_num(backward, nan=0, posinf=np.inf, neginf=0))
+        return np.maximum(bounds.max(axis=0, initial=0), 0)
+
+    def lower_bounds_from(self, source: int) -> np.ndarray:
+        """
+        It computes the lower bound of the distance from the source to every node, for each landmark L:
+        d(s, v) >= d(L, v) - d(L, s) and d(s, v) >= d(s, L) - d(v, L)
+        :param source: The index of the starting node
+        :return: The lower bounds, never negative
+        """
+        with np.errstate(invalid='ignore'):
+            forward = self.from_landmark - self.from_landmark[:, source, np.newaxis]
+            backward = self.to_landmark[:, source, np.newaxis] - self.to_landmark
+            bounds = np.fmax(np.nan_to_num(forward, nan=0, posinf=np.inf, neginf=0),
+                             np.nan_to_num(backward, nan=0, posinf=np.inf, neginf=0))
+        return np.maximum(bounds.max(axis=0, initial=0), 0)
+
+    def __getitem__(self, key: int) -> DistanceRow:
+        """
+        :param key: The key of the starting node
+        :return: The lower bounds of the distances from the given node to every node, indexed by the node key
+        """
+        return DistanceRow(self.lower_bounds_from(position(self.index, key)), self.index)
+
+    def column(self, key: int) -> DistanceRow:
+        """
+        :param key: The key of the node to reach
+        :return: The lower bounds of the distances from every node to the given one, indexed by the node key
+        """
+        return DistanceRow(self.lower_bounds_to(position(self.index, key)), self.index)
@@ -0,0 +1,150 @@
+import logging
+
+from src.external_libs.searchMPP import SearcherMPP
+from src.external_libs.searchProblem import Path
+from src.model.prolog.node import Node, node_registry
+from src.service.graph.compiled_graph import CompiledGraph
+from src.service.pipeline.staged_executor import map_in_processes
+from src.service.search.bidirectional_searcher import SearcherBidirectional
+from src.service.search.contraction_hierarchies import ContractionHierarchies, SearcherCH
+from src.service.search.distance_oracle import DistanceOracle
+from src.service.search.my_search_problem import MySearchProblem
+from src.service.search.one_to_many import OneToManySearcher
+
+MIN_LEGS_PER_PROCESS = 4
+"""
+The legs, or the starting nodes of the legs, that each process has to search at least to make up for starting it
+"""
+
+MIN_EDGES_FOR_PROCESSES = 100000
+"""
+The edges of the smallest graph worth sending to other processes, on a smaller graph a leg is searched in less time
+than a process takes to start and receive the graph
+"""
+
+_worker_context = None
+"""
+The data shared by the legs searched in a process of the pool: estimates, knowledge base, hierarchies, bidirectional,
+or only the graph when the legs are routed from each source at once
+"""
+
+
+def make_searcher(problem: MySearchProblem, hierarchies: ContractionHierarchies | None,
+                  bidirectional: bool = False) -> SearcherMPP | SearcherCH | SearcherBidirectional:
+    """
+    It returns the searcher for a leg of the trip
+    :param problem: The problem to solve
+    :param hierarchies: The preprocessed graph, if None the search is done with SearcherMPP
+    :param bidirectional: If True, and there are no hierarchies, the search is done from both ends of the leg
+    :return: The searcher
+    """
+    if hierarchies is not None:
+        return SearcherCH(problem, hierarchies)
+    if bidirectional:
+        return SearcherBidirectional(problem)
+    return SearcherMPP(problem)
+
+
+def search_legs(tour: list[Node], estimates, knowledge_base, hierarchies: ContractionHierarchies | None = None,
+                bidirectional: bool = False, workers: int = 1, one_to_many: bool = False,
+                distances=None) -> list[Path | None]:
+    """
+    It searches the path of every leg of the round trip, from each node to the next one and from the last one back to
+    the first. The legs don't depend on each other, so with more workers, and a compiled graph that can be sent to
+    other processes, they are searched in parallel when the legs are enough and the graph is large enough to make up
+    for starting the processes. What each leg prints is printed in the order of the legs.
+    :param tour: The nodes in the order of visit
+    :param estimates: The distances, or their lower bounds, used by the heuristic
+    :param knowledge_base: The knowledge base to ask for the neighbours
+    :param hierarchies: The preprocessed graph, if any
+    :param bidirectional: If the legs are searched from both ends
+    :param workers: The number of processes
+    :param one_to_many: If True the legs are read from the shortest path trees of their starting nodes, in place of
+    a search for each leg, and it takes precedence over the hierarchies and the bidirectional search. The trees are
+    the ones already computed by the distance oracle for the tour, otherwise the legs leaving the same node are all
+    routed with a single sweep from it, if the knowledge base is a compiled graph.
+    :param distances: The distances used to order the tour, their trees are reused if it's a distance oracle
+    :return: The path of each leg, None if a leg can't be travelled
+    """
+    legs = [(tour[i], tour[(i + 1) % len(tour)]) for i in range(len(tour))]
+    if one_to_many:
+        if isinstance(distances, DistanceOracle) or isinstance(knowledge_base, CompiledGraph):
+            if hierarchies is not None or bidirectional:
+                logging.warning('The legs are routed one to many, the hierarchies and the bidirectional search are '
+                                'not used.')
+            return _route_legs(legs, knowledge_base, workers, distances)
+        logging.warning('The legs can be routed one to many only with a distance oracle or a compiled graph, '
+                        'they are searched one at a time.')
+    processes = _processes_worth_starting(workers, len(legs), knowledge_base)
+    if processes <= 1:
+        return [_search_leg(leg, estimates, knowledge_base, hierarchies, bidirectional) for leg in legs]
+    logging.debug(f'Searching {len(legs)} legs with {processes} processes..')
+    results = map_in_processes(_search_leg_in_worker, legs, processes, _init_worker,
+                               (node_registry, estimates, knowledge_base, hierarchies, bidirectional))
+    paths = []
+    for path, output in results:
+        print(output, end='')
+        paths.append(path)
+    return paths
+
+
+def _route_legs(legs: list[tuple[Node, Node]], graph: CompiledGraph, workers: int, distances) -> list[Path | None]:
+    """
+    It routes the legs grouped by their starting node: the paths are read from the trees of the distance oracle, that
+    ordering the tour has computed from every node already, or found with one sweep for each node
+    :param legs: The legs, as pairs of nodes
+    :param graph: The graph to search
+    :param workers: The number of processes
+    :param distances: The distances used to order the tour
+    :return: The path of each leg, None if a leg can't be travelled
+    """
+    targets = dict()  # source -> the nodes to reach from it, in the order of the legs
+    for source, target in legs:
+        targets.setdefault(source, []).append(target)
+    sources = list(targets.items())
+    processes = _processes_worth_starting(workers, len(sources), graph)
+    if isinstance(distances, DistanceOracle):
+        routed = [OneToManySearcher(distances.graph, source, to_nodes, distances.tree(source.key)).search()
+                  for source, to_nodes in sources]
+    elif processes <= 1:
+        routed = [OneToManySearcher(graph, source, to_nodes).search() for source, to_nodes in sources]
+    else:
+        logging.debug(f'Routing legs from {len(sources)} nodes with {processes} processes..')
+        routed = []
+        for paths, output in map_in_processes(_route_in_worker, sources, processes,
+                                              _init_worker, (node_registry, graph)):
+            print(output, end='')
+            routed.append(paths)
+    paths = {source: iter(source_paths) for (source, _), source_paths in zip(sources, routed)}
+    return [next(paths[source]) for source, _ in legs]
+
+
+def _processes_worth_starting(workers: int, tasks: int, knowledge_base) -> int:
+    """
+    :param workers: The number of processes allowed
+    :param tasks: The number of searches to share among the processes
+    :param knowledge_base: The knowledge base the searches ask for the neighbours
+    :return: How many processes are worth starting, 1 if the searches are better done in this process
+    """
+    if not isinstance(knowledge_base, CompiledGraph) or knowledge_base.edge_count() < MIN_EDGES_FOR_PROCESSES:
+        return 1
+    return max(1, min(workers, tasks // MIN_LEGS_PER_PROCESS))
+
+
+def _search_leg(leg: tuple[Node, Node], estimates, knowledge_base, hierarchies, bidirectional) -> Path | None:
+    problem = MySearchProblem(leg[0], leg[1], estimates, knowledge_base)
+    return make_searcher(problem, hierarchies, bidirectional).search()
+
+
+def _init_worker(registry, *context):
+    # The registry is restored in the process while it's received, before the structures indexed by its keys
+    global _worker_context
+    _worker_context = context
+
+
+def _search_leg_in_worker(leg: tuple[Node, Node]) -> Path | None:
+    return _search_leg(leg, *_worker_context)
+
+
+def _route_in_worker(source: tuple[Node, list[Node]]) -> list[Path | None]:
+    return OneToManySearcher(_worker_context[0], *source).search()
@@ -1,5 +1,9 @@
 from src.external_libs.searchProblem import Search_problem
 from src.service.prolog.pyswip_client import PySwipClient
+from src.service.graph.compiled_graph import CompiledGraph
+from src.service.search.distance_matrix import DistanceMatrix
+from src.service.search.distance_oracle import DistanceOracle
+from src.service.search.landmarks import LandmarkHeuristic
 from src.model.prolog.node import Node
 from src.external_libs.searchProblem import Arc
 import logging
@@ -10,12 +14,24 @@ class MySearchProblem(Search_problem):
     My specialized problem to solve with the implementation of knowledge base
     """
 
-    def __init__(self, from_node: Node, to_node: Node, dist: dict, pwswip_client: PySwipClient):
+    def __init__(self, from_node: Node, to_node: Node,
+                 dist: DistanceMatrix | DistanceOracle | LandmarkHeuristic | None,
+                 pwswip_client: PySwipClient | CompiledGraph):
+        """
+        :param from_node: The start node
+        :param to_node: The goal node
+        :param dist: The exact distances, or their lower bounds, used by the heuristic, if None the heuristic is 0
+        :param pwswip_client: The knowledge base to ask for the neighbours
+        """
         self.from_node = from_node
         self.to_node = to_node
         self.dist = dist
+        # Only the distances towards the goal are needed by the heuristic
+        self.dist_to_goal = dist.column(to_node.key) if dist is not None else None
+        self.dist_from_start = None  # Only needed when searching backwards, computed the first time
         self.pwsip_client = pwswip_client
         self.cache = dict()
+        self.reverse_cache = dict()
         logging.info(f"Problem to solve from {from_node.id} to {to_node.id}")
         print(f"Cerco il percorso da {from_node.id} a {to_node.id}")
 
@@ -27,21 +43,48 @@ class MySearchProblem(Search_problem):
 
     def neighbors(self, node):
         if node not in self.cache:
-            neighbors = self.pwsip_client.ask_neighbours_of_node(node.id)
-            neighbors = list(map(lambda n: self._make_arc(node, n), neighbors))
+            neighbors = self.pwsip_client.ask_weighted_neighbours_of_node(node.id)
+            neighbors = list(map(lambda n: self._make_arc(node, n[0], n[1]), neighbors))
             self.cache[node] = neighbors
         for w in self.cache[node]:
-            assert node.id != w.to_node.id, "Can't be same node"
+            assert node is not w.to_node, "Can't be same node"
         return self.cache[node]
 
+    def goal_node(self):
+        return self.to_node
+
+    def reverse_neighbors(self, node):
+        """
+        It returns the arcs that reach the given node, used to search backwards from the goal
+        :param node: The node reached
+        :return: The arcs from each predecessor to the node
+        """
+        if node not in self.reverse_cache:
+            predecessors = self.pwsip_client.ask_weighted_predecessors_of_node(node.id)
+            self.reverse_cache[node] = list(map(lambda n: self._make_arc(n[0], node, n[1]), predecessors))
+        return self.reverse_cache[node]
+
     def heuristic(self, n):
-        return self.dist[n.id][self.to_node.id]
+        if self.dist_to_goal is None:
+            return 0
+        return self.dist_to_goal[n.key]
+
+    def reverse_heuristic(self, n):
+        """
+        It estimates the cost from the start node to n, used to search backwards from the goal
+        """
+        if self.dist is None:
+            return 0
+        if self.dist_from_start is None:
+            self.dist_from_start = self.dist[self.from_node.key]
+        return self.dist_from_start[n.key]
 
-    def _make_arc(self, from_node: Node, to_node: Node) -> Arc:
+    def _make_arc(self, from_node: Node, to_node: Node, cost: float) -> Arc:
         """
         It creates an arc from the given nodes
         :param from_node:
-        :param edge: The edge with all the info
+        :param to_node:
+        :param cost: The cost of the edge between the nodes
         :return:
         """
-        return Arc(from_node, to_node, self.dist[from_node.id][to_node.id])
+        return Arc(from_node, to_node, cost)
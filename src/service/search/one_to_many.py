@@ -0,0 +1,120 @@
+import heapq
+import logging
+
+import numpy as np
+
+from src.external_libs.display import Displayable
+from src.external_libs.searchProblem import Arc, Path
+from src.model.prolog.node import Node
+from src.service.graph.compiled_graph import CompiledGraph
+
+
+class ShortestPathTree:
+    """
+    The shortest paths from a source found by a single Dijkstra sweep, kept as the edge that reaches each node.
+    The sweep stops as soon as all the targets are settled, so the tree only covers the nodes up to the farthest one.
+    Without targets every node is settled, and dist is the same row of distances computed by dijkstra.
+    """
+
+    def __init__(self, graph: CompiledGraph, source: int, targets=()):
+        """
+        :param graph: The graph to search
+        :param source: The index of the starting node
+        :param targets: The indexes of the nodes to reach, if empty every node that can be reached is settled
+        """
+        self.graph = graph
+        self.source = source
+        indptr, indices, weights = graph.adjacency_lists()
+        n = graph.node_count()
+        dist = [float('inf')] * n
+        parent = [-1] * n  # the node before each one on its shortest path
+        parent_edge = [-1] * n  # the edge that reaches each node on its shortest path
+        settled = [False] * n
+        remaining = set(targets)
+        dist[source] = 0.0
+        heap = [(0.0, source)]
+        self.num_settled = 0
+        while heap:
+            d, u = heapq.heappop(heap)
+            if settled[u]:
+                continue
+            settled[u] = True
+            self.num_settled += 1
+            remaining.discard(u)
+            if targets and not remaining:
+                break
+            for e in range(indptr[u], indptr[u + 1]):
+                v = indices[e]
+                new_d = d + weights[e]
+                if new_d < dist[v]:
+                    dist[v] = new_d
+                    parent[v] = u
+                    parent_edge[v] = e
+                    heapq.heappush(heap, (new_d, v))
+        # Kept as arrays, so that the trees can be cached as the rows of the distances
+        self.dist = np.array(dist, dtype=np.float64)
+        self.parent = np.array(parent, dtype=np.int32)
+        self.parent_edge = np.array(parent_edge, dtype=np.int64)
+        logging.debug(f'Shortest path tree from {graph.node(source).id} settled {self.num_settled} nodes.')
+
+    def path_to(self, target: int) -> Path | None:
+        """
+        :param target: The index of a node settled by the sweep
+        :return: The shortest path from the source to the node, None if it can't be reached
+        """
+        if self.dist[target] == float('inf'):
+            return None
+        edges = []
+        v = target
+        while v != self.source:
+            edges.append(int(self.parent_edge[v]))
+            v = int(self.parent[v])
+        _, indices, weights = self.graph.adjacency_lists()
+        path = Path(self.graph.node(self.source))
+        for e in reversed(edges):
+            path = Path(path, Arc(path.end(), self.graph.node(indices[e]), weights[e]))
+        return path
+
+
+class OneToManySearcher(Displayable):
+    """
+    A searcher that finds the paths from a node to many others with a single sweep of the graph, in place of a
+    SearcherMPP for each pair. The sweep is skipped when the tree from the node is already known.
+    """
+
+    def __init__(self, graph: CompiledGraph, from_node: Node, to_nodes: list[Node], tree: ShortestPathTree = None):
+        """
+        :param graph: The graph to search
+        :param from_node: The start node
+        :param to_nodes: The nodes to reach
+        :param tree: The shortest path tree from the start node, if it was already computed
+        """
+        self.graph = graph
+        self.from_node = from_node
+        self.to_nodes = to_nodes
+        self.tree = tree
+        self.num_expanded = 0
+        super().__init__()
+
+    def search(self) -> list[Path | None]:
+        """
+        :return: The path to each node to reach, in order, None for the nodes that can't be reached
+        """
+        self.display(1, f"Starting search from {self.from_node} to {len(self.to_nodes)} nodes")
+        targets = [self.graph.index_of_node(node) for node in self.to_nodes]
+        tree = self.tree
+        if tree is None:
+            tree = ShortestPathTree(self.graph, self.graph.index_of_node(self.from_node), targets)
+        self.num_expanded = tree.num_settled
+        paths = []
+        for node, target in zip(self.to_nodes, targets):
+            print(f"Cerco il percorso da {self.from_node.id} a {node.id}")
+            path = tree.path_to(target)
+            if path is None:
+                self.display(0, f"No (more) solutions. Total of {self.num_expanded} paths expanded.")
+            else:
+                self.display(1, f"Solution: {path} (cost: {path.cost})\n {self.num_expanded} nodes have been settled")
+                print(f"    Il percorso è: {path}")
+                print(f"    Sono stati esplorati {self.num_expanded} nodi.")
+            paths.append(path)
+        return paths
@@ -0,0 +1,178 @@
+import logging
+
+import numpy as np
+
+
+def best_path(nodes, dist, exact_limit: int = 12):
+    """
+    It reorders the nodes so that the round trip starting and ending in the first one is the shortest.
+    Up to exact_limit nodes to visit the order is the optimal one, found with the Held-Karp dynamic programming,
+    above it's built with the nearest neighbour and improved with 2-opt and Or-opt moves.
+    :param nodes: The nodes to visit, the first one is the start
+    :param dist: The distances between the nodes, dist[from_node.key][to_node.key]
+    :param exact_limit: The maximum number of nodes to visit, besides the start, to order exactly
+    :return: The nodes in the order to visit them, starting from the first one
+    """
+    logging.debug("Calculating best path..")
+    cost = np.array([[dist[a.key][b.key] for b in nodes] for a in nodes], dtype=np.float64).reshape(len(nodes),
+                                                                                                   len(nodes))
+    if len(nodes) - 1 <= exact_limit:
+        order = _held_karp(cost)
+    else:
+        order = _local_search(cost, _nearest_neighbour(cost))
+
+    best = [nodes[i] for i in order]
+    logging.debug("The best path is: " + str(best))
+    print("La strada migliore da seguire è: ")
+    for i in range(len(best)):
+        print(f"  Nodo {i+1}: {best[i]}")
+    logging.debug("Best path calculated.")
+    return best
+
+
+def _tour_cost(order: list[int], cost) -> float:
+    """
+    :param order: The positions of the nodes in the order of visit, starting from the start
+    :param cost: The matrix of the distances
+    :return: The cost of the round trip
+    """
+    return sum(cost[a][b] for a, b in zip(order, order[1:] + order[:1]))
+
+
+def _held_karp(cost: np.ndarray) -> list[int]:
+    """
+    The exact ordering with the dynamic programming on the subsets of the nodes to visit.
+    best[mask][j] is the cost of the shortest path that starts from the start, visits the nodes in mask and ends in j.
+    :param cost: The matrix of the distances, the start is the first node
+    :return: The positions of the nodes in the order of visit, starting from the start
+    """
+    n = len(cost) - 1
+    if n <= 1:
+        return list(range(len(cost)))
+    goals = cost[1:, 1:]
+    best = np.full((1 << n, n), np.inf)
+    parent = np.zeros((1 << n, n), dtype=np.int64)
+    bits = np.arange(n)
+    best[1 << bits, bits] = cost[0, 1:]
+    for mask in range(1, 1 << n):
+        ends = bits[(mask >> bits) & 1 == 1]
+        if len(ends) == 1:
+            continue
+        previous = mask ^ (1 << ends)
+        # candidates[r][i]: reaching ends[r] coming from i, after visiting the nodes in previous[r]
+        member = (previous[:, np.newaxis] >> bits) & 1 == 1
+        candidates = np.where(member, best[previous] + goals[:, ends].T, np.inf)
+        rows = np.arange(len(ends))
+        chosen = np.argmin(candidates, axis=1)
+        # When nothing is reachable the parent must still be one of the nodes in previous
+        unreachable = np.isinf(candidates[rows, chosen])
+        chosen[unreachable] = np.argmax(member[unreachable], axis=1)
+        parent[mask, ends] = chosen
+        best[mask, ends] = candidates[rows, chosen]
+
+    mask = (1 << n) - 1
+    last = int(np.argmin(best[mask] + cost[1:, 0]))
+    order = []
+    while mask:
+        order.append(last + 1)
+        mask, last = mask ^ (1 << last), int(parent[mask, last])
+    order.append(0)
+    return order[::-1]
+
+
+def _nearest_neighbour(cost: np.ndarray) -> list[int]:
+    """
+    It builds a tour moving each time to the closest node not visited yet
+    :param cost: The matrix of the distances, the start is the first node
+    :return: The positions of the nodes in the order of visit, starting from the start
+    """
+    order = [0]
+    left = set(range(1, len(cost)))
+    while left:
+        current = order[-1]
+        following = min(left, key=lambda j: cost[current][j])
+        order.append(following)
+        left.remove(following)
+    return order
+
+
+def _local_search(cost: np.ndarray, order: list[int]) -> list[int]:
+    """
+    It improves the tour until no 2-opt move (reversing a segment) or Or-opt move (moving a segment of up to three
+    nodes elsewhere) makes it shorter. The start is never moved.
+    The gain of a move is computed from the few edges it changes, and an improving move is applied at once, in place,
+    and the scan goes on from there on the new tour.
+    :param cost: The matrix of the distances, the start is the first node
+    :param order: The starting tour
+    :return: The improved tour
+    """
+    cost = cost.tolist()
+    order = list(order)
+    n = len(order)
+    improved = True
+    while improved:
+        improved = False
+        forward, backward = _prefix_costs(order, cost)
+        for i in range(1, n - 1):
+            for j in range(i + 1, n):
+                if _two_opt_gain(order, cost, forward, backward, i, j) < -1e-12:
+                    order[i:j + 1] = order[i:j + 1][::-1]
+                    forward, backward = _prefix_costs(order, cost)
+                    improved = True
+        for length in (1, 2, 3):
+            for i in range(1, n - length + 1):
+                for p in range(n):
+                    if i - 1 <= p <= i + length - 1:
+                        continue
+                    if _or_opt_gain(order, cost, i, length, p) < -1e-12:
+                        _move_segment(order, i, length, p)
+                        forward, backward = _prefix_costs(order, cost)
+                        improved = True
+                        # The segment isn't at i anymore, the scan goes on with the nodes now at i
+                        break
+    return order
+
+
+def _prefix_costs(order: list[int], cost: list[list[float]]) -> tuple[list[float], list[float]]:
+    """
+    :return: The cost of the tour up to each position, going forward and going each edge backward, so that the cost
+    of a segment in both directions is a difference of two values
+    """
+    forward, backward = [0.0], [0.0]
+    for a, b in zip(order, order[1:]):
+        forward.append(forward[-1] + cost[a][b])
+        backward.append(backward[-1] + cost[b][a])
+    return forward, backward
+
+
+def _two_opt_gain(order: list[int], cost: list[list[float]], forward: list[float], backward: list[float],
+                  i: int, j: int) -> float:
+    """
+    :return: How much the cost of the tour changes reversing the nodes from position i to j, both included.
+    The distances aren't symmetric, so the edges of the segment are taken in the other direction.
+    """
+    a, b, c, d = order[i - 1], order[i], order[j], order[(j + 1) % len(order)]
+    return (cost[a][c] + cost[b][d] + backward[j] - backward[i]
+            - cost[a][b] - cost[c][d] - forward[j] + forward[i])
+
+
+def _or_opt_gain(order: list[int], cost: list[list[float]], i: int, length: int, p: int) -> float:
+    """
+    :return: How much the cost of the tour changes moving the length nodes from position i between the nodes at
+    position p and p + 1, that are both outside the segment
+    """
+    n = len(order)
+    before, first, last, after = order[i - 1], order[i], order[i + length - 1], order[(i + length) % n]
+    x, y = order[p], order[(p + 1) % n]
+    return (cost[before][after] + cost[x][first] + cost[last][y]
+            - cost[before][first] - cost[last][after] - cost[x][y])
+
+
+def _move_segment(order: list[int], i: int, length: int, p: int):
+    """
+    It moves the length nodes from position i between the nodes at position p and p + 1, in place
+    """
+    segment = order[i:i + length]
+    del order[i:i + length]
+    at = p + 1 if p < i else p + 1 - length
+    order[at:at] = segment
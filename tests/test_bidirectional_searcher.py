@@ -0,0 +1,122 @@
+import contextlib
+import io
+import math
+import os
+import random
+import unittest
+
+from src.external_libs.searchProblem import Arc
+from src.service.data.osm_xml_parser import OSMXmlParser
+from src.service.graph.compiled_graph import CompiledGraph
+from src.service.search.bidirectional_searcher import SearcherBidirectional
+from src.service.search.dijkstra import dijkstra
+from src.service.search.landmarks import LandmarkHeuristic
+
+OSM_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'resources', 'open_street_map', 'molf.osm')
+
+
+class _Problem:
+    """
+    The methods of MySearchProblem used by SearcherBidirectional, on a compiled graph
+    """
+
+    def __init__(self, graph: CompiledGraph, from_node, to_node, estimates=None):
+        """
+        :param estimates: The landmark lower bounds, if None both heuristics are 0
+        """
+        self.graph = graph
+        self.from_node = from_node
+        self.to_node = to_node
+        self.estimates = estimates
+
+    def start_node(self):
+        return self.from_node
+
+    def goal_node(self):
+        return self.to_node
+
+    def neighbors(self, node):
+        return [Arc(node, to_node, cost) for to_node, cost in self.graph.ask_weighted_neighbours_of_node(node.id)]
+
+    def reverse_neighbors(self, node):
+        return [Arc(from_node, node, cost)
+                for from_node, cost in self.graph.ask_weighted_predecessors_of_node(node.id)]
+
+    def heuristic(self, node):
+        return 0 if self.estimates is None else self.estimates.column(self.to_node.key)[node.key]
+
+    def reverse_heuristic(self, node):
+        return 0 if self.estimates is None else self.estimates[self.from_node.key][node.key]
+
+
+def _arcs(path) -> list[Arc]:
+    """
+    :return: The arcs of the path, from the start
+    """
+    arcs = []
+    while path.arc is not None:
+        arcs.append(path.arc)
+        path = path.initial
+    return arcs[::-1]
+
+
+class TestSearcherBidirectional(unittest.TestCase):
+    """
+    The searches on the car graph of molf.osm against a plain Dijkstra, with zero and with landmark potentials
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        with open(OSM_DATA, 'r', encoding='utf-8') as file:
+            cls.graph = CompiledGraph.from_parsing_result(OSMXmlParser().parse_osm_xml(file, False), False)
+        cls.landmarks = LandmarkHeuristic(cls.graph, 8)
+
+    def _search(self, source: int, target: int, estimates):
+        problem = _Problem(self.graph, self.graph.node(source), self.graph.node(target), estimates)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return SearcherBidirectional(problem).search()
+
+    def _assert_shortest(self, source: int, target: int, dist):
+        for estimates in (None, self.landmarks):
+            path = self._search(source, target, estimates)
+            if math.isinf(dist[target]):
+                self.assertIsNone(path)
+                continue
+            self.assertAlmostEqual(path.cost, dist[target], places=6)
+            # The path joined by _build_path goes from the start to the goal along arcs that follow each other
+            arcs = _arcs(path)
+            self.assertIs(list(path.nodes())[-1], self.graph.node(source))
+            self.assertIs(path.end(), self.graph.node(target))
+            for arc, following in zip(arcs, arcs[1:]):
+                self.assertIs(arc.to_node, following.from_node)
+            if arcs:
+                self.assertIs(arcs[0].from_node, self.graph.node(source))
+            self.assertAlmostEqual(sum(arc.cost for arc in arcs), path.cost, places=6)
+
+    def test_random_pairs(self):
+        rng = random.Random(0)
+        n = self.graph.node_count()
+        for source in rng.sample(range(n), 15):
+            dist = dijkstra(self.graph, source)
+            for target in rng.sample(range(n), 15):
+                self._assert_shortest(source, target, dist)
+
+    def test_start_is_goal(self):
+        for estimates in (None, self.landmarks):
+            path = self._search(7, 7, estimates)
+            self.assertEqual(path.cost, 0)
+            self.assertIs(path.end(), self.graph.node(7))
+
+    def test_disconnected(self):
+        # The graph has one-way dead ends, so some nodes can't be reached from the others
+        for source in range(self.graph.node_count()):
+            dist = dijkstra(self.graph, source)
+            unreachable = [target for target, d in enumerate(dist) if math.isinf(d)]
+            if unreachable:
+                self._assert_shortest(source, unreachable[0], dist)
+                return
+        self.fail('Every pair of nodes is connected')
+
+
+if __name__ == '__main__':
+    unittest.main()
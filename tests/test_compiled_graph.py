@@ -0,0 +1,54 @@
+import os
+import unittest
+
+import numpy as np
+
+from src.service.data.osm_xml_parser import OSMXmlParser
+from src.service.graph.compiled_graph import CompiledGraph
+from src.service.search.one_to_many import ShortestPathTree
+
+OSM_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'resources', 'open_street_map', 'molf.osm')
+
+
+def _path_edges(tree: ShortestPathTree, target: int) -> list[int]:
+    """
+    :return: The edges of the path from the source of the tree to the target
+    """
+    edges = []
+    while target != tree.source:
+        edges.append(int(tree.parent_edge[target]))
+        target = int(tree.parent[target])
+    return edges
+
+
+class TestTravelTime(unittest.TestCase):
+    """
+    The fastest paths on the car graph of molf.osm against the shortest ones
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        with open(OSM_DATA, 'r', encoding='utf-8') as file:
+            cls.graph = CompiledGraph.from_parsing_result(OSMXmlParser().parse_osm_xml(file, False), False)
+        cls.by_time = cls.graph.by_travel_time()
+
+    def test_costs_are_the_travel_times(self):
+        _, _, weights = self.by_time.adjacency_lists()
+        self.assertEqual(weights, np.asarray(self.graph.travel_times).tolist())
+        self.assertTrue(np.all(np.asarray(self.graph.travel_times) > 0))
+
+    def test_fastest_paths(self):
+        metres, seconds = np.asarray(self.graph.weights), np.asarray(self.graph.travel_times)
+        for source in range(0, self.graph.node_count(), 16):
+            shortest, fastest = ShortestPathTree(self.graph, source), ShortestPathTree(self.by_time, source)
+            np.testing.assert_array_equal(np.isinf(shortest.dist), np.isinf(fastest.dist))
+            for target in np.flatnonzero(np.isfinite(shortest.dist)).tolist():
+                shortest_edges, fastest_edges = _path_edges(shortest, target), _path_edges(fastest, target)
+                # The fastest path takes no more time, and is no shorter, than the shortest one
+                self.assertAlmostEqual(fastest.dist[target], seconds[fastest_edges].sum(), places=6)
+                self.assertLessEqual(fastest.dist[target], seconds[shortest_edges].sum() + 1e-9)
+                self.assertGreaterEqual(metres[fastest_edges].sum(), shortest.dist[target] - 1e-9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import contextlib
+import io
+import math
+import os
+import random
+import unittest
+
+from src.service.data.osm_xml_parser import OSMXmlParser
+from src.service.graph.compiled_graph import CompiledGraph
+from src.service.search.contraction_hierarchies import ContractionHierarchies, SearcherCH
+from src.service.search.dijkstra import dijkstra
+
+OSM_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'resources', 'open_street_map', 'molf.osm')
+
+
+class _Problem:
+    """
+    The part of MySearchProblem used by SearcherCH
+    """
+
+    def __init__(self, from_node, to_node):
+        self.from_node = from_node
+        self.to_node = to_node
+
+    def start_node(self):
+        return self.from_node
+
+
+class TestContractionHierarchies(unittest.TestCase):
+    """
+    The queries on the contracted car graph of molf.osm against a plain Dijkstra
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        with open(OSM_DATA, 'r', encoding='utf-8') as file:
+            cls.graph = CompiledGraph.from_parsing_result(OSMXmlParser().parse_osm_xml(file, False), False)
+        cls.hierarchies = ContractionHierarchies(cls.graph)
+        indptr, indices, weights = cls.graph.adjacency_lists()
+        cls.edges = dict()  # (from, to) -> cost of the cheapest edge
+        for u in range(cls.graph.node_count()):
+            for e in range(indptr[u], indptr[u + 1]):
+                cls.edges[(u, indices[e])] = min(weights[e], cls.edges.get((u, indices[e]), math.inf))
+
+    def _assert_shortest(self, source: int, target: int, dist):
+        cost, path, _ = self.hierarchies.query(source, target)
+        if math.isinf(dist[target]):
+            self.assertTrue(math.isinf(cost))
+            self.assertEqual(path, [])
+            return
+        self.assertAlmostEqual(cost, dist[target], places=6)
+        # The unpacked path is made of edges of the graph, and it costs as much as the query says
+        self.assertEqual(path[0], source)
+        self.assertEqual(path[-1], target)
+        self.assertAlmostEqual(sum(self.edges[(u, v)] for u, v in zip(path, path[1:])), cost, places=6)
+
+    def test_random_pairs(self):
+        rng = random.Random(0)
+        n = self.graph.node_count()
+        for source in rng.sample(range(n), 20):
+            dist = dijkstra(self.graph, source)
+            for target in rng.sample(range(n), 20):
+                self._assert_shortest(source, target, dist)
+
+    def test_no_path(self):
+        # The graph has one-way dead ends, so some nodes can't be reached from the others
+        for source in range(self.graph.node_count()):
+            dist = dijkstra(self.graph, source)
+            unreachable = [target for target, d in enumerate(dist) if math.isinf(d)]
+            if unreachable:
+                self._assert_shortest(source, unreachable[0], dist)
+                return
+        self.fail('Every pair of nodes is connected')
+
+    def test_start_is_goal(self):
+        cost, path, _ = self.hierarchies.query(7, 7)
+        self.assertEqual(cost, 0)
+        self.assertEqual(path, [7])
+
+    def test_searcher(self):
+        rng = random.Random(2)
+        n = self.graph.node_count()
+        for source in rng.sample(range(n), 10):
+            dist = dijkstra(self.graph, source)
+            for target in [source] + rng.sample(range(n), 5):
+                problem = _Problem(self.graph.node(source), self.graph.node(target))
+                with contextlib.redirect_stdout(io.StringIO()):
+                    path = SearcherCH(problem, self.hierarchies).search()
+                if math.isinf(dist[target]):
+                    self.assertIsNone(path)
+                else:
+                    self.assertAlmostEqual(path.cost, dist[target], places=6)
+                    self.assertIs(path.end(), self.graph.node(target))
+
+
+if __name__ == '__main__':
+    unittest.main()
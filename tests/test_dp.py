@@ -0,0 +1,84 @@
+import contextlib
+import io
+import random
+import unittest
+from functools import lru_cache
+
+from src.service.search.dp import DynamicProgramming
+
+
+def _random_dp(rng: random.Random, n: int, epsilon: float = 0.0) -> DynamicProgramming:
+    dp = DynamicProgramming(n, epsilon)
+    dp.interest = [rng.randint(0, 100) for _ in range(n)]
+    dp.time = [rng.randint(30, 180) for _ in range(n)]
+    dp.cost = [rng.randint(0, 35) for _ in range(n)]
+    return dp
+
+
+def _recursive(dp: DynamicProgramming, i: int, t: int, b: int) -> tuple[int, list[int]]:
+    """
+    The recursive dp of the baseline, with its way of following the solution: an element is selected only if it's
+    strictly better to take it
+    :return: The best interest and the indexes of the selected elements
+    """
+    @lru_cache(maxsize=None)
+    def calculate(i, t, b):
+        if i == dp.n:
+            return 0
+        if dp.time[i] > t or dp.cost[i] > b:
+            return calculate(i + 1, t, b)
+        return max(calculate(i + 1, t, b), calculate(i + 1, t - dp.time[i], b - dp.cost[i]) + dp.interest[i])
+
+    best = calculate(i, t, b)
+    selected = []
+    while i < dp.n:
+        if calculate(i, t, b) != calculate(i + 1, t, b):
+            selected.append(i)
+            t -= dp.time[i]
+            b -= dp.cost[i]
+        i += 1
+    return best, selected
+
+
+class TestDynamicProgramming(unittest.TestCase):
+
+    def test_same_solution_as_the_recursive_dp(self):
+        rng = random.Random(0)
+        for _ in range(30):
+            dp = _random_dp(rng, rng.randint(0, 15))
+            i, t, b = rng.randint(0, dp.n), rng.randint(0, 600), rng.randint(0, 120)
+            best, selected = _recursive(dp, i, t, b)
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(dp.get_solution(i, t, b), len(selected))
+            self.assertEqual(dp.calculate(i, t, b), best)
+            self.assertEqual(dp.select(i, t, b), selected)
+
+    def test_answers_smaller_limits_from_the_same_table(self):
+        rng = random.Random(1)
+        dp = _random_dp(rng, 12)
+        queries = [(rng.randint(0, 500), rng.randint(0, 100)) for _ in range(20)]
+        answers = dp.answer_all(0, queries)
+        for (t, b), answer in zip(queries, answers):
+            self.assertEqual(answer, _recursive(dp, 0, t, b))
+
+    def test_approximation_within_the_guarantee(self):
+        rng = random.Random(2)
+        for epsilon in (0.1, 0.3, 0.5):
+            for _ in range(20):
+                dp = _random_dp(rng, rng.randint(1, 15), epsilon)
+                t, b = rng.randint(100, 800), rng.randint(20, 150)
+                value, selected = dp.calculate(0, t, b), dp.select(0, t, b)
+                # The solution is feasible, and its interest is the one of the elements selected
+                self.assertLessEqual(sum(dp.time[j] for j in selected), t)
+                self.assertLessEqual(sum(dp.cost[j] for j in selected), b)
+                self.assertEqual(value, sum(dp.interest[j] for j in selected))
+                # It's at least as good as the best one within the guaranteed limits, that lose at most epsilon
+                guaranteed_time, guaranteed_budget = dp.get_guarantee(0, t, b)
+                self.assertGreaterEqual(guaranteed_time, (1 - epsilon) * t - 1)
+                self.assertGreaterEqual(guaranteed_budget, (1 - epsilon) * b - 1)
+                self.assertGreaterEqual(value, _recursive(dp, 0, guaranteed_time, guaranteed_budget)[0])
+                self.assertLessEqual(value, _recursive(dp, 0, t, b)[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import random
+import unittest
+
+from src.service.search.indexed_frontier import IndexedFrontierPQ
+
+
+class TestIndexedFrontierPQ(unittest.TestCase):
+
+    def test_pops_in_order_of_value(self):
+        rng = random.Random(0)
+        for arity in (2, 4):
+            frontier = IndexedFrontierPQ(arity)
+            values = {key: rng.uniform(0, 100) for key in range(200)}
+            for key, value in values.items():
+                frontier.add(key, value)
+            popped = [frontier.pop() for _ in range(len(values))]
+            self.assertTrue(frontier.empty())
+            self.assertEqual([values[key] for key in popped], sorted(values.values()))
+
+    def test_decrease_key(self):
+        frontier = IndexedFrontierPQ()
+        for key, value in enumerate((5, 3, 8, 6)):
+            frontier.add(key, value)
+        self.assertTrue(frontier.add(2, 1))
+        # A higher or equal value leaves the key as it is
+        self.assertFalse(frontier.add(0, 9))
+        self.assertFalse(frontier.add(1, 3))
+        self.assertEqual(len(frontier), 4)
+        self.assertEqual(frontier.count(3), 1)
+        self.assertEqual(frontier.top_value(), 1)
+        self.assertEqual([frontier.pop() for _ in range(4)], [2, 1, 0, 3])
+        self.assertEqual(frontier.top_value(), float('inf'))
+        self.assertEqual(frontier.peak_size, 4)
+
+    def test_ties_pop_the_last_added_first(self):
+        frontier = IndexedFrontierPQ()
+        frontier.add(0, 2)
+        frontier.add(1, 2)
+        frontier.add(2, 3)
+        frontier.add(2, 2)
+        self.assertEqual(frontier.count(2), 3)
+        self.assertEqual([frontier.pop() for _ in range(3)], [2, 1, 0])
+
+    def test_random_operations(self):
+        rng = random.Random(1)
+        frontier = IndexedFrontierPQ(3)
+        values = dict()  # the keys in the frontier with their value
+        for _ in range(2000):
+            if values and rng.random() < 0.3:
+                smallest = min(values.values())
+                self.assertEqual(values.pop(frontier.pop()), smallest)
+            else:
+                key, value = rng.randrange(100), rng.randrange(50)
+                if value < values.get(key, float('inf')):
+                    values[key] = value
+                frontier.add(key, value)
+            self.assertEqual(len(frontier), len(values))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import unittest
+from xml.etree import ElementTree
+
+from src.model.osm.node import Node
+from src.service.data.osm_xml_parser import OSMXmlParser, ParsingResult
+
+OSM_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'resources', 'open_street_map', 'molf.osm')
+
+
+def _parse(on_foot: bool, streaming: bool) -> ParsingResult:
+    with open(OSM_DATA, 'r', encoding='utf-8') as file:
+        return OSMXmlParser().parse_osm_xml(file, on_foot, streaming)
+
+
+class TestStreamingParse(unittest.TestCase):
+    """
+    The streaming parse of molf.osm against the parse of the whole tree
+    """
+
+    def test_same_result(self):
+        for on_foot in (False, True):
+            expected, result = _parse(on_foot, False), _parse(on_foot, True)
+            self.assertTrue(expected.node_list)
+            self.assertNotIn(None, result.node_list)
+            self.assertEqual([(node.id_node, node.lat, node.lon, node.tag_proprieties.proprieties)
+                              for node in result.node_list],
+                             [(node.id_node, node.lat, node.lon, node.tag_proprieties.proprieties)
+                              for node in expected.node_list])
+            self.assertTrue(expected.way_list)
+            self.assertEqual([(way.id_way, way.node_list, way.tag_proprieties.proprieties) for way in result.way_list],
+                             [(way.id_way, way.node_list, way.tag_proprieties.proprieties)
+                              for way in expected.way_list])
+
+
+class TestNode(unittest.TestCase):
+
+    def test_coordinates(self):
+        element = ElementTree.fromstring('<node id="922748928" lat="41.2057967" lon="16.6005140">'
+                                         '<tag k="highway" v="crossing"/></node>')
+        node = Node.from_osm_xml_element(element)
+        self.assertEqual(node.id_node, 922748928)
+        self.assertEqual(node.lat, 41.2057967)
+        self.assertEqual(node.lon, 16.600514)
+
+
+if __name__ == '__main__':
+    unittest.main()
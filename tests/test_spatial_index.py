@@ -0,0 +1,66 @@
+import importlib.util
+import os
+import random
+import unittest
+
+from src.service.data.osm_xml_parser import OSMXmlParser
+from src.service.graph.compiled_graph import CompiledGraph
+
+OSM_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'resources', 'open_street_map', 'molf.osm')
+
+DEAD_END_POCKET = 'node304993942'
+"""
+A node whose one-way edge leads to node304993939, a dead end: their components have a single node
+"""
+
+
+class TestSnapping(unittest.TestCase):
+    """
+    The snapping of coordinates to the car graph of molf.osm, that has a largest strongly connected component of 129
+    nodes and many small pockets of one-way streets
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        with open(OSM_DATA, 'r', encoding='utf-8') as file:
+            cls.graph = CompiledGraph.from_parsing_result(OSMXmlParser().parse_osm_xml(file, False), False)
+
+    def _pocket(self) -> tuple[float, float]:
+        """
+        :return: The coordinates of the node in the dead end pocket
+        """
+        node = self.graph.node(self.graph.index_of(DEAD_END_POCKET))
+        return node.lat, node.lon
+
+    def _component_size(self, node) -> int:
+        components = self.graph.components()
+        return components.size(int(components.component_of[self.graph.index_of_node(node)]))
+
+    def test_closest_node_is_in_a_pocket(self):
+        node = self.graph.nearest_node(*self._pocket())
+        self.assertEqual(node.id, DEAD_END_POCKET)
+        self.assertEqual(self._component_size(node), 1)
+
+    def test_snaps_out_of_the_pocket(self):
+        node = self.graph.nearest_node(*self._pocket(), min_component_size=21)
+        self.assertGreaterEqual(self._component_size(node), 21)
+
+    def test_too_large_component(self):
+        with self.assertRaises(ValueError):
+            self.graph.nearest_node(*self._pocket(), min_component_size=self.graph.node_count() + 1)
+
+    @unittest.skipUnless(importlib.util.find_spec('pyswip'), 'main needs pyswip')
+    def test_select_nodes_from_coordinates(self):
+        from src.main import select_nodes
+        random.seed(0)
+        lat, lon = self.graph.lat, self.graph.lon
+        for _ in range(200):
+            coordinates = (random.uniform(float(lat.min()), float(lat.max())),
+                           random.uniform(float(lon.min()), float(lon.max())))
+            nodes = select_nodes(21, self.graph, coordinates)
+            self.assertEqual(len(set(nodes)), 21)
+            self.assertEqual(len({self._component_size(node) for node in nodes}), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import itertools
+import unittest
+
+import numpy as np
+
+from src.service.search.tour import best_path, _held_karp, _local_search, _nearest_neighbour, _tour_cost
+
+
+def _random_costs(rng: np.random.Generator, n: int, symmetric: bool) -> np.ndarray:
+    cost = rng.uniform(1, 100, (n, n))
+    if symmetric:
+        cost = (cost + cost.T) / 2
+    np.fill_diagonal(cost, 0)
+    return cost
+
+
+class _Node:
+
+    def __init__(self, key: int):
+        self.key = key
+
+
+def _moves(order: list[int]):
+    """
+    Every tour a 2-opt or an Or-opt move away from the given one, built from scratch
+    """
+    n = len(order)
+    for i in range(1, n - 1):
+        for j in range(i + 1, n):
+            yield order[:i] + order[i:j + 1][::-1] + order[j + 1:]
+    for length in (1, 2, 3):
+        for i in range(1, n - length + 1):
+            segment, rest = order[i:i + length], order[:i] + order[i + length:]
+            for j in range(1, len(rest) + 1):
+                yield rest[:j] + segment + rest[j:]
+
+
+class TestHeldKarp(unittest.TestCase):
+
+    def test_same_cost_as_brute_force(self):
+        rng = np.random.default_rng(0)
+        for n in range(1, 8):
+            for symmetric in (True, False):
+                cost = _random_costs(rng, n, symmetric)
+                order = _held_karp(cost)
+                self.assertEqual(order[0], 0)
+                self.assertEqual(sorted(order), list(range(n)))
+                best = min(_tour_cost([0] + list(rest), cost.tolist())
+                           for rest in itertools.permutations(range(1, n)))
+                self.assertAlmostEqual(_tour_cost(order, cost.tolist()), best)
+
+    def test_unreachable_nodes(self):
+        cost = _random_costs(np.random.default_rng(1), 5, False)
+        cost[:, 3] = np.inf
+        cost[3, 3] = 0
+        order = _held_karp(cost)
+        self.assertEqual(order[0], 0)
+        self.assertEqual(sorted(order), list(range(5)))
+
+    def test_best_path_starts_from_the_first_node(self):
+        cost = _random_costs(np.random.default_rng(2), 7, False)
+        nodes = [_Node(key) for key in (5, 2, 6, 0, 4, 1, 3)]
+        dist = {a.key: {b.key: cost[i][j] for j, b in enumerate(nodes)} for i, a in enumerate(nodes)}
+        tour = best_path(nodes, dist)
+        self.assertIs(tour[0], nodes[0])
+        self.assertEqual({node.key for node in tour}, {node.key for node in nodes})
+
+
+class TestLocalSearch(unittest.TestCase):
+
+    def test_no_move_improves_the_tour(self):
+        rng = np.random.default_rng(0)
+        for trial in range(40):
+            cost = _random_costs(rng, int(rng.integers(3, 20)), trial % 2 == 0)
+            start = _nearest_neighbour(cost)
+            order = _local_search(cost, start)
+            self.assertEqual(order[0], 0)
+            self.assertEqual(sorted(order), list(range(len(cost))))
+            current = _tour_cost(order, cost.tolist())
+            self.assertLessEqual(current, _tour_cost(start, cost.tolist()) + 1e-9)
+            for move in _moves(order):
+                self.assertGreaterEqual(_tour_cost(move, cost.tolist()), current - 1e-9)
+
+
+if __name__ == '__main__':
+    unittest.main()
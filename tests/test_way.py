@@ -0,0 +1,34 @@
+import math
+import unittest
+
+from src.model.osm.tag_proprieties import TagProprieties
+from src.model.osm.way import Way
+
+
+def _way(*max_speeds: str) -> Way:
+    tag_proprieties = TagProprieties()
+    for max_speed in max_speeds:
+        tag_proprieties.add_proprieties('maxspeed', max_speed)
+    return Way(1, [1, 2], tag_proprieties)
+
+
+class TestMaxSpeed(unittest.TestCase):
+
+    def test_numbers(self):
+        self.assertEqual(_way('30').get_max_speed(), 30)
+        self.assertEqual(_way('70 km/h').get_max_speed(), 70)
+
+    def test_mph(self):
+        self.assertTrue(math.isclose(_way('30 mph').get_max_speed(), 30 * 1.609344))
+
+    def test_default(self):
+        for max_speed in ('none', 'walk', 'IT:urban', 'signals', '0', ''):
+            self.assertEqual(_way(max_speed).get_max_speed(), Way.DEFAULT_MAX_SPEED, max_speed)
+        self.assertEqual(_way().get_max_speed(), Way.DEFAULT_MAX_SPEED)
+
+    def test_more_values(self):
+        self.assertEqual(_way('50', 'none', '30').get_max_speed(), 30)
+
+
+if __name__ == '__main__':
+    unittest.main()